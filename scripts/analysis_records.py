@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+UberFix Analysis Records
+سجلات مضغوطة لنتائج architecture_analyzer بدلاً من قاموس لكل ملف ولكل وظيفة
+
+- dataclass(slots=True): بلا __dict__ ولا تكرار للمفاتيح في كل سجل
+- المسارات ومصادر الاستيراد مُدمجة (sys.intern): نسخة واحدة لكل نص مكرر
+- الأنواع والأوصاف أرقام IntEnum؛ النص العربي يُبنى عند التصدير فقط
+
+to_dict() يعيد نفس شكل JSON السابق تماماً (architecture_data_*.json)، و from_dict()
+يعكسه (دمج النتائج الجزئية في analysis_shards.py).
+"""
+
+import sys
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Dict, List, Optional
+
+
+class FileType(IntEnum):
+    REACT_COMPONENT = 0
+    TYPESCRIPT = 1
+    JAVASCRIPT = 2
+    STYLESHEET = 3
+    CONFIG = 4
+    TEST = 5
+    OTHER = 6
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+class FunctionType(IntEnum):
+    REACT_COMPONENT = 0
+    FUNCTION = 1
+    ARROW_FUNCTION = 2
+    CUSTOM_HOOK = 3
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+class ImportType(IntEnum):
+    NAMED_IMPORT = 0
+    NAMESPACE_IMPORT = 1
+    DEFAULT_IMPORT = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+class ExportType(IntEnum):
+    NAMED_EXPORT = 0
+    FUNCTION_EXPORT = 1
+    DEFAULT_EXPORT = 2
+    MULTI_EXPORT = 3
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+CODE_FILE_TYPES = (FileType.REACT_COMPONENT, FileType.TYPESCRIPT, FileType.JAVASCRIPT)
+
+
+def intern(text: str) -> str:
+    return sys.intern(text)
+
+
+def function_description(name: str, func_type: FunctionType) -> str:
+    """وصف الوظيفة من نوعها واسمها (يُحسب عند التصدير بدلاً من تخزينه لكل وظيفة)"""
+    lowered = name.lower()
+    if func_type == FunctionType.REACT_COMPONENT:
+        return 'مكون React لعرض واجهة المستخدم'
+    if func_type == FunctionType.CUSTOM_HOOK and name.startswith('use'):
+        return f'Hook مخصص لإدارة حالة {name[3:]}'
+    if 'handler' in lowered:
+        return 'معالج الأحداث والتفاعلات'
+    if 'get' in lowered:
+        return 'وظيفة جلب البيانات'
+    if 'set' in lowered:
+        return 'وظيفة تعيين البيانات'
+    if 'update' in lowered:
+        return 'وظيفة تحديث البيانات'
+    if 'delete' in lowered:
+        return 'وظيفة حذف البيانات'
+    return 'وظيفة تنفيذية'
+
+
+@dataclass(slots=True)
+class FunctionRecord:
+    name: str
+    type: FunctionType
+    parameters: str
+    # نفس كائن النص في FileRecord.path (مُدمج)
+    file: str
+
+    @property
+    def description(self) -> str:
+        return function_description(self.name, self.type)
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'type': self.type.label,
+            'parameters': self.parameters,
+            'file': self.file,
+            'description': self.description,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, file: Optional[str] = None) -> 'FunctionRecord':
+        # إعادة استخدام نص المسار المُدمج للملف بدلاً من نسخة لكل وظيفة
+        path = file if file == data['file'] else intern(data['file'])
+        return cls(data['name'], FunctionType[data['type'].upper()], data['parameters'], path)
+
+
+@dataclass(slots=True)
+class ImportRecord:
+    type: ImportType
+    source: str
+    elements: str
+
+    def to_dict(self) -> Dict:
+        return {'type': self.type.label, 'source': self.source, 'elements': self.elements}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ImportRecord':
+        return cls(ImportType[data['type'].upper()], intern(data['source']), data['elements'])
+
+
+@dataclass(slots=True)
+class ExportRecord:
+    type: ExportType
+    elements: str
+
+    def to_dict(self) -> Dict:
+        return {'type': self.type.label, 'elements': self.elements}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ExportRecord':
+        return cls(ExportType[data['type'].upper()], data['elements'])
+
+
+@dataclass(slots=True)
+class FileRecord:
+    name: str
+    path: str
+    type: FileType
+    size: int
+    description: str
+    functions: List[FunctionRecord] = field(default_factory=list)
+    imports: List[ImportRecord] = field(default_factory=list)
+    exports: List[ExportRecord] = field(default_factory=list)
+    # None للملفات غير البرمجية (لم تكن هذه المفاتيح موجودة في القاموس القديم)
+    dependencies: Optional[List[str]] = None
+    lines_of_code: Optional[int] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        data = {
+            'name': self.name,
+            'path': self.path,
+            'type': self.type.label,
+            'size': self.size,
+            'functions': [f.to_dict() for f in self.functions],
+            'imports': [i.to_dict() for i in self.imports],
+            'exports': [e.to_dict() for e in self.exports],
+            'description': self.description,
+        }
+        if self.dependencies is not None:
+            data['dependencies'] = list(self.dependencies)
+            data['lines_of_code'] = self.lines_of_code
+        if self.error is not None:
+            data['error'] = self.error
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FileRecord':
+        path = intern(data['path'])
+        dependencies = data.get('dependencies')
+        return cls(
+            name=data['name'],
+            path=path,
+            type=FileType[data['type'].upper()],
+            size=data['size'],
+            description=data['description'],
+            functions=[FunctionRecord.from_dict(f, path) for f in data['functions']],
+            imports=[ImportRecord.from_dict(i) for i in data['imports']],
+            exports=[ExportRecord.from_dict(e) for e in data['exports']],
+            dependencies=None if dependencies is None else [intern(d) for d in dependencies],
+            lines_of_code=data.get('lines_of_code'),
+            error=data.get('error'),
+        )
+
+
+@dataclass(slots=True)
+class FolderRecord:
+    description: str
+    files: List[FileRecord] = field(default_factory=list)
+    subfolders: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            'type': 'directory',
+            'description': self.description,
+            'files': [f.to_dict() for f in self.files],
+            'subfolders': list(self.subfolders),
+        }
+
+
+@dataclass(slots=True)
+class FunctionNode:
+    """عقدة في رسم العلاقات: القوائم الفارغة لا تُنشأ إلا عند الحاجة"""
+
+    function: FunctionRecord
+    calls: Optional[List[str]] = None
+    called_by: Optional[List[str]] = None
+    dependencies: Optional[List[str]] = None
+
+    @property
+    def id(self) -> str:
+        return f"{self.function.file}::{self.function.name}"
+
+    def to_dict(self) -> Dict:
+        return {
+            'function': {'id': self.id, **self.function.to_dict()},
+            'calls': list(self.calls or ()),
+            'called_by': list(self.called_by or ()),
+            'dependencies': list(self.dependencies or ()),
+        }
+
+
+def export_structure(structure: Dict[str, FolderRecord]) -> Dict[str, Dict]:
+    return {folder: record.to_dict() for folder, record in structure.items()}
+
+
+def export_functions(graph: Dict[str, FunctionNode]) -> Dict[str, Dict]:
+    return {func_id: node.to_dict() for func_id, node in graph.items()}
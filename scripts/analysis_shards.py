@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+UberFix Analysis Shards
+تقسيم تحليل architecture_analyzer على عدة أجهزة (أو مهام CI) ودمج النتائج الجزئية
+
+- كل ملف ينتمي لشريحة ثابتة حسب hash مساره النسبي (crc32 % N): نفس التقسيم على كل جهاز
+- كل شريحة تمر على شجرة المشروع كاملة (أسماء فقط) وتحلل ملفات شريحتها فقط، وتحفظ
+  هيكل المشروع الكامل مع سجلات ملفاتها في ملف JSON جزئي
+- الدمج اتحاد سجلات الملفات حسب المسار: تجميعي وتبديلي، وتكرار الشريحة نفسها لا يغيّر
+  شيئاً (إعادة محاولة في CI)، فيمكن الدمج بأي ترتيب وعلى أي عدد من المراحل
+- عند اكتمال كل الشرائح يُعاد بناء file_structure بترتيب الهيكل فيطابق التحليل الكامل
+
+الاستخدام:
+    python3 scripts/architecture_analyzer.py --shard 0/4          # i = 0..3 على كل جهاز
+    python3 scripts/architecture_analyzer.py --merge a.json b.json --partial-out ab.json
+    python3 scripts/architecture_analyzer.py --merge reports/architecture_partial_*.json
+"""
+
+import json
+import zlib
+from functools import reduce
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from analysis_records import FileRecord, FolderRecord
+
+
+PARTIAL_FORMAT = 'uberfix-architecture-partial'
+PARTIAL_VERSION = 1
+
+
+class ShardMismatchError(ValueError):
+    """نتائج جزئية لا يمكن دمجها (تقسيم مختلف أو شجرة مشروع مختلفة أو شرائح ناقصة)"""
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """'i/N' ← (i, N) مع 0 <= i < N"""
+    try:
+        index, count = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise ValueError(f'invalid shard "{spec}" (expected i/N, e.g. 0/4)') from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f'invalid shard "{spec}" (need 0 <= i < N)')
+    return index, count
+
+
+def shard_of(relative_path: str, count: int) -> int:
+    return zlib.crc32(relative_path.encode('utf-8')) % count
+
+
+def file_key(folder: str, name: str) -> str:
+    """نفس مسار FileRecord.path لملف داخل مجلد من الهيكل"""
+    return name if folder == 'ROOT' else str(Path(folder) / name)
+
+
+def _canonical(skeleton: Dict[str, Dict]) -> Dict[str, Tuple]:
+    """الهيكل بدون ترتيب الإدراج (نفس النسخة على ext4 و tmpfs تُدرج الملفات بترتيب مختلف)"""
+    return {
+        folder: (entry['description'], sorted(entry['subfolders']), sorted(entry['files']))
+        for folder, entry in skeleton.items()
+    }
+
+
+class PartialResult:
+    """نتيجة شريحة أو أكثر: هيكل المشروع الكامل + سجلات ملفات الشرائح المحللة فقط"""
+
+    def __init__(
+        self,
+        shard_count: int,
+        shards: FrozenSet[int],
+        skeleton: Dict[str, Dict],
+        files: Dict[str, Dict],
+        project_root: str = '',
+    ):
+        self.shard_count = shard_count
+        self.shards = frozenset(shards)
+        # folder → {description, subfolders, files: [أسماء كل الملفات بترتيب المرور]}
+        self.skeleton = skeleton
+        # path → FileRecord.to_dict()
+        self.files = files
+        self.project_root = project_root
+
+    @classmethod
+    def from_structure(
+        cls,
+        project_root: Path,
+        shard: Tuple[int, int],
+        structure: Dict[str, FolderRecord],
+        inventory: Dict[str, List[str]],
+    ) -> 'PartialResult':
+        index, count = shard
+        skeleton = {
+            folder: {
+                'description': record.description,
+                'subfolders': list(record.subfolders),
+                'files': list(inventory.get(folder, ())),
+            }
+            for folder, record in structure.items()
+        }
+        files = {f.path: f.to_dict() for record in structure.values() for f in record.files}
+        return cls(count, frozenset([index]), skeleton, files, str(project_root))
+
+    @property
+    def complete(self) -> bool:
+        return self.shards == frozenset(range(self.shard_count))
+
+    @property
+    def missing(self) -> List[int]:
+        return sorted(set(range(self.shard_count)) - self.shards)
+
+    def merge(self, other: 'PartialResult') -> 'PartialResult':
+        """اتحاد نتيجتين من نفس التقسيم ونفس الشجرة (لا يعدّل أياً منهما)"""
+        if other.shard_count != self.shard_count:
+            raise ShardMismatchError(
+                f'cannot merge shards of {self.shard_count} with shards of {other.shard_count}'
+            )
+        if _canonical(other.skeleton) != _canonical(self.skeleton):
+            raise ShardMismatchError('partial results come from different project trees')
+        files = dict(self.files)
+        for path, data in other.files.items():
+            files.setdefault(path, data)
+        return PartialResult(self.shard_count, self.shards | other.shards, self.skeleton, files,
+                             self.project_root or other.project_root)
+
+    def structure(self) -> Dict[str, FolderRecord]:
+        """file_structure كاملة بسجلات مضغوطة وبنفس ترتيب التحليل غير المقسّم"""
+        if not self.complete:
+            raise ShardMismatchError(f'missing shards: {", ".join(map(str, self.missing))} of {self.shard_count}')
+        structure = {}
+        for folder, entry in self.skeleton.items():
+            record = FolderRecord(entry['description'], subfolders=list(entry['subfolders']))
+            for name in entry['files']:
+                record.files.append(FileRecord.from_dict(self.files[file_key(folder, name)]))
+            structure[folder] = record
+        return structure
+
+    def to_dict(self) -> Dict:
+        return {
+            'format': PARTIAL_FORMAT,
+            'version': PARTIAL_VERSION,
+            'project_root': self.project_root,
+            'shard_count': self.shard_count,
+            'shards': sorted(self.shards),
+            'skeleton': self.skeleton,
+            'files': self.files,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'PartialResult':
+        if data.get('format') != PARTIAL_FORMAT or data.get('version') != PARTIAL_VERSION:
+            raise ShardMismatchError(
+                f'not a {PARTIAL_FORMAT} v{PARTIAL_VERSION} file'
+            )
+        return cls(data['shard_count'], frozenset(data['shards']), data['skeleton'], data['files'],
+                   data.get('project_root', ''))
+
+    def save(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: Path) -> 'PartialResult':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def merge_all(partials: Iterable[PartialResult]) -> PartialResult:
+    return reduce(PartialResult.merge, partials)
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+UberFix Analysis Store
+حفظ نتائج التحليل المعماري في قاعدة SQLite مفهرسة للاستعلام السريع
+
+بدلاً من تحميل ملف architecture_data_*.json كاملاً للإجابة عن سؤال واحد:
+    python3 scripts/analysis_store.py importers src/lib/utils.ts
+    python3 scripts/analysis_store.py importers src/lib/utils.ts --transitive
+    python3 scripts/analysis_store.py largest --type react_component --limit 20
+    python3 scripts/analysis_store.py uses localStorage
+    python3 scripts/analysis_store.py symbol useAuth
+    python3 scripts/analysis_store.py stats
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from import_graph import ImportGraph
+
+
+DEFAULT_PROJECT_ROOT = Path("/opt/UberFix")
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    folder TEXT NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    lines_of_code INTEGER NOT NULL DEFAULT 0,
+    description TEXT
+);
+CREATE TABLE symbols (
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    parameters TEXT
+);
+CREATE TABLE imports (
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    source TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    elements TEXT,
+    target_id INTEGER REFERENCES files(id)
+);
+CREATE TABLE edges (
+    source_id INTEGER NOT NULL REFERENCES files(id),
+    target_id INTEGER NOT NULL REFERENCES files(id),
+    PRIMARY KEY (source_id, target_id)
+) WITHOUT ROWID;
+CREATE TABLE usages (
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    token TEXT NOT NULL
+);
+"""
+
+# تُنشأ الفهارس بعد الإدخال المجمّع (أسرع من تحديثها مع كل صف)
+INDEXES = """
+CREATE INDEX idx_files_type_size ON files(type, size DESC);
+CREATE INDEX idx_symbols_name ON symbols(name);
+CREATE INDEX idx_symbols_file ON symbols(file_id);
+CREATE INDEX idx_imports_source ON imports(source);
+CREATE INDEX idx_imports_target ON imports(target_id);
+CREATE INDEX idx_edges_target ON edges(target_id);
+CREATE INDEX idx_usages_token ON usages(token, file_id);
+"""
+
+
+class AnalysisStore:
+    """قاعدة SQLite لنتائج UberFixArchitectureAnalyzer"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def save(self, analysis_result: Dict, project_root: Path) -> Dict[str, int]:
+        """إعادة بناء القاعدة من analysis_result (سجلات analysis_records) في معاملة واحدة ثم استبدال الملف ذرياً"""
+        files, symbols, imports, usages = self._rows(analysis_result)
+        edges = self._resolve_imports(files, imports, project_root)
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.db_path.with_suffix(self.db_path.suffix + f".tmp{os.getpid()}")
+        if tmp.exists():
+            tmp.unlink()
+
+        conn = sqlite3.connect(tmp)
+        try:
+            # ملف مؤقت يُستبدل بعد الانتهاء، لذا لا حاجة لسجل المعاملات
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.executescript(SCHEMA)
+            with conn:
+                conn.executemany(
+                    "INSERT INTO meta VALUES (?, ?)",
+                    [
+                        ("schema_version", str(SCHEMA_VERSION)),
+                        ("project_root", str(project_root)),
+                        ("created_at", datetime.datetime.now().isoformat(timespec="seconds")),
+                    ],
+                )
+                conn.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", files)
+                conn.executemany("INSERT INTO symbols VALUES (?, ?, ?, ?)", symbols)
+                conn.executemany("INSERT INTO imports VALUES (?, ?, ?, ?, ?)", imports)
+                conn.executemany("INSERT OR IGNORE INTO edges VALUES (?, ?)", edges)
+                conn.executemany("INSERT INTO usages VALUES (?, ?)", usages)
+            conn.executescript(INDEXES)
+            conn.execute("ANALYZE")
+            conn.commit()
+        finally:
+            conn.close()
+
+        self.close()
+        os.replace(tmp, self.db_path)
+        return {
+            "files": len(files),
+            "symbols": len(symbols),
+            "imports": len(imports),
+            "edges": len(edges),
+            "usages": len(usages),
+        }
+
+    @staticmethod
+    def _rows(analysis_result: Dict) -> Tuple[List, List, List, List]:
+        files, symbols, imports, usages = [], [], [], []
+        file_id = 0
+        for folder, info in analysis_result.get("file_structure", {}).items():
+            for file_info in info.files:
+                file_id += 1
+                files.append(
+                    (
+                        file_id,
+                        Path(file_info.path).as_posix(),
+                        folder,
+                        file_info.name,
+                        file_info.type.label,
+                        file_info.size,
+                        file_info.lines_of_code or 0,
+                        file_info.description,
+                    )
+                )
+                for func in file_info.functions:
+                    symbols.append((file_id, func.name, func.type.label, func.parameters))
+                for export in file_info.exports:
+                    symbols.append((file_id, export.elements, export.type.label, None))
+                for imp in file_info.imports:
+                    imports.append([file_id, imp.source, imp.type.label, imp.elements, None])
+                for token in file_info.dependencies or ():
+                    usages.append((file_id, token))
+        return files, symbols, imports, usages
+
+    @staticmethod
+    def _resolve_imports(files: List, imports: List, project_root: Path) -> List[Tuple[int, int]]:
+        """ربط الاستيرادات المحلية بملفاتها (target_id) واستخراج الحواف بين الملفات"""
+        graph = ImportGraph(project_root)
+        ids = {row[1]: row[0] for row in files}
+        graph.files = set(ids)
+        paths = {row[0]: row[1] for row in files}
+
+        edges = []
+        for row in imports:
+            source = row[1]
+            if not source.startswith((".", "@/", "/")):
+                continue
+            target = graph.resolve(paths[row[0]], source)
+            if target:
+                row[4] = ids[target]
+                edges.append((row[0], ids[target]))
+        return edges
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if not self.db_path.exists():
+                raise FileNotFoundError(f"قاعدة التحليل غير موجودة: {self.db_path}")
+            self._conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def importers(self, path: str, transitive: bool = False) -> List[Tuple[str, int]]:
+        """الملفات التي تستورد path (مع العمق عند transitive)"""
+        if not transitive:
+            return self.conn.execute(
+                """
+                SELECT f.path, 1 FROM edges e
+                JOIN files t ON t.id = e.target_id
+                JOIN files f ON f.id = e.source_id
+                WHERE t.path = ?
+                ORDER BY f.path
+                """,
+                (path,),
+            ).fetchall()
+        return self.conn.execute(
+            """
+            WITH RECURSIVE up(id, depth) AS (
+                SELECT id, 0 FROM files WHERE path = ?
+                UNION
+                SELECT e.source_id, up.depth + 1 FROM edges e JOIN up ON e.target_id = up.id
+            )
+            SELECT f.path, MIN(up.depth) AS depth FROM up JOIN files f ON f.id = up.id
+            WHERE up.depth > 0
+            GROUP BY f.path
+            ORDER BY depth, f.path
+            """,
+            (path,),
+        ).fetchall()
+
+    def imports_of(self, path: str) -> List[Tuple[str, str, Optional[str]]]:
+        """ما يستورده ملف واحد (المصدر، النوع، الملف المحلول)"""
+        return self.conn.execute(
+            """
+            SELECT i.source, i.kind, t.path FROM imports i
+            JOIN files f ON f.id = i.file_id
+            LEFT JOIN files t ON t.id = i.target_id
+            WHERE f.path = ?
+            """,
+            (path,),
+        ).fetchall()
+
+    def largest(self, file_type: Optional[str] = None, limit: int = 20) -> List[Tuple[str, int, int]]:
+        """أكبر الملفات حجماً (react_component افتراضياً في CLI)"""
+        if file_type:
+            return self.conn.execute(
+                "SELECT path, size, lines_of_code FROM files WHERE type = ? ORDER BY size DESC LIMIT ?",
+                (file_type, limit),
+            ).fetchall()
+        return self.conn.execute(
+            "SELECT path, size, lines_of_code FROM files ORDER BY size DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+    def uses(self, token: str) -> List[Tuple[str, str]]:
+        """الملفات التي تستخدم localStorage / supabase / fetch ... (بحث بالبادئة)"""
+        return self.conn.execute(
+            """
+            SELECT DISTINCT f.path, u.token FROM usages u JOIN files f ON f.id = u.file_id
+            WHERE u.token >= ? AND u.token < ?
+            ORDER BY f.path
+            """,
+            (token, token + "\U0010ffff"),
+        ).fetchall()
+
+    def symbol(self, name: str) -> List[Tuple[str, str, str]]:
+        """أين عُرّفت أو صُدّرت دالة/مكون بهذا الاسم"""
+        return self.conn.execute(
+            """
+            SELECT f.path, s.name, s.kind FROM symbols s JOIN files f ON f.id = s.file_id
+            WHERE s.name = ?
+            ORDER BY f.path
+            """,
+            (name,),
+        ).fetchall()
+
+    def stats(self) -> Dict[str, str]:
+        result = dict(self.conn.execute("SELECT key, value FROM meta").fetchall())
+        for table in ("files", "symbols", "imports", "edges", "usages"):
+            result[table] = str(self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+        return result
+
+
+def _print_rows(rows: Iterable[Tuple], elapsed: float):
+    count = 0
+    for row in rows:
+        count += 1
+        print("  " + "  ".join("" if value is None else str(value) for value in row))
+    print(f"✅ {count} نتيجة في {elapsed * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UberFix analysis store queries")
+    parser.add_argument("--project-root", type=Path, default=DEFAULT_PROJECT_ROOT)
+    parser.add_argument("--db", type=Path, default=None, help="مسار القاعدة (الافتراضي: <root>/reports/architecture.db)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    importers = sub.add_parser("importers", help="من يستورد هذا الملف")
+    importers.add_argument("path")
+    importers.add_argument("--transitive", action="store_true", help="يتضمن المستوردين غير المباشرين")
+
+    imports = sub.add_parser("imports", help="ما يستورده هذا الملف")
+    imports.add_argument("path")
+
+    largest = sub.add_parser("largest", help="أكبر الملفات")
+    largest.add_argument("--type", default="react_component", help="نوع الملف (all لكل الأنواع)")
+    largest.add_argument("--limit", type=int, default=20)
+
+    uses = sub.add_parser("uses", help="الملفات التي تستخدم localStorage / supabase ...")
+    uses.add_argument("token")
+
+    symbol = sub.add_parser("symbol", help="أين عُرّف رمز")
+    symbol.add_argument("name")
+
+    sub.add_parser("stats", help="معلومات القاعدة")
+    args = parser.parse_args()
+
+    store = AnalysisStore(args.db or args.project_root / "reports" / "architecture.db")
+    started = time.perf_counter()
+    try:
+        if args.command == "importers":
+            rows = store.importers(args.path, args.transitive)
+        elif args.command == "imports":
+            rows = store.imports_of(args.path)
+        elif args.command == "largest":
+            rows = store.largest(None if args.type == "all" else args.type, args.limit)
+        elif args.command == "uses":
+            rows = store.uses(args.token)
+        elif args.command == "symbol":
+            rows = store.symbol(args.name)
+        else:
+            rows = sorted(store.stats().items())
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        print("💡 شغّل architecture_analyzer.py أولاً لإنشاء القاعدة")
+        sys.exit(1)
+    _print_rows(rows, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
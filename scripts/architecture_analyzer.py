@@ -6,22 +6,43 @@ UberFix Architecture Analyzer
 
 import os
 import re
+import sys
 import json
 import ast
+import argparse
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any
+from typing import Dict, List, Set, Tuple, Any, Optional
 from collections import defaultdict
 import datetime
 
+from analysis_records import (
+    CODE_FILE_TYPES, ExportRecord, ExportType, FileRecord, FileType, FolderRecord, FunctionNode,
+    FunctionRecord, FunctionType, ImportRecord, ImportType, export_functions, export_structure,
+    function_description, intern,
+)
+from analysis_shards import PartialResult, merge_all, parse_shard, shard_of
+from analysis_store import AnalysisStore
+import asset_audit
+import code_splitting
+import duplicate_code
+from perf_spans import Tracer
+from supabase_queries import SupabaseQueryIndex, report_lines as supabase_report_lines
+
 class UberFixArchitectureAnalyzer:
-    def __init__(self):
-        self.project_root = Path("/opt/UberFix")
+    def __init__(self, project_root: Optional[Path] = None, tracer: Optional[Tracer] = None):
+        self.project_root = Path(project_root or "/opt/UberFix")
+        # القياس اختياري ومعطّل افتراضياً
+        self.tracer = tracer or Tracer(enabled=False)
         self.analysis_result = {
             'project_info': {},
             'file_structure': {},
             'functions_analysis': {},
             'dependencies_graph': {},
             'components_relationships': {},
+            'code_splitting': {},
+            'duplicate_code': {},
+            'assets': {},
+            'supabase_queries': {},
             'architecture_issues': [],
             'recommendations': []
         }
@@ -49,6 +70,9 @@ class UberFixArchitectureAnalyzer:
             '.github': 'إعدادات GitHub Actions'
         }
         
+        # أسماء كل الملفات لكل مجلد بترتيب المرور (يشمل ملفات الشرائح الأخرى عند التقسيم)
+        self.inventory: Dict[str, List[str]] = {}
+        
         self.file_patterns = {
             'react_component': r'\.(tsx|jsx)$',
             'typescript': r'\.(ts|tsx)$',
@@ -57,16 +81,30 @@ class UberFixArchitectureAnalyzer:
             'config': r'\.(config\.(ts|js)|json)$',
             'test': r'\.(test|spec)\.(ts|tsx|js|jsx)$'
         }
+        self._file_type_patterns = [
+            (re.compile(pattern), FileType[pattern_type.upper()])
+            for pattern_type, pattern in self.file_patterns.items()
+        ]
 
-    def analyze_project_structure(self) -> Dict:
-        """تحليل هيكل المشروع بالكامل"""
-        print("🏗️  تحليل هيكل مشروع UberFix...")
+    def analyze_project_structure(self, shard: Optional[Tuple[int, int]] = None,
+                                  sources: Optional[Dict[Path, str]] = None) -> Dict[str, FolderRecord]:
+        """تحليل هيكل المشروع بالكامل (أو ملفات شريحة واحدة فقط: (i, N))
+
+        sources: محتوى ملفات مقروء مسبقاً (المسار ← النص) يُحلل بدون إعادة قراءتها.
+        """
+        if shard:
+            print(f"🏗️  تحليل هيكل مشروع UberFix (الشريحة {shard[0]}/{shard[1]})...")
+        else:
+            print("🏗️  تحليل هيكل مشروع UberFix...")
         
         structure = {}
+        self.inventory = {}
         
         for root, dirs, files in os.walk(self.project_root):
             # تجاهل المجلدات غير المرغوبة
-            dirs[:] = [d for d in dirs if d not in ['node_modules', 'dist', 'build', '.git', 'backups']]
+            dirs[:] = sorted(d for d in dirs if d not in ['node_modules', 'dist', 'build', '.git', 'backups', 'reports'])
+            # ترتيب ثابت لا يعتمد على نظام الملفات (شرائح من أجهزة مختلفة تُدمج معاً)
+            files = sorted(files)
             
             relative_path = Path(root).relative_to(self.project_root)
             if relative_path == Path('.'):
@@ -74,59 +112,57 @@ class UberFixArchitectureAnalyzer:
             else:
                 folder_key = str(relative_path)
             
-            structure[folder_key] = {
-                'type': 'directory',
-                'description': self.folder_descriptions.get(folder_key, ''),
-                'files': [],
-                'subfolders': []
-            }
+            folder = FolderRecord(self.folder_descriptions.get(folder_key, ''))
+            structure[folder_key] = folder
+            self.inventory[folder_key] = list(files)
             
             # تحليل الملفات
             for file in files:
                 file_path = Path(root) / file
-                file_info = self.analyze_file(file_path)
-                structure[folder_key]['files'].append(file_info)
+                relative_file = file_path.relative_to(self.project_root)
+                if shard and shard_of(str(relative_file), shard[1]) != shard[0]:
+                    continue
+                with self.tracer.file_span(relative_file):
+                    file_info = self.analyze_file(file_path, sources.get(file_path) if sources else None)
+                folder.files.append(file_info)
+                self.tracer.count('files_analyzed')
             
             # إضافة المجلدات الفرعية
-            for dir_name in dirs:
-                structure[folder_key]['subfolders'].append(dir_name)
+            folder.subfolders.extend(dirs)
         
         self.analysis_result['file_structure'] = structure
         return structure
 
-    def analyze_file(self, file_path: Path) -> Dict:
+    def analyze_file(self, file_path: Path, content: Optional[str] = None) -> FileRecord:
         """تحليل ملف مفصل"""
-        file_info = {
-            'name': file_path.name,
-            'path': str(file_path.relative_to(self.project_root)),
-            'type': self.detect_file_type(file_path),
-            'size': file_path.stat().st_size,
-            'functions': [],
-            'imports': [],
-            'exports': [],
-            'description': self.get_file_description(file_path)
-        }
+        relative_path = intern(str(file_path.relative_to(self.project_root)))
+        file_info = FileRecord(
+            name=file_path.name,
+            path=relative_path,
+            type=self.detect_file_type(file_path),
+            size=file_path.stat().st_size,
+            description=self.get_file_description(file_path, relative_path)
+        )
         
         # تحليل المحتوى بناءً على نوع الملف
-        if file_info['type'] in ['react_component', 'typescript', 'javascript']:
-            content_analysis = self.analyze_code_file(file_path)
-            file_info.update(content_analysis)
+        if file_info.type in CODE_FILE_TYPES:
+            self.analyze_code_file(file_path, file_info, content)
         
         return file_info
 
-    def detect_file_type(self, file_path: Path) -> str:
+    def detect_file_type(self, file_path: Path) -> FileType:
         """كشف نوع الملف"""
         name = file_path.name
         
-        for pattern_type, pattern in self.file_patterns.items():
-            if re.search(pattern, name):
-                return pattern_type
+        for pattern, file_type in self._file_type_patterns:
+            if pattern.search(name):
+                return file_type
         
-        return 'other'
+        return FileType.OTHER
 
-    def get_file_description(self, file_path: Path) -> str:
+    def get_file_description(self, file_path: Path, relative_path: Optional[str] = None) -> str:
         """الحصول على وصف الملف"""
-        relative_path = str(file_path.relative_to(self.project_root))
+        relative_path = relative_path or str(file_path.relative_to(self.project_root))
         name = file_path.name
         
         # وصف الملفات الرئيسية
@@ -161,46 +197,45 @@ class UberFixArchitectureAnalyzer:
         
         return file_descriptions.get(name, '')
 
-    def analyze_code_file(self, file_path: Path) -> Dict:
+    def analyze_code_file(self, file_path: Path, file_info: FileRecord, content: Optional[str] = None) -> FileRecord:
         """تحليل ملف الكود لاكتشاف الوظائف والواردات"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            analysis = {
-                'functions': self.extract_functions(content, file_path),
-                'imports': self.extract_imports(content),
-                'exports': self.extract_exports(content),
-                'dependencies': self.extract_dependencies(content),
-                'lines_of_code': len(content.splitlines())
-            }
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                self.tracer.count('bytes_read', len(content))
             
-            return analysis
+            file_info.functions = self.extract_functions(content, file_path, file_info.path)
+            file_info.imports = self.extract_imports(content)
+            file_info.exports = self.extract_exports(content)
+            file_info.dependencies = self.extract_dependencies(content)
+            file_info.lines_of_code = len(content.splitlines())
+            self.tracer.count('records_extracted', len(file_info.functions) + len(file_info.imports)
+                              + len(file_info.exports) + len(file_info.dependencies))
             
         except Exception as e:
-            return {
-                'functions': [],
-                'imports': [],
-                'exports': [],
-                'dependencies': [],
-                'lines_of_code': 0,
-                'error': str(e)
-            }
+            file_info.functions, file_info.imports, file_info.exports = [], [], []
+            file_info.dependencies = []
+            file_info.lines_of_code = 0
+            file_info.error = str(e)
+        
+        return file_info
 
-    def extract_functions(self, content: str, file_path: Path) -> List[Dict]:
+    def extract_functions(self, content: str, file_path: Path, relative_path: Optional[str] = None) -> List[FunctionRecord]:
         """استخراج الوظائف من الكود"""
         functions = []
+        relative_path = relative_path or intern(str(file_path.relative_to(self.project_root)))
         
         # أنماط التعرف على الوظائف
         patterns = [
             # React function components
-            (r'const\s+(\w+)\s*=\s*\(\s*(.*?)\s*\)\s*:\s*(\w+)\s*=>\s*{', 'react_component'),
-            (r'function\s+(\w+)\s*\(\s*(.*?)\s*\)\s*{', 'function'),
-            (r'export\s+const\s+(\w+)\s*=\s*\(\s*(.*?)\s*\)\s*=>\s*{', 'react_component'),
+            (r'const\s+(\w+)\s*=\s*\(\s*(.*?)\s*\)\s*:\s*(\w+)\s*=>\s*{', FunctionType.REACT_COMPONENT),
+            (r'function\s+(\w+)\s*\(\s*(.*?)\s*\)\s*{', FunctionType.FUNCTION),
+            (r'export\s+const\s+(\w+)\s*=\s*\(\s*(.*?)\s*\)\s*=>\s*{', FunctionType.REACT_COMPONENT),
             # Arrow functions
-            (r'const\s+(\w+)\s*=\s*\(\s*(.*?)\s*\)\s*=>\s*{', 'arrow_function'),
+            (r'const\s+(\w+)\s*=\s*\(\s*(.*?)\s*\)\s*=>\s*{', FunctionType.ARROW_FUNCTION),
             # Hook patterns
-            (r'const\s+use(\w+)\s*=\s*\(\s*(.*?)\s*\)\s*=>\s*{', 'custom_hook')
+            (r'const\s+use(\w+)\s*=\s*\(\s*(.*?)\s*\)\s*=>\s*{', FunctionType.CUSTOM_HOOK)
         ]
         
         for pattern, func_type in patterns:
@@ -209,79 +244,51 @@ class UberFixArchitectureAnalyzer:
                 func_name = match.group(1)
                 params = match.group(2) if len(match.groups()) > 1 else ''
                 
-                functions.append({
-                    'name': func_name,
-                    'type': func_type,
-                    'parameters': params,
-                    'file': str(file_path.relative_to(self.project_root)),
-                    'description': self.get_function_description(func_name, func_type, file_path)
-                })
+                # الوصف يُشتق من النوع والاسم عند التصدير (FunctionRecord.description)
+                functions.append(FunctionRecord(func_name, func_type, params, relative_path))
         
         return functions
 
-    def get_function_description(self, func_name: str, func_type: str, file_path: Path) -> str:
+    def get_function_description(self, func_name: str, func_type: FunctionType, file_path: Path) -> str:
         """الحصول على وصف الوظيفة"""
-        relative_path = str(file_path.relative_to(self.project_root))
-        
-        # أوصاف بناءً على النمط
-        if func_type == 'react_component':
-            return f'مكون React لعرض واجهة المستخدم'
-        elif func_type == 'custom_hook' and func_name.startswith('use'):
-            hook_name = func_name[3:]  # إزالة use
-            return f'Hook مخصص لإدارة حالة {hook_name}'
-        elif 'handler' in func_name.lower():
-            return 'معالج الأحداث والتفاعلات'
-        elif 'get' in func_name.lower():
-            return 'وظيفة جلب البيانات'
-        elif 'set' in func_name.lower():
-            return 'وظيفة تعيين البيانات'
-        elif 'update' in func_name.lower():
-            return 'وظيفة تحديث البيانات'
-        elif 'delete' in func_name.lower():
-            return 'وظيفة حذف البيانات'
-        
-        return 'وظيفة تنفيذية'
+        return function_description(func_name, FunctionType(func_type))
 
-    def extract_imports(self, content: str) -> List[Dict]:
+    def extract_imports(self, content: str) -> List[ImportRecord]:
         """استخراج الواردات من الكود"""
         imports = []
         
         # أنماط الاستيراد
         patterns = [
-            (r'import\s+(.*?)\s+from\s+[\'"](.*?)[\'"]', 'named_import'),
-            (r'import\s+\*\s+as\s+(\w+)\s+from\s+[\'"](.*?)[\'"]', 'namespace_import'),
-            (r'import\s+[\'"](.*?)[\'"]', 'default_import')
+            (r'import\s+(.*?)\s+from\s+[\'"](.*?)[\'"]', ImportType.NAMED_IMPORT),
+            (r'import\s+\*\s+as\s+(\w+)\s+from\s+[\'"](.*?)[\'"]', ImportType.NAMESPACE_IMPORT),
+            (r'import\s+[\'"](.*?)[\'"]', ImportType.DEFAULT_IMPORT)
         ]
         
         for pattern, import_type in patterns:
             matches = re.finditer(pattern, content)
             for match in matches:
-                imports.append({
-                    'type': import_type,
-                    'source': match.group(2) if len(match.groups()) > 1 else match.group(1),
-                    'elements': match.group(1) if import_type == 'named_import' else ''
-                })
+                # مصادر الاستيراد تتكرر بكثرة ('react'، '@/integrations/...')
+                source = intern(match.group(2) if len(match.groups()) > 1 else match.group(1))
+                elements = match.group(1) if import_type == ImportType.NAMED_IMPORT else ''
+                imports.append(ImportRecord(import_type, source, elements))
         
         return imports
 
-    def extract_exports(self, content: str) -> List[Dict]:
+    def extract_exports(self, content: str) -> List[ExportRecord]:
         """استخراج الصادرات من الكود"""
         exports = []
         
         patterns = [
-            (r'export\s+const\s+(\w+)', 'named_export'),
-            (r'export\s+function\s+(\w+)', 'function_export'),
-            (r'export\s+default\s+(\w+)', 'default_export'),
-            (r'export\s+{\s*(.*?)\s*}', 'multi_export')
+            (r'export\s+const\s+(\w+)', ExportType.NAMED_EXPORT),
+            (r'export\s+function\s+(\w+)', ExportType.FUNCTION_EXPORT),
+            (r'export\s+default\s+(\w+)', ExportType.DEFAULT_EXPORT),
+            (r'export\s+{\s*(.*?)\s*}', ExportType.MULTI_EXPORT)
         ]
         
         for pattern, export_type in patterns:
             matches = re.finditer(pattern, content)
             for match in matches:
-                exports.append({
-                    'type': export_type,
-                    'elements': match.group(1)
-                })
+                exports.append(ExportRecord(export_type, match.group(1)))
         
         return exports
 
@@ -302,40 +309,75 @@ class UberFixArchitectureAnalyzer:
         for pattern in lib_patterns:
             matches = re.finditer(pattern, content)
             for match in matches:
-                dependencies.add(match.group(0))
+                dependencies.add(intern(match.group(0)))
         
         return list(dependencies)
 
+    def analyze_shard(self, index: int, count: int) -> PartialResult:
+        """تحليل ملفات شريحة واحدة فقط إلى نتيجة جزئية قابلة للدمج (analysis_shards.py)"""
+        structure = self.analyze_project_structure(shard=(index, count))
+        return PartialResult.from_structure(self.project_root, (index, count), structure, self.inventory)
+
+    def load_partial(self, partial: PartialResult) -> Dict[str, FolderRecord]:
+        """استخدام نتيجة شرائح مدمجة ومكتملة بدلاً من تحليل الهيكل محلياً"""
+        print(f"🧩 دمج {partial.shard_count} شريحة ({len(partial.files)} ملف)...")
+        
+        structure = partial.structure()
+        self.analysis_result['file_structure'] = structure
+        return structure
+
     def analyze_function_relationships(self):
         """تحليل العلاقات بين الوظائف"""
         print("🔗 تحليل العلاقات بين الوظائف...")
         
-        functions_graph = {}
-        all_functions = []
+        functions_graph: Dict[str, FunctionNode] = {}
         
-        # جمع كل الوظائف من جميع الملفات
+        # جمع كل الوظائف من جميع الملفات (العقدة تشير إلى السجل نفسه بدون نسخه)
         for folder, info in self.analysis_result['file_structure'].items():
-            for file_info in info['files']:
-                if 'functions' in file_info:
-                    for func in file_info['functions']:
-                        func_id = f"{file_info['path']}::{func['name']}"
-                        all_functions.append({
-                            'id': func_id,
-                            **func
-                        })
-        
-        # تحليل العلاقات
-        for func in all_functions:
-            func_id = func['id']
-            functions_graph[func_id] = {
-                'function': func,
-                'calls': [],
-                'called_by': [],
-                'dependencies': []
-            }
+            for file_info in info.files:
+                for func in file_info.functions:
+                    node = FunctionNode(func)
+                    functions_graph[node.id] = node
         
         self.analysis_result['functions_analysis'] = functions_graph
 
+    def analyze_code_splitting(self) -> Dict:
+        """كشف الصفحات والمكونات الثقيلة المحمّلة بشكل ثابت (مرشحات React.lazy)"""
+        print("✂️  تحليل تقسيم الكود في src/pages و src/routes...")
+        
+        result = code_splitting.analyze_project(self.project_root)
+        self.analysis_result['code_splitting'] = result
+        return result
+
+    def analyze_duplicate_code(self) -> Dict:
+        """كشف الأجزاء المنسوخة بين ملفات src/ (بصمات winnowing)"""
+        print("🧬 كشف الكود المكرر في src/...")
+        
+        result = duplicate_code.analyze_project(self.project_root)
+        self.analysis_result['duplicate_code'] = result
+        return result
+
+    def analyze_assets(self) -> Dict:
+        """تدقيق الملفات الثابتة (public/ و icon/) بالأحجام المسجلة في هيكل المشروع"""
+        print("🖼️  تدقيق الملفات الثابتة في public/ و icon/...")
+        
+        sizes = {
+            f.path.replace(os.sep, '/'): f.size
+            for folder in self.analysis_result['file_structure'].values()
+            for f in folder.files
+        }
+        result = asset_audit.analyze_project(self.project_root, sizes=sizes)
+        self.analysis_result['assets'] = result
+        return result
+
+    def analyze_supabase_queries(self) -> Dict:
+        """فهرس استعلامات Supabase مع كشف الاستعلامات داخل الحلقات والمكررة"""
+        print("🗄️  فهرسة استعلامات Supabase...")
+        
+        result = SupabaseQueryIndex(self.project_root).build().to_dict()
+        self.analysis_result['supabase_queries'] = result
+        return result
+
     def generate_architecture_report(self) -> str:
         """توليد تقرير معماري مفصل"""
         report = [
@@ -356,9 +398,9 @@ class UberFixArchitectureAnalyzer:
         total_functions = 0
         
         for folder, info in self.analysis_result['file_structure'].items():
-            total_files += len(info['files'])
-            for file_info in info['files']:
-                total_functions += len(file_info.get('functions', []))
+            total_files += len(info.files)
+            for file_info in info.files:
+                total_functions += len(file_info.functions)
         
         report.extend([
             f"📁 إجمالي الملفات: {total_files}",
@@ -381,26 +423,61 @@ class UberFixArchitectureAnalyzer:
             else:
                 report.append(f"{indent}📁 {folder}")
             
-            if info['description']:
-                report.append(f"{indent}  📝 {info['description']}")
+            if info.description:
+                report.append(f"{indent}  📝 {info.description}")
             
-            for file_info in info['files']:
+            for file_info in info.files:
                 file_indent = "  " * (folder.count('/') + 2)
-                file_icon = "📄" if file_info['type'] == 'other' else "⚛️" if file_info['type'] == 'react_component' else "📜"
-                report.append(f"{file_indent}{file_icon} {file_info['name']}")
+                file_icon = "📄" if file_info.type == FileType.OTHER else "⚛️" if file_info.type == FileType.REACT_COMPONENT else "📜"
+                report.append(f"{file_indent}{file_icon} {file_info.name}")
                 
-                if file_info['description']:
-                    report.append(f"{file_indent}  📝 {file_info['description']}")
+                if file_info.description:
+                    report.append(f"{file_indent}  📝 {file_info.description}")
                 
                 # عرض الوظائف إذا وجدت
-                if file_info.get('functions'):
-                    for func in file_info['functions']:
-                        func_indent = "  " * (folder.count('/') + 3)
-                        func_icon = "🔧" if func['type'] == 'function' else "⚡" if func['type'] == 'react_component' else "🎣"
-                        report.append(f"{func_indent}{func_icon} {func['name']} - {func['description']}")
+                for func in file_info.functions:
+                    func_indent = "  " * (folder.count('/') + 3)
+                    func_icon = "🔧" if func.type == FunctionType.FUNCTION else "⚡" if func.type == FunctionType.REACT_COMPONENT else "🎣"
+                    report.append(f"{func_indent}{func_icon} {func.name} - {func.description}")
             
             report.append("")
         
+        # تقسيم الكود
+        if self.analysis_result['code_splitting']:
+            report.extend([
+                "✂️  تقسيم الكود (React.lazy):",
+                "-" * 40
+            ])
+            report.extend(code_splitting.report_lines(self.analysis_result['code_splitting']))
+            report.append("")
+        
+        # الكود المكرر
+        if self.analysis_result['duplicate_code']:
+            report.extend([
+                "🧬 الكود المكرر:",
+                "-" * 40
+            ])
+            report.extend(duplicate_code.report_lines(self.analysis_result['duplicate_code']))
+            report.append("")
+        
+        # الملفات الثابتة
+        if self.analysis_result['assets']:
+            report.extend([
+                "🖼️  الملفات الثابتة:",
+                "-" * 40
+            ])
+            report.extend(asset_audit.report_lines(self.analysis_result['assets']))
+            report.append("")
+        
+        # استعلامات Supabase
+        if self.analysis_result['supabase_queries']:
+            report.extend([
+                "🗄️  استعلامات Supabase:",
+                "-" * 40
+            ])
+            report.extend(supabase_report_lines(self.analysis_result['supabase_queries']))
+            report.append("")
+        
         # التوصيات
         report.extend([
             "💡 التوصيات المعمارية:",
@@ -420,6 +497,11 @@ class UberFixArchitectureAnalyzer:
         for rec in recommendations:
             report.append(f"  {rec}")
         
+        timings = self.tracer.summary_lines()
+        if timings:
+            report.extend(["", "-" * 40])
+            report.extend(timings)
+        
         report.extend([
             "",
             "=" * 80,
@@ -429,42 +511,100 @@ class UberFixArchitectureAnalyzer:
         
         return '\n'.join(report)
 
+    def export_dict(self) -> Dict[str, Any]:
+        """نسخة قواميس من النتائج (السجلات المضغوطة تُحوّل هنا فقط)"""
+        result = dict(self.analysis_result)
+        result['file_structure'] = export_structure(result['file_structure'])
+        result['functions_analysis'] = export_functions(result['functions_analysis'])
+        return result
+
     def export_to_json(self, output_path: Path):
         """تصدير النتائج إلى JSON"""
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.analysis_result, f, ensure_ascii=False, indent=2)
+            json.dump(self.export_dict(), f, ensure_ascii=False, indent=2)
+
+    def export_to_db(self, db_path: Path) -> Dict[str, int]:
+        """حفظ النتائج في قاعدة SQLite مفهرسة (انظر analysis_store.py)"""
+        return AnalysisStore(db_path).save(self.analysis_result, self.project_root)
+
+    def run_shard(self, index: int, count: int, output_path: Optional[Path] = None) -> Path:
+        """تحليل شريحة واحدة وحفظ نتيجتها الجزئية (بدون تقرير)"""
+        with self.tracer.span('structure', shard=index, shards=count):
+            partial = self.analyze_shard(index, count)
+        
+        output_path = output_path or self.project_root / "reports" / f"architecture_partial_{index}of{count}.json"
+        with self.tracer.span('export'):
+            partial.save(output_path)
+        
+        print(f"🧩 الشريحة {index}/{count}: {len(partial.files)} ملف → {output_path}")
+        return output_path
 
-    def run_complete_analysis(self):
-        """تشغيل التحليل الكامل"""
+    def run_complete_analysis(
+        self,
+        trace_path: Optional[Path] = None,
+        db_path: Optional[Path] = None,
+        partial: Optional[PartialResult] = None,
+    ):
+        """تشغيل التحليل الكامل (أو إكماله من نتيجة شرائح مدمجة)"""
         print("🚀 بدء التحليل المعماري الشامل لـ UberFix...")
         print("=" * 60)
         
-        # 1. تحليل الهيكل
-        self.analyze_project_structure()
+        # 1. تحليل الهيكل (أو أخذه من الشرائح؛ التحليلات التالية تحتاج المشروع كاملاً فتُنفّذ هنا)
+        with self.tracer.span('structure'):
+            if partial is not None:
+                self.load_partial(partial)
+            else:
+                self.analyze_project_structure()
         
         # 2. تحليل العلاقات
-        self.analyze_function_relationships()
+        with self.tracer.span('relationships'):
+            self.analyze_function_relationships()
         
-        # 3. توليد التقرير
-        report = self.generate_architecture_report()
+        # 3. مرشحات تقسيم الكود
+        with self.tracer.span('code_splitting'):
+            self.analyze_code_splitting()
+        
+        # 4. الكود المكرر
+        with self.tracer.span('duplicate_code'):
+            self.analyze_duplicate_code()
+        
+        # 5. الملفات الثابتة
+        with self.tracer.span('assets'):
+            self.analyze_assets()
         
-        # 4. حفظ التقرير في مجلد reports/
+        # 6. فهرس استعلامات Supabase
+        with self.tracer.span('supabase_queries'):
+            self.analyze_supabase_queries()
+        
+        # 7. حفظ البيانات في مجلد reports/
         reports_dir = self.project_root / "reports"
         reports_dir.mkdir(exist_ok=True)
         
+        json_path = reports_dir / f"architecture_data_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with self.tracer.span('export'):
+            self.export_to_json(json_path)
+        
+        db_path = db_path or reports_dir / "architecture.db"
+        with self.tracer.span('store'):
+            db_counts = self.export_to_db(db_path)
+        
+        # 8. توليد التقرير (يتضمن أزمنة المراحل عند تفعيل القياس)
+        report = self.generate_architecture_report()
+        
         report_path = reports_dir / f"architecture_report_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         with open(report_path, 'w', encoding='utf-8') as f:
             f.write(report)
         
-        # 5. تصدير JSON في مجلد reports/
-        json_path = reports_dir / f"architecture_data_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        self.export_to_json(json_path)
+        if trace_path:
+            self.tracer.export_chrome_trace(trace_path)
+            print(f"⏱️  ملف القياس (Chrome trace): {trace_path}")
         
         print("\n" + "=" * 60)
         print("📊 نتائج التحليل:")
         print("=" * 60)
         print(f"📄 التقرير النصي: {report_path}")
         print(f"📊 البيانات الخام: {json_path}")
+        print(f"🗄️  قاعدة الاستعلام: {db_path} ({db_counts['files']} ملف، {db_counts['edges']} رابط)")
         print("\n" + "=" * 60)
         
         # عرض ملخص التقرير
@@ -474,8 +614,47 @@ class UberFixArchitectureAnalyzer:
             print(line)
 
 def main():
-    analyzer = UberFixArchitectureAnalyzer()
-    analyzer.run_complete_analysis()
+    parser = argparse.ArgumentParser(description="UberFix Architecture Analyzer")
+    parser.add_argument('--project-root', type=Path, default=None)
+    parser.add_argument('--db', type=Path, default=None, help='مسار قاعدة SQLite (الافتراضي: reports/architecture.db)')
+    parser.add_argument('--profile', action='store_true', help='قياس أزمنة المراحل والملفات وإضافتها للتقرير')
+    parser.add_argument('--trace', type=Path, help='تصدير القياس بصيغة Chrome trace (يفعّل --profile)')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--shard', help='تحليل شريحة واحدة i/N وحفظ نتيجة جزئية (مثلاً 0/4)')
+    mode.add_argument('--merge', type=Path, nargs='+', metavar='PARTIAL', help='دمج نتائج جزئية (وإكمال التقرير عند اكتمالها)')
+    parser.add_argument('--partial-out', type=Path, help='مسار النتيجة الجزئية (مع --shard أو --merge)')
+    args = parser.parse_args()
+    
+    tracer = Tracer(enabled=args.profile or args.trace is not None)
+    analyzer = UberFixArchitectureAnalyzer(project_root=args.project_root, tracer=tracer)
+    
+    if args.shard:
+        try:
+            index, count = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+        analyzer.run_shard(index, count, args.partial_out)
+        if args.trace:
+            tracer.export_chrome_trace(args.trace)
+        return
+    
+    partial = None
+    if args.merge:
+        try:
+            partial = merge_all(PartialResult.load(path) for path in args.merge)
+        except (OSError, ValueError) as e:
+            print(f"❌ تعذر دمج النتائج الجزئية: {e}")
+            sys.exit(1)
+        print(f"🧩 الشرائح: {sorted(partial.shards)} من {partial.shard_count}")
+        if args.partial_out or not partial.complete:
+            if not args.partial_out:
+                print(f"❌ شرائح ناقصة: {partial.missing} (استخدم --partial-out لحفظ دمج مرحلي)")
+                sys.exit(1)
+            partial.save(args.partial_out)
+            print(f"💾 النتيجة المدمجة: {args.partial_out}")
+            return
+    
+    analyzer.run_complete_analysis(trace_path=args.trace, db_path=args.db, partial=partial)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+"""
+UberFix Archive Replay
+مولّد حمل يعيد تشغيل أرشيف طلبات الصيانة (public/data/maintenance_requests_archive_rows.csv)
+بنفس توزيع الوصول الحقيقي بدلاً من حركة اصطناعية ثابتة كما في load-test.ts
+
+- كل صف ← حدث إنشاء (POST) عند وقت وصوله، وحدث تغيير حالة (PATCH) عند completion_date
+- الأوقات تُضغط بمعامل تسريع (--speed) أو لتناسب مدة محددة (--duration)
+- حمل مفتوح (open loop): الطلبات تُرسل في موعدها مهما تأخرت الردود، ويُقاس الزمن
+  من الموعد المجدول حتى لا يُخفي الطابور بطء الخادم
+- عميل HTTP/1.1 غير متزامن (asyncio) بمجموعة اتصالات keep-alive محدودة (--concurrency)
+
+created_at في الأرشيف الحالي وقت استيراد واحد لكل الصفوف، لذلك يُستخدم scheduled_date
+تلقائياً كوقت وصول عندما لا يحمل created_at أي توزيع.
+
+الاستخدام:
+    python3 scripts/archive_replay.py run --stub --duration 30
+    python3 scripts/archive_replay.py run --target http://localhost:54321 --header "apikey: $SUPABASE_ANON_KEY" --speed 86400
+    python3 scripts/archive_replay.py serve --port 8787 --latency-ms 25 --capacity 8
+"""
+
+import csv
+import ssl
+import math
+import json
+import time
+import zlib
+import random
+import asyncio
+import argparse
+import datetime
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+DEFAULT_PROJECT_ROOT = Path("/opt/UberFix")
+ARCHIVE_FILE = "maintenance_requests_archive_rows.csv"
+# نفس الجدول الذي يكتب فيه النموذج عبر Supabase REST
+DEFAULT_CREATE_PATH = "/rest/v1/maintenance_requests"
+DEFAULT_STATUS_PATH = "/rest/v1/maintenance_requests?id=eq.{id}"
+# يوم أرشيف لكل ثانية
+DEFAULT_SPEED = 86400.0
+PERCENTILES = (50, 90, 95, 99)
+REQUEST_TIMEOUT = 30.0
+
+CREATE = "create"
+STATUS = "status"
+
+
+class ReplayEvent(NamedTuple):
+    at: datetime.datetime
+    kind: str
+    request_id: str
+    payload: Dict
+
+
+class Outcome(NamedTuple):
+    kind: str
+    status: int
+    # من الموعد المجدول حتى اكتمال الرد (يشمل انتظار اتصال متاح)
+    latency: float
+    # زمن الطلب على الاتصال فقط
+    service: float
+    # تأخر بدء الإرسال عن الموعد (حمل زائد على المولّد نفسه أو على مجموعة الاتصالات)
+    lag: float
+
+
+# ====== قراءة الأرشيف ======
+
+def parse_timestamp(value: str) -> Optional[datetime.datetime]:
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    # مقارنة أوقات بعضها بمنطقة زمنية وبعضها بدونها تفشل
+    return parsed.replace(tzinfo=None)
+
+
+def pick_arrival_column(rows: List[Dict[str, str]], preferred: str = "created_at") -> str:
+    """created_at إن كان يحمل توزيعاً حقيقياً، وإلا scheduled_date (أرشيف مستورد دفعة واحدة)"""
+    distinct = {row.get(preferred) for row in rows if row.get(preferred)}
+    if len(distinct) > 1:
+        return preferred
+    return "scheduled_date"
+
+
+def spread_within_day(at: datetime.datetime, key: str) -> datetime.datetime:
+    """توزيع ثابت (حسب المعرف) داخل اليوم للتواريخ بدون وقت بدلاً من دفعة عند منتصف الليل"""
+    seconds = zlib.crc32(key.encode("utf-8")) % 86400
+    return at + datetime.timedelta(seconds=seconds)
+
+
+def load_events(
+    path: Path,
+    arrival_column: str = "auto",
+    include_status: bool = True,
+    spread: str = "auto",
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+    limit: Optional[int] = None,
+) -> Tuple[List[ReplayEvent], str]:
+    """أحداث الإنشاء وتغيير الحالة مرتبة زمنياً، مع اسم عمود الوصول المستخدم"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        rows = [row for row in csv.DictReader(f) if row.get("is_deleted", "false") != "true"]
+
+    if arrival_column == "auto":
+        arrival_column = pick_arrival_column(rows)
+
+    arrivals = [parse_timestamp(row.get(arrival_column, "")) for row in rows]
+    date_only = all(at is None or at.time() == datetime.time() for at in arrivals)
+    spread_days = spread == "day" or (spread == "auto" and date_only)
+
+    events: List[ReplayEvent] = []
+    for row, at in zip(rows, arrivals):
+        if at is None:
+            continue
+        request_id = row.get("id", "")
+        if spread_days:
+            at = spread_within_day(at, request_id)
+        events.append(ReplayEvent(at, CREATE, request_id, {
+            "id": request_id,
+            "store_id": row.get("store_id") or None,
+            "title": row.get("title", ""),
+            "description": row.get("description", ""),
+            "service_type": row.get("service_type") or None,
+            "priority": row.get("priority") or None,
+            "estimated_cost": float(row["estimated_cost"]) if row.get("estimated_cost") else None,
+            "status": "pending",
+        }))
+
+        completed = parse_timestamp(row.get("completion_date", ""))
+        if include_status and completed is not None and row.get("status"):
+            if spread_days and completed.time() == datetime.time():
+                completed = spread_within_day(completed, request_id + ":status")
+            # حالة لا تسبق إنشاء الطلب
+            completed = max(completed, at)
+            events.append(ReplayEvent(completed, STATUS, request_id, {"status": row["status"]}))
+
+    events.sort(key=lambda e: (e.at, e.kind != CREATE))
+    if start is not None:
+        events = [e for e in events if e.at >= start]
+    if end is not None:
+        events = [e for e in events if e.at < end]
+    if limit is not None:
+        events = events[:limit]
+    return events, arrival_column
+
+
+def schedule(events: List[ReplayEvent], speed: float, max_gap: Optional[float] = None) -> List[float]:
+    """موعد كل حدث بالثواني من بداية التشغيل؛ max_gap يختصر فترات السكون الطويلة"""
+    offsets: List[float] = []
+    current = 0.0
+    previous = None
+    for event in events:
+        if previous is not None:
+            gap = (event.at - previous).total_seconds() / speed
+            if max_gap is not None:
+                gap = min(gap, max_gap)
+            current += gap
+        offsets.append(current)
+        previous = event.at
+    return offsets
+
+
+def peak_rate(offsets: List[float], window: float = 1.0) -> int:
+    """أعلى عدد طلبات مجدولة في نافذة واحدة (حجم أكبر دفعة)"""
+    counts: Dict[int, int] = {}
+    for offset in offsets:
+        bucket = int(offset // window)
+        counts[bucket] = counts.get(bucket, 0) + 1
+    return max(counts.values(), default=0)
+
+
+# ====== عميل HTTP ======
+
+class HttpPool:
+    """اتصالات HTTP/1.1 keep-alive لمضيف واحد بحد أقصى للطلبات المتزامنة"""
+
+    def __init__(self, base_url: str, size: int, headers: Optional[Dict[str, str]] = None, timeout: float = REQUEST_TIMEOUT):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL: {base_url}")
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.base_path = parts.path.rstrip("/")
+        self.host_header = parts.netloc
+        self.headers = headers or {}
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(size)
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.connections_opened = 0
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        self.connections_opened += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    async def request(self, method: str, path: str, payload: Optional[Dict] = None) -> Tuple[int, float, float]:
+        """(status, وقت بدء الإرسال, زمن الخدمة) - الانتظار على اتصال متاح يسبق وقت البدء"""
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else b""
+        head = [
+            f"{method} {self.base_path}{path} HTTP/1.1",
+            f"Host: {self.host_header}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+        ]
+        head.extend(f"{name}: {value}" for name, value in self.headers.items())
+        message = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+        async with self._slots:
+            sent = time.perf_counter()
+            reused = bool(self._idle)
+            conn = self._idle.pop() if reused else await self._connect()
+            try:
+                status, keep_alive = await asyncio.wait_for(self._roundtrip(conn, message), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                conn[1].close()
+                if not reused:
+                    raise
+                # الخادم أغلق اتصالاً خاملاً: إعادة المحاولة مرة على اتصال جديد
+                conn = await self._connect()
+                status, keep_alive = await asyncio.wait_for(self._roundtrip(conn, message), self.timeout)
+            except BaseException:
+                conn[1].close()
+                raise
+            if keep_alive:
+                self._idle.append(conn)
+            else:
+                conn[1].close()
+            return status, sent, time.perf_counter() - sent
+
+    @staticmethod
+    async def _roundtrip(conn, message: bytes) -> Tuple[int, bool]:
+        reader, writer = conn
+        writer.write(message)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise asyncio.IncompleteReadError(b"", None)
+        version, status = status_line.decode("latin-1").split(" ", 2)[:2]
+        headers = await read_headers(reader)
+        keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+        status_code = int(status)
+        if status_code in (204, 304) or 100 <= status_code < 200:
+            return status_code, keep_alive
+        if "content-length" in headers:
+            await reader.readexactly(int(headers["content-length"]))
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                await reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        else:
+            await reader.read()
+            keep_alive = False
+        return status_code, keep_alive
+
+    async def close(self):
+        for _, writer in self._idle:
+            writer.close()
+        for _, writer in self._idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+        self._idle.clear()
+
+
+async def read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+# ====== التشغيل ======
+
+async def replay(
+    events: List[ReplayEvent],
+    offsets: List[float],
+    pool: HttpPool,
+    create_path: str = DEFAULT_CREATE_PATH,
+    status_path: str = DEFAULT_STATUS_PATH,
+    progress: bool = True,
+) -> Tuple[List[Outcome], float]:
+    """إرسال كل حدث في موعده (بدون انتظار ردود ما قبله)، ويعيد النتائج والمدة الفعلية"""
+    outcomes: List[Outcome] = []
+    loop = asyncio.get_running_loop()
+
+    async def fire(event: ReplayEvent, due: float):
+        if event.kind == CREATE:
+            method, path = "POST", create_path
+        else:
+            method, path = "PATCH", status_path.format(id=event.request_id)
+        try:
+            status, sent, service = await pool.request(method, path, event.payload)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+            status, sent, service = 0, time.perf_counter(), 0.0
+        done = time.perf_counter()
+        outcomes.append(Outcome(event.kind, status, done - due, service, max(0.0, sent - due)))
+
+    started = time.perf_counter()
+    tasks = []
+    total = len(events)
+    for i, (event, offset) in enumerate(zip(events, offsets), 1):
+        delay = started + offset - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(loop.create_task(fire(event, started + offset)))
+        if progress and (i % 200 == 0 or i == total):
+            print(f"\r📤 {i}/{total} | {event.at:%Y-%m-%d} | {len(outcomes)} رد", end="", flush=True)
+    await asyncio.gather(*tasks)
+    if progress:
+        print()
+    return outcomes, time.perf_counter() - started
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(outcomes: List[Outcome], elapsed: float) -> Dict[str, Dict]:
+    """إحصاءات لكل نوع حدث وللمجموع: percentiles بالمللي ثانية والإنتاجية"""
+    groups: Dict[str, List[Outcome]] = {"all": outcomes}
+    for outcome in outcomes:
+        groups.setdefault(outcome.kind, []).append(outcome)
+
+    summary = {}
+    for name, items in groups.items():
+        latencies = sorted(o.latency * 1000 for o in items)
+        services = sorted(o.service * 1000 for o in items if o.status)
+        ok = sum(1 for o in items if 200 <= o.status < 400)
+        summary[name] = {
+            "requests": len(items),
+            "ok": ok,
+            "http_errors": sum(1 for o in items if o.status >= 400),
+            "failed": sum(1 for o in items if o.status == 0),
+            "throughput_rps": round(ok / elapsed, 2) if elapsed else 0.0,
+            "latency_ms": {f"p{q}": round(percentile(latencies, q), 2) for q in PERCENTILES},
+            "latency_max_ms": round(latencies[-1], 2) if latencies else 0.0,
+            "service_ms": {f"p{q}": round(percentile(services, q), 2) for q in PERCENTILES},
+            "lag_p99_ms": round(percentile(sorted(o.lag * 1000 for o in items), 99), 2),
+        }
+    return summary
+
+
+def print_summary(summary: Dict[str, Dict], elapsed: float, offered: int):
+    print("\n" + "=" * 78)
+    print("📊 نتائج إعادة التشغيل")
+    print("=" * 78)
+    print(f"⏱️  المدة: {elapsed:.1f}s | أعلى دفعة مجدولة: {offered} طلب/ثانية")
+    header = f"{'النوع':8s} {'طلبات':>7s} {'ناجح':>7s} {'أخطاء':>6s} {'rps':>8s}"
+    header += "".join(f" {'p' + str(q):>8s}" for q in PERCENTILES) + f" {'max':>9s}"
+    print(header)
+    for name, stats in summary.items():
+        line = (
+            f"{name:8s} {stats['requests']:7d} {stats['ok']:7d} "
+            f"{stats['http_errors'] + stats['failed']:6d} {stats['throughput_rps']:8.1f}"
+        )
+        line += "".join(f" {stats['latency_ms'][f'p{q}']:8.1f}" for q in PERCENTILES)
+        line += f" {stats['latency_max_ms']:9.1f}"
+        print(line)
+    total = summary["all"]
+    print(f"(ms من الموعد المجدول؛ زمن الخدمة p99: {total['service_ms']['p99']:.1f} ms، "
+          f"تأخر الإرسال p99: {total['lag_p99_ms']:.1f} ms)")
+
+
+# ====== خادم بديل محلي ======
+
+async def serve_stub(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency_ms: float = 20.0,
+    jitter_ms: float = 10.0,
+    capacity: int = 0,
+    error_rate: float = 0.0,
+    seed: int = 7,
+) -> asyncio.AbstractServer:
+    """خادم HTTP يحاكي نقطة الإنشاء: زمن ثابت + تذبذب، وسعة معالجة محدودة تظهر أثر الدفعات"""
+    rng = random.Random(seed)
+    workers = asyncio.Semaphore(capacity) if capacity > 0 else None
+
+    async def process():
+        await asyncio.sleep(max(0.0, latency_ms + rng.uniform(-jitter_ms, jitter_ms)) / 1000)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method = request_line.split(b" ", 1)[0].decode("latin-1")
+                headers = await read_headers(reader)
+                await reader.readexactly(int(headers.get("content-length", "0")))
+
+                if workers is not None:
+                    async with workers:
+                        await process()
+                else:
+                    await process()
+
+                if rng.random() < error_rate:
+                    status, body = "503 Service Unavailable", b'{"error":"overloaded"}'
+                elif method == "POST":
+                    status, body = "201 Created", b'{"ok":true}'
+                else:
+                    status, body = "204 No Content", b""
+                close = headers.get("connection", "").lower() == "close"
+                head = f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                if body:
+                    head += f"Content-Length: {len(body)}\r\n"
+                if close:
+                    head += "Connection: close\r\n"
+                writer.write(head.encode("latin-1") + b"\r\n" + body)
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # CancelledError: إيقاف الخادم أثناء انتظار طلب على اتصال keep-alive
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+def parse_headers(values: List[str]) -> Dict[str, str]:
+    headers = {}
+    for value in values:
+        name, sep, content = value.partition(":")
+        if not sep:
+            raise SystemExit(f"❌ ترويسة غير صالحة: {value} (الصيغة: 'Name: value')")
+        headers[name.strip()] = content.strip()
+    return headers
+
+
+def parse_date(value: str) -> datetime.datetime:
+    parsed = parse_timestamp(value)
+    if parsed is None:
+        raise argparse.ArgumentTypeError(f"invalid date: {value}")
+    return parsed
+
+
+async def run_command(args) -> int:
+    archive = args.archive or args.project_root / "public" / "data" / ARCHIVE_FILE
+    if not archive.exists():
+        print(f"❌ الملف غير موجود: {archive}")
+        return 1
+
+    events, column = load_events(
+        archive,
+        arrival_column=args.arrival_column,
+        include_status=args.events == "all",
+        spread=args.spread,
+        start=args.start,
+        end=args.end,
+        limit=args.limit,
+    )
+    if not events:
+        print("⚠️  لا توجد أحداث في النطاق المحدد")
+        return 1
+
+    span = (events[-1].at - events[0].at).total_seconds()
+    speed = span / args.duration if args.duration and span else args.speed
+    offsets = schedule(events, speed, args.max_gap)
+    print(f"📂 {len(events)} حدث من {archive.name} (وقت الوصول: {column})")
+    print(f"🗓️  {events[0].at:%Y-%m-%d} ← {events[-1].at:%Y-%m-%d} | تسريع ×{speed:,.0f} "
+          f"| المدة المتوقعة {offsets[-1]:.1f}s")
+
+    server = None
+    target = args.target
+    if args.stub:
+        server = await serve_stub(
+            latency_ms=args.stub_latency_ms, jitter_ms=args.stub_jitter_ms, capacity=args.stub_capacity
+        )
+        port = server.sockets[0].getsockname()[1]
+        target = f"http://127.0.0.1:{port}"
+        print(f"🧪 خادم بديل محلي: {target} (زمن {args.stub_latency_ms:.0f}±{args.stub_jitter_ms:.0f} ms، "
+              f"سعة {args.stub_capacity or '∞'})")
+    print(f"🎯 الهدف: {target} | اتصالات متزامنة: {args.concurrency}")
+
+    pool = HttpPool(target, args.concurrency, parse_headers(args.header), args.timeout)
+    try:
+        outcomes, elapsed = await replay(events, offsets, pool, args.create_path, args.status_path)
+    finally:
+        await pool.close()
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    offered = peak_rate(offsets)
+    summary = summarize(outcomes, elapsed)
+    print_summary(summary, elapsed, offered)
+
+    reports_dir = args.project_root / "reports"
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    report_path = reports_dir / f"archive_replay_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "archive": str(archive),
+            "arrival_column": column,
+            "target": target,
+            "events": len(events),
+            "speed": speed,
+            "concurrency": args.concurrency,
+            "connections_opened": pool.connections_opened,
+            "elapsed_seconds": round(elapsed, 3),
+            "peak_scheduled_per_second": offered,
+            "results": summary,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n📄 التقرير: {report_path}")
+
+    failed = summary["all"]["http_errors"] + summary["all"]["failed"]
+    return 1 if failed else 0
+
+
+async def serve_command(args) -> int:
+    server = await serve_stub(args.host, args.port, args.latency_ms, args.jitter_ms, args.capacity, args.error_rate)
+    host, port = server.sockets[0].getsockname()[:2]
+    print(f"🧪 خادم بديل على http://{host}:{port} (Ctrl+C للإيقاف)")
+    async with server:
+        await server.serve_forever()
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UberFix maintenance archive replay load generator")
+    parser.add_argument("--project-root", type=Path, default=DEFAULT_PROJECT_ROOT)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="إعادة تشغيل الأرشيف على نقطة HTTP")
+    target = run.add_mutually_exclusive_group(required=True)
+    target.add_argument("--target", help="عنوان الخادم الأساسي (مثلاً http://localhost:54321)")
+    target.add_argument("--stub", action="store_true", help="تشغيل خادم بديل محلي واستهدافه")
+    run.add_argument("--archive", type=Path, help="ملف أرشيف بديل (مثلاً من maintenance_analytics.py generate)")
+    run.add_argument("--header", action="append", default=[], help="ترويسة إضافية 'Name: value' (قابلة للتكرار)")
+    run.add_argument("--create-path", default=DEFAULT_CREATE_PATH)
+    run.add_argument("--status-path", default=DEFAULT_STATUS_PATH, help="قالب مسار تغيير الحالة ({id})")
+    pace = run.add_mutually_exclusive_group()
+    pace.add_argument("--speed", type=float, default=DEFAULT_SPEED, help="معامل التسريع (86400 = يوم لكل ثانية)")
+    pace.add_argument("--duration", type=float, help="ضغط كامل النطاق ليستغرق هذه المدة بالثواني")
+    run.add_argument("--max-gap", type=float, help="أقصى سكون بين حدثين بالثواني بعد التسريع")
+    run.add_argument("--arrival-column", default="auto", help="عمود وقت الوصول (الافتراضي: تلقائي)")
+    run.add_argument("--spread", choices=("auto", "none", "day"), default="auto",
+                     help="توزيع التواريخ بدون وقت داخل اليوم (auto: إذا كانت كلها منتصف الليل)")
+    run.add_argument("--events", choices=("all", "create"), default="all", help="تضمين أحداث تغيير الحالة")
+    run.add_argument("--start", type=parse_date, help="بداية النطاق (YYYY-MM-DD)")
+    run.add_argument("--end", type=parse_date, help="نهاية النطاق (YYYY-MM-DD)")
+    run.add_argument("--limit", type=int, help="أقصى عدد أحداث")
+    run.add_argument("--concurrency", type=int, default=32, help="أقصى طلبات متزامنة (اتصالات keep-alive)")
+    run.add_argument("--timeout", type=float, default=REQUEST_TIMEOUT)
+    run.add_argument("--stub-latency-ms", type=float, default=20.0)
+    run.add_argument("--stub-jitter-ms", type=float, default=10.0)
+    run.add_argument("--stub-capacity", type=int, default=8, help="طلبات يعالجها الخادم البديل معاً (0 = بلا حد)")
+
+    serve = sub.add_parser("serve", help="خادم بديل محلي لنقطة الإنشاء")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8787)
+    serve.add_argument("--latency-ms", type=float, default=20.0)
+    serve.add_argument("--jitter-ms", type=float, default=10.0)
+    serve.add_argument("--capacity", type=int, default=0, help="طلبات متزامنة قبل الانتظار (0 = بلا حد)")
+    serve.add_argument("--error-rate", type=float, default=0.0, help="نسبة ردود 503 العشوائية")
+    args = parser.parse_args()
+
+    command = run_command if args.command == "run" else serve_command
+    try:
+        raise SystemExit(asyncio.run(command(args)))
+    except KeyboardInterrupt:
+        print("\n🛑 تم الإيقاف")
+
+
+if __name__ == "__main__":
+    main()
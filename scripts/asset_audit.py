@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+UberFix Asset Audit
+تدقيق الملفات الثابتة في public/ و icon/: النسخ المتطابقة والصور الثقيلة
+
+- النسخ المتطابقة: تجميع حسب الحجم أولاً (الملفات ذات الحجم الفريد لا تُقرأ أصلاً)،
+  ثم hash لأول 64 KB بالتوازي، ثم hash كامل فقط لما تطابقت بدايته
+- الصور: قراءة الترويسة فقط (PNG / JPEG / GIF / WebP / ICO / BMP) لمعرفة الأبعاد والصيغة
+  بدون فك الصورة، و SVG يُفحص بحثاً عن صور نقطية مضمّنة (base64)
+- تقدير التوفير: تصغير الأبعاد الزائدة ثم التحويل إلى WebP بنسب تقريبية لكل صيغة
+  (أيقونات manifest و icon/ و favicon / apple-touch-icon تبقى بصيغتها ويُقترح تصغيرها فقط)
+
+الاستخدام:
+    python3 scripts/asset_audit.py --project-root /opt/UberFix
+    python3 scripts/asset_audit.py --max-dimension 1600 --min-kb 20 --json /tmp/assets.json
+"""
+
+import os
+import re
+import json
+import time
+import struct
+import hashlib
+import argparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+DEFAULT_PROJECT_ROOT = Path("/opt/UberFix")
+ASSET_DIRS = ("public", "icon")
+EXCLUDED_DIRS = {"node_modules", ".git"}
+MANIFEST_FILE = "public/manifest.webmanifest"
+
+WORKERS = min(8, os.cpu_count() or 4)
+PARTIAL_BYTES = 64 * 1024
+CHUNK_BYTES = 1024 * 1024
+# أكبر من عرض الشاشات الشائعة بكثافة 2x؛ ما فوقه يُرسل ثم يُصغَّر في المتصفح
+MAX_DIMENSION = 2048
+MIN_SAVINGS = 10 * 1024
+# PNG ملوّن بهذا الحجم غالباً صورة فوتوغرافية تناسبها صيغة lossy
+PHOTO_PNG_BYTES = 100 * 1024
+LARGE_GIF_BYTES = 100 * 1024
+# أكثر من ذلك لكل بكسل يعني JPEG بجودة قريبة من 100
+JPEG_MAX_BITS_PER_PIXEL = 4.0
+SVG_EMBED_BYTES = 20 * 1024
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".ico", ".bmp", ".svg"}
+# الحجم التقريبي بعد التحويل إلى WebP كنسبة من الأصل (مقارنات WebP المنشورة)
+WEBP_RATIO = {
+    "jpeg": 0.70,
+    "png": 0.75,       # lossless
+    "png-photo": 0.30,  # lossy لصورة فوتوغرافية محفوظة PNG
+    "gif": 0.40,       # animated WebP
+    "bmp": 0.10,
+}
+UNCOMPRESSED_FORMATS = {"bmp"}
+# الامتداد المتوقع لكل صيغة (ملف .jpg محتواه PNG يُرسل بنوع MIME خاطئ)
+FORMAT_SUFFIXES = {
+    "png": {".png"}, "jpeg": {".jpg", ".jpeg"}, "gif": {".gif"}, "webp": {".webp"},
+    "ico": {".ico"}, "bmp": {".bmp"},
+}
+# أيقونات المنصات (icon/ لتطبيقات iOS / Android / المتاجر) و favicon تبقى PNG / ICO
+KEEP_FORMAT_RE = re.compile(r"^icon/|(^|/)(favicon|apple-touch-icon)[^/]*$")
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# SOF0..SOF15 بدون DHT (C4) و JPG (C8) و DAC (CC)
+_JPEG_SOF = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_SVG_EMBED_RE = re.compile(rb"data:image/(?:png|jpe?g|gif|webp);base64,")
+
+
+class ImageInfo(NamedTuple):
+    format: str
+    width: int
+    height: int
+    # PNG: color type، JPEG: progressive، GIF: متحركة، BMP: ضغط
+    detail: str = ""
+
+
+# ====== قراءة الترويسات ======
+def _read_png(f: BinaryIO, head: bytes) -> Optional[ImageInfo]:
+    if len(head) < 26 or head[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", head[16:24])
+    color = {0: "gray", 2: "rgb", 3: "palette", 4: "gray-alpha", 6: "rgba"}.get(head[25], "?")
+    return ImageInfo("png", width, height, color)
+
+
+def _read_gif(f: BinaryIO, head: bytes) -> Optional[ImageInfo]:
+    width, height = struct.unpack("<HH", head[6:10])
+    return ImageInfo("gif", width, height, "animated" if b"NETSCAPE2.0" in head else "")
+
+
+def _read_jpeg(f: BinaryIO, head: bytes) -> Optional[ImageInfo]:
+    """المرور على المقاطع حتى SOF (قد يسبقه EXIF بحجم 64 KB فيُتخطى بـ seek)"""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte and byte != b"\xff":
+            byte = f.read(1)
+        while byte == b"\xff":
+            byte = f.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            continue
+        if marker == 0xDA:
+            return None
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack(">H", length_bytes)[0]
+        if marker in _JPEG_SOF:
+            segment = f.read(5)
+            if len(segment) < 5:
+                return None
+            height, width = struct.unpack(">HH", segment[1:5])
+            return ImageInfo("jpeg", width, height, "progressive" if marker == 0xC2 else "baseline")
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _read_webp(f: BinaryIO, head: bytes) -> Optional[ImageInfo]:
+    chunk = head[12:16]
+    if chunk == b"VP8 " and len(head) >= 30:
+        width, height = struct.unpack("<HH", head[26:30])
+        return ImageInfo("webp", width & 0x3FFF, height & 0x3FFF, "lossy")
+    if chunk == b"VP8L" and len(head) >= 25:
+        bits = struct.unpack("<I", head[21:25])[0]
+        return ImageInfo("webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, "lossless")
+    if chunk == b"VP8X" and len(head) >= 30:
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return ImageInfo("webp", width, height, "extended")
+    return None
+
+
+def _read_ico(f: BinaryIO, head: bytes) -> Optional[ImageInfo]:
+    """أكبر صورة داخل الأيقونة (0 في الترويسة تعني 256)"""
+    count = struct.unpack("<H", head[4:6])[0]
+    sizes = [
+        (head[6 + i * 16] or 256, head[7 + i * 16] or 256)
+        for i in range(count) if 6 + i * 16 + 16 <= len(head)
+    ]
+    if not sizes:
+        return None
+    width, height = max(sizes)
+    return ImageInfo("ico", width, height, f"{count} sizes")
+
+
+def _read_bmp(f: BinaryIO, head: bytes) -> Optional[ImageInfo]:
+    if len(head) < 34:
+        return None
+    width, height = struct.unpack("<ii", head[18:26])
+    compression = struct.unpack("<I", head[30:34])[0]
+    return ImageInfo("bmp", width, abs(height), "uncompressed" if compression == 0 else f"compression {compression}")
+
+
+def read_image_info(path: Path) -> Optional[ImageInfo]:
+    """أبعاد الصورة وصيغتها من الترويسة فقط، أو None لصيغة غير معروفة أو ملف تالف"""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(4096)
+            if head.startswith(_PNG_SIGNATURE):
+                return _read_png(f, head)
+            if head[:2] == b"\xff\xd8":
+                return _read_jpeg(f, head)
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+                return _read_gif(f, head)
+            if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+                return _read_webp(f, head)
+            if head[:4] == b"\x00\x00\x01\x00":
+                return _read_ico(f, head)
+            if head[:2] == b"BM":
+                return _read_bmp(f, head)
+    except (OSError, struct.error):
+        return None
+    return None
+
+
+# ====== النسخ المتطابقة ======
+def file_digest(path: Path, limit: Optional[int] = None) -> str:
+    """blake2b لأول limit بايت (أو الملف كاملاً)؛ hashlib يحرر الـ GIL فتتوازى الـ threads"""
+    digest = hashlib.blake2b(digest_size=16)
+    remaining = limit
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            chunk = f.read(CHUNK_BYTES if remaining is None else min(CHUNK_BYTES, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+def find_duplicates(project_root: Path, sizes: Dict[str, int], pool: ThreadPoolExecutor,
+                    stats: Dict[str, int]) -> List[Dict]:
+    """مجموعات الملفات المتطابقة بايتاً ببايت مرتبة بالبايتات المهدرة"""
+    by_size: Dict[int, List[str]] = defaultdict(list)
+    for path, size in sizes.items():
+        if size > 0:
+            by_size[size].append(path)
+    candidates = [sorted(paths) for paths in by_size.values() if len(paths) > 1]
+
+    def split(groups: List[List[str]], limit: Optional[int]) -> List[List[str]]:
+        paths = [path for group in groups for path in group]
+        digests = dict(zip(paths, pool.map(lambda p: file_digest(project_root / p, limit), paths)))
+        stats["hashed_files"] += len(paths)
+        stats["hashed_bytes"] += sum(min(sizes[p], limit or sizes[p]) for p in paths)
+        result = []
+        for group in groups:
+            by_digest: Dict[str, List[str]] = defaultdict(list)
+            for path in group:
+                by_digest[digests[path]].append(path)
+            result.extend(same for same in by_digest.values() if len(same) > 1)
+        return result
+
+    # البداية أولاً: ملفات بنفس الحجم ومحتوى مختلف تفترق غالباً في أول 64 KB
+    groups = split(candidates, PARTIAL_BYTES)
+    small = [group for group in groups if sizes[group[0]] <= PARTIAL_BYTES]
+    groups = small + split([group for group in groups if sizes[group[0]] > PARTIAL_BYTES], None)
+
+    duplicates = [
+        {"files": group, "size": sizes[group[0]], "wasted_bytes": sizes[group[0]] * (len(group) - 1)}
+        for group in groups
+    ]
+    duplicates.sort(key=lambda d: (-d["wasted_bytes"], d["files"][0]))
+    return duplicates
+
+
+# ====== الصور ======
+def manifest_icons(project_root: Path) -> Set[str]:
+    """أيقونات manifest.webmanifest (مسارات نسبية لجذر المشروع)؛ صيغتها يحددها المتصفح/النظام"""
+    try:
+        with open(project_root / MANIFEST_FILE, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    return {f"public/{icon['src'].lstrip('/')}" for icon in manifest.get("icons", []) if icon.get("src")}
+
+
+def assess_image(info: ImageInfo, size: int, keep_format: bool, max_dimension: int = MAX_DIMENSION) -> Tuple[int, List[str], str]:
+    """(الحجم المقدّر بعد التحسين، المشاكل، الاقتراح)"""
+    issues = []
+    estimate = float(size)
+    actions = []
+
+    largest = max(info.width, info.height)
+    if largest > max_dimension:
+        scale = max_dimension / largest
+        issues.append(f"oversized {info.width}x{info.height}")
+        actions.append(f"resize to {round(info.width * scale)}x{round(info.height * scale)}")
+        # الحجم يتناسب تقريباً مع عدد البكسلات
+        estimate *= scale * scale
+
+    kind = info.format
+    if kind == "png" and info.detail in ("rgb", "rgba") and size >= PHOTO_PNG_BYTES:
+        kind = "png-photo"
+        issues.append("large truecolor PNG")
+    elif kind == "gif" and size >= LARGE_GIF_BYTES:
+        issues.append("large animated GIF" if info.detail == "animated" else "large GIF")
+    elif kind == "jpeg" and info.width and info.height:
+        bits_per_pixel = size * 8 / (info.width * info.height)
+        if bits_per_pixel > JPEG_MAX_BITS_PER_PIXEL:
+            issues.append(f"weak compression {bits_per_pixel:.1f} bpp")
+    if kind in UNCOMPRESSED_FORMATS:
+        issues.append("uncompressed format")
+
+    if not keep_format and kind in WEBP_RATIO:
+        estimate *= WEBP_RATIO[kind]
+        actions.append("convert to WebP" + (" (lossy)" if kind == "png-photo" else ""))
+    return int(estimate), issues, ", ".join(actions)
+
+
+def inspect_images(project_root: Path, paths: List[str], sizes: Dict[str, int], pool: ThreadPoolExecutor,
+                   keep_format: Set[str], max_dimension: int = MAX_DIMENSION) -> Tuple[List[Dict], Dict[str, int]]:
+    """الصور التي يمكن تحسينها (مع التوفير المقدّر) وعدد الصور لكل صيغة"""
+    images = [p for p in paths if Path(p).suffix.lower() in IMAGE_SUFFIXES]
+    raster = [p for p in images if not p.lower().endswith(".svg")]
+    infos = dict(zip(raster, pool.map(lambda p: read_image_info(project_root / p), raster)))
+
+    formats: Dict[str, int] = defaultdict(int)
+    findings = []
+    for path in raster:
+        info = infos[path]
+        if info is None:
+            formats["unknown"] += 1
+            continue
+        formats[info.format] += 1
+        size = sizes[path]
+        keep = path in keep_format or bool(KEEP_FORMAT_RE.search(path))
+        estimate, issues, suggestion = assess_image(info, size, keep, max_dimension)
+        suffix = Path(path).suffix.lower()
+        if suffix not in FORMAT_SUFFIXES.get(info.format, {suffix}):
+            issues.insert(0, f"{info.format} content in {suffix} file")
+        findings.append({
+            "file": path, "format": info.format, "width": info.width, "height": info.height,
+            "detail": info.detail, "bytes": size, "estimated_bytes": estimate,
+            "savings": size - estimate, "issues": issues, "suggestion": suggestion,
+        })
+
+    for path in images:
+        if not path.lower().endswith(".svg"):
+            continue
+        formats["svg"] += 1
+        size = sizes[path]
+        if size < SVG_EMBED_BYTES:
+            continue
+        try:
+            embedded = bool(_SVG_EMBED_RE.search((project_root / path).read_bytes()))
+        except OSError:
+            continue
+        if embedded:
+            findings.append({
+                "file": path, "format": "svg", "width": 0, "height": 0, "detail": "embedded raster",
+                "bytes": size, "estimated_bytes": size, "savings": 0,
+                "issues": ["embedded base64 raster"], "suggestion": "extract the raster to its own file",
+            })
+    return findings, dict(formats)
+
+
+# ====== المشروع ======
+def collect_sizes(project_root: Path, asset_dirs: Iterable[str] = ASSET_DIRS) -> Dict[str, int]:
+    """المسار النسبي ← الحجم لكل ملف في مجلدات الملفات الثابتة (os.scandir بدون stat إضافي)"""
+    sizes: Dict[str, int] = {}
+    stack = [project_root / d for d in asset_dirs if (project_root / d).is_dir()]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in EXCLUDED_DIRS:
+                        stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    sizes[Path(entry.path).relative_to(project_root).as_posix()] = entry.stat().st_size
+    return sizes
+
+
+def analyze_project(project_root: Path, sizes: Optional[Dict[str, int]] = None, asset_dirs: Iterable[str] = ASSET_DIRS,
+                    workers: int = WORKERS, max_dimension: int = MAX_DIMENSION, min_savings: int = MIN_SAVINGS) -> Dict:
+    """sizes: أحجام جاهزة (من file_structure في architecture_analyzer) بدلاً من المرور على القرص"""
+    started = time.perf_counter()
+    asset_dirs = tuple(asset_dirs)
+    if sizes is None:
+        sizes = collect_sizes(project_root, asset_dirs)
+    else:
+        sizes = {p: s for p, s in sizes.items() if p.split("/", 1)[0] in asset_dirs}
+    stats = {"hashed_files": 0, "hashed_bytes": 0}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        duplicates = find_duplicates(project_root, sizes, pool, stats)
+        # نسخة واحدة من كل مجموعة متطابقة تكفي (الباقي محسوب في wasted_bytes)
+        copies = {path for group in duplicates for path in group["files"][1:]}
+        findings, formats = inspect_images(project_root, sorted(p for p in sizes if p not in copies), sizes, pool,
+                                           manifest_icons(project_root), max_dimension)
+
+    # SVG يظهر فقط عند وجود صورة مضمّنة، والتوفير فيه لا يُقدّر
+    findings = [f for f in findings if f["savings"] >= min_savings or f["format"] == "svg"]
+    findings.sort(key=lambda f: (-f["savings"], f["file"]))
+    summary = {
+        "files": len(sizes),
+        "bytes": sum(sizes.values()),
+        "images": sum(formats.values()),
+        "formats": formats,
+        "hashed_files": stats["hashed_files"],
+        "hashed_bytes": stats["hashed_bytes"],
+        "duplicate_groups": len(duplicates),
+        "duplicate_bytes": sum(d["wasted_bytes"] for d in duplicates),
+        "image_findings": len(findings),
+        "image_savings": sum(f["savings"] for f in findings),
+        "max_dimension": max_dimension,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+    }
+    return {"summary": summary, "duplicates": duplicates, "images": findings}
+
+
+def report_lines(result: Dict, top: int = 15) -> List[str]:
+    """أسطر جاهزة لتقرير التحليل المعماري"""
+    summary = result["summary"]
+    formats = "، ".join(f"{name} {count}" for name, count in sorted(summary["formats"].items(), key=lambda i: -i[1]))
+    lines = [
+        f"🖼️  {summary['files']} ملف ثابت ({summary['bytes'] / 1024 / 1024:.1f} MB)، {summary['images']} صورة: {formats}",
+        f"🔍 hash لـ {summary['hashed_files']} ملف فقط ({summary['hashed_bytes'] / 1024 / 1024:.1f} MB) بعد التجميع حسب الحجم",
+    ]
+    if result["duplicates"]:
+        lines.append(
+            f"📑 {summary['duplicate_groups']} مجموعة ملفات متطابقة، {summary['duplicate_bytes'] / 1024:.1f} KB مكررة:"
+        )
+        for group in result["duplicates"][:top]:
+            lines.append(f"  📑 {group['wasted_bytes'] / 1024:8.1f} KB  {len(group['files'])} × {group['size'] / 1024:.1f} KB")
+            for path in group["files"][:5]:
+                lines.append(f"      {path}")
+            if len(group["files"]) > 5:
+                lines.append(f"      ... و {len(group['files']) - 5} أخرى")
+    else:
+        lines.append("✅ لا توجد ملفات ثابتة مكررة")
+
+    if result["images"]:
+        lines.append(f"🗜️  {summary['image_findings']} صورة يمكن تحسينها، توفير مقدّر {summary['image_savings'] / 1024:.1f} KB:")
+        for image in result["images"][:top]:
+            size = f"{image['width']}x{image['height']}" if image["width"] else image["format"]
+            lines.append(
+                f"  🗜️  {image['savings'] / 1024:8.1f} KB  {image['file']} ({size}, {image['bytes'] / 1024:.0f} KB)"
+                f"  {'; '.join(image['issues']) or '-'} → {image['suggestion'] or '-'}"
+            )
+    else:
+        lines.append("✅ لا توجد صور تحتاج تحسيناً")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UberFix static asset audit")
+    parser.add_argument("--project-root", type=Path, default=DEFAULT_PROJECT_ROOT)
+    parser.add_argument("--dirs", nargs="+", default=list(ASSET_DIRS), help="مجلدات الملفات الثابتة")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--max-dimension", type=int, default=MAX_DIMENSION, help="أكبر بعد مقبول للصورة (px)")
+    parser.add_argument("--min-kb", type=float, default=MIN_SAVINGS / 1024, help="أقل توفير لعرض الصورة")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", type=Path, help="حفظ النتيجة كاملة بصيغة JSON")
+    args = parser.parse_args()
+
+    result = analyze_project(args.project_root, asset_dirs=args.dirs, workers=args.workers,
+                             max_dimension=args.max_dimension, min_savings=int(args.min_kb * 1024))
+    for line in report_lines(result, args.top):
+        print(line)
+    print(f"⏱️  {result['summary']['elapsed_seconds']}s", end="")
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f" | 📄 {args.json}", end="")
+    print()
+
+
+if __name__ == "__main__":
+    main()
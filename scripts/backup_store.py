@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+UberFix Backup Store
+مخزن نسخ احتياطية خارج شجرة المصدر، معنون بالمحتوى (SHA-256) ومضغوط
+
+    backups/
+      blobs/ab/abcdef....gz      # محتوى فريد واحد لكل hash (zstd إن توفر وإلا gzip)
+      runs/20260101_120000_123456.json  # manifest لكل تشغيل: المسار ← hash
+
+الاستخدام:
+    python3 scripts/backup_store.py list
+    python3 scripts/backup_store.py restore 20260101_120000_123456
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import hashlib
+import argparse
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_PROJECT_ROOT = Path("/opt/UberFix")
+
+
+def _zstd():
+    """zstandard اختياري؛ gzip من المكتبة القياسية هو البديل"""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+class BackupStore:
+    """نسخ احتياطية معنونة بالمحتوى مع manifest لكل تشغيل"""
+
+    def __init__(
+        self,
+        project_root: Path,
+        store_dir: Optional[Path] = None,
+        run_id: Optional[str] = None,
+        workers: int = 4,
+    ):
+        self.project_root = Path(project_root)
+        # مجلد backups مستثنى أصلاً في أدوات الإصلاح والتحليل
+        self.store_dir = Path(store_dir or self.project_root / "backups")
+        self.blobs_dir = self.store_dir / "blobs"
+        self.runs_dir = self.store_dir / "runs"
+        # الميكروثانية حتى لا يتشارك تشغيلان في نفس الثانية manifest واحداً
+        self.run_id = run_id or datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.workers = workers
+
+        zstd = _zstd()
+        self.codec = "zst" if zstd else "gz"
+        self._zstd = zstd
+
+        self.manifest: Dict[str, Dict] = {}
+        self._manifest_written = False
+        self._pending: Dict[str, bytes] = {}  # hash -> raw content
+        self.stats = {
+            "files": 0,
+            "blobs_written": 0,
+            "blobs_reused": 0,
+            "bytes_in": 0,
+            "bytes_written": 0,
+            "write_seconds": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def stage(self, file_path: Path, content: str):
+        """إضافة المحتوى الأصلي لملف إلى التشغيل الحالي (يُكتب عند flush)"""
+        raw = content.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        rel = self._relative(file_path)
+
+        if rel in self.manifest:
+            # أول نسخة في التشغيل هي الأصل
+            return
+        self.manifest[rel] = {"blob": digest, "size": len(raw)}
+        self.stats["files"] += 1
+        self.stats["bytes_in"] += len(raw)
+        if digest not in self._pending:
+            self._pending[digest] = raw
+
+    def flush(self):
+        """كتابة الكتل الجديدة فقط ثم حفظ الـ manifest (قبل تعديل أي ملف مصدر)"""
+        started = time.perf_counter()
+        pending, self._pending = self._pending, {}
+
+        todo: List[Tuple[str, bytes]] = []
+        for digest, raw in pending.items():
+            if self._blob_path(digest).exists():
+                self.stats["blobs_reused"] += 1
+            else:
+                todo.append((digest, raw))
+
+        if todo:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for written in pool.map(self._write_blob, todo):
+                    self.stats["blobs_written"] += 1
+                    self.stats["bytes_written"] += written
+
+        if self.manifest:
+            self._write_manifest()
+        self.stats["write_seconds"] += time.perf_counter() - started
+
+    def _write_blob(self, item: Tuple[str, bytes]) -> int:
+        digest, raw = item
+        path = self._blob_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self._zstd:
+            data = self._zstd.ZstdCompressor(level=10).compress(raw)
+        else:
+            data = gzip.compress(raw, compresslevel=6, mtime=0)
+        tmp = path.with_suffix(path.suffix + f".tmp{os.getpid()}")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        return len(data)
+
+    def _write_manifest(self):
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        path = self.runs_dir / f"{self.run_id}.json"
+        data = {
+            "run_id": self.run_id,
+            "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "project_root": str(self.project_root),
+            "files": self.manifest,
+        }
+        tmp = path.with_suffix(f".json.tmp{os.getpid()}")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        if self._manifest_written:
+            # التشغيل نفسه يحدّث manifest عند كل دفعة
+            os.replace(tmp, path)
+            return
+        # أول كتابة لا تستبدل أبداً نقطة استعادة تشغيل آخر بنفس run_id (link يفشل إن وُجد الملف)
+        try:
+            os.link(tmp, path)
+        except FileExistsError:
+            raise FileExistsError(f"backup run {self.run_id} already exists: {path}") from None
+        finally:
+            os.unlink(tmp)
+        self._manifest_written = True
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def list_runs(self) -> List[Dict]:
+        runs = []
+        for path in sorted(self.runs_dir.glob("*.json")):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            runs.append(
+                {
+                    "run_id": data["run_id"],
+                    "created_at": data.get("created_at", ""),
+                    "files": len(data["files"]),
+                    "bytes": sum(entry["size"] for entry in data["files"].values()),
+                }
+            )
+        return runs
+
+    def read_blob(self, digest: str) -> bytes:
+        for codec in ("zst", "gz"):
+            path = self._blob_path(digest, codec)
+            if not path.exists():
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            if codec == "gz":
+                return gzip.decompress(data)
+            zstd = _zstd()
+            if zstd is None:
+                raise RuntimeError(f"zstandard غير مثبت لقراءة {path}")
+            return zstd.ZstdDecompressor().decompress(data)
+        raise FileNotFoundError(f"blob {digest} غير موجود")
+
+    def restore(self, run_id: str, paths: Optional[List[str]] = None) -> List[str]:
+        """استرجاع ملفات تشغيل واحد (كلها أو المسارات المحددة)"""
+        with open(self.runs_dir / f"{run_id}.json", "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        files = data["files"]
+        if paths:
+            wanted = set(paths)
+            files = {rel: entry for rel, entry in files.items() if rel in wanted}
+
+        def restore_one(item: Tuple[str, Dict]) -> str:
+            rel, entry = item
+            raw = self.read_blob(entry["blob"])
+            target = self.project_root / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, "wb") as f:
+                f.write(raw)
+            return rel
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(restore_one, files.items()))
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _relative(self, file_path: Path) -> str:
+        try:
+            return str(Path(file_path).resolve().relative_to(self.project_root.resolve()))
+        except ValueError:
+            return str(file_path)
+
+    def _blob_path(self, digest: str, codec: Optional[str] = None) -> Path:
+        return self.blobs_dir / digest[:2] / f"{digest}.{codec or self.codec}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UberFix backup store")
+    parser.add_argument("--project-root", type=Path, default=DEFAULT_PROJECT_ROOT)
+    parser.add_argument("--store", type=Path, default=None, help="مجلد المخزن (الافتراضي: <root>/backups)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="عرض التشغيلات المحفوظة")
+    restore = sub.add_parser("restore", help="استرجاع ملفات تشغيل واحد")
+    restore.add_argument("run_id")
+    restore.add_argument("paths", nargs="*", help="مسارات نسبية محددة (اختياري)")
+    args = parser.parse_args()
+
+    store = BackupStore(args.project_root, args.store)
+
+    if args.command == "list":
+        runs = store.list_runs()
+        if not runs:
+            print("لا توجد نسخ احتياطية")
+            return
+        for run in runs:
+            print(f"{run['run_id']}  {run['created_at']}  {run['files']:5d} ملف  {run['bytes']:>10,} bytes")
+        return
+
+    started = time.perf_counter()
+    try:
+        restored = store.restore(args.run_id, args.paths)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+    for rel in restored:
+        print(f"  ♻️  {rel}")
+    print(f"✅ تم استرجاع {len(restored)} ملف في {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+UberFix Tooling Benchmarks
+قياس زمن وذاكرة كل مرحلة في أدوات Python (الإصلاح، التحليل المعماري، gomap)
+على أشجار ملفات و CSV مُولَّدة، مع حفظ النتائج JSON للمقارنة بين الـ commits
+
+أداة memory تقيس الذاكرة المحتجزة لنتائج المحلل (سجلات analysis_records)
+مقارنة بشكل القواميس الذي يُصدَّر إلى JSON.
+
+أمثلة:
+    python3 scripts/bench_tooling.py --sizes 1000 10000
+    python3 scripts/bench_tooling.py --tools memory --sizes 100000
+    python3 scripts/bench_tooling.py --sizes 1000 --compare reports/benchmarks/bench_<old>.json
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import resource
+import tempfile
+import datetime
+import gc
+import subprocess
+import contextlib
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+sys.path.insert(0, str(REPO_ROOT / "src" / "data"))
+
+from uberfix_repair import UberFixRepair  # noqa: E402
+from architecture_analyzer import UberFixArchitectureAnalyzer  # noqa: E402
+
+
+FEATURES = ["maintenance", "properties", "invoices", "technicians", "reports", "admin"]
+
+COMPONENT_TEMPLATE = """import React, {{ useEffect, useState }} from "react";
+import {{ supabase }} from "@/integrations/supabase/client";
+import {{ {dep_name} }} from "../{dep_feature}/{dep_name}";
+
+interface {name}Props {{
+  id: string;
+  payload: any;
+}}
+
+export const {name} = ({{ id, payload }}: {name}Props) => {{
+  const [items, setItems] = useState<Array<any>>([]);
+
+  useEffect(() => {{
+    const load = async (): Promise<any> => {{
+      const {{ data }} = await supabase.from("{table}").select("*").eq("id", id);
+      console.log("loaded", data);
+      setItems(data ?? []);
+    }};
+    load();
+  }}, [id]);
+
+  function handleUpdate(value: any) {{
+    const meta: Record<string, any> = {{ value, payload }};
+    localStorage.setItem("{name}", JSON.stringify(meta));
+  }}
+
+  return (
+    <div className="p-4" onClick={{() => handleUpdate(items.length)}}>
+      <{dep_name} />
+      {{items.map((item) => React.createElement("span", {{ key: item.id }}, item.title))}}
+    </div>
+  );
+}};
+
+export default {name};
+"""
+
+HOOK_TEMPLATE = """import {{ useQuery }} from "@tanstack/react-query";
+import {{ supabase }} from "@/integrations/supabase/client";
+
+export const use{name} = (id: string) => {{
+  return useQuery({{
+    queryKey: ["{table}", id],
+    queryFn: async () => {{
+      const {{ data, error }} = await supabase.from("{table}").select("id, title").eq("id", id);
+      if (error) throw error;
+      return data as any[];
+    }},
+  }});
+}};
+"""
+
+TABLES = ["maintenance_requests", "stores", "properties", "invoices", "profiles"]
+
+
+# -------------------------------------------------------
+# Synthetic inputs
+# -------------------------------------------------------
+def generate_ts_tree(root: Path, files: int, seed: int = 42) -> Path:
+    """توليد شجرة src/ بعدد محدد من ملفات TS/TSX"""
+    rng = random.Random(seed)
+    names: Dict[str, List[str]] = {feature: [] for feature in FEATURES}
+
+    for i in range(files):
+        feature = FEATURES[i % len(FEATURES)]
+        table = rng.choice(TABLES)
+        if i % 5 == 4:
+            name = f"Feature{i}"
+            folder = root / "src" / "hooks" / feature
+            folder.mkdir(parents=True, exist_ok=True)
+            (folder / f"use{name}.ts").write_text(
+                HOOK_TEMPLATE.format(name=name, table=table), encoding="utf-8"
+            )
+            continue
+
+        name = f"Component{i}"
+        dep_feature = rng.choice(FEATURES)
+        dep_name = rng.choice(names[dep_feature]) if names[dep_feature] else name
+        folder = root / "src" / "components" / feature
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"{name}.tsx").write_text(
+            COMPONENT_TEMPLATE.format(
+                name=name, dep_name=dep_name, dep_feature=dep_feature, table=table
+            ),
+            encoding="utf-8",
+        )
+        names[feature].append(name)
+
+    (root / "package.json").write_text(
+        json.dumps({"name": "uberfix-bench", "scripts": {}}), encoding="utf-8"
+    )
+    return root
+
+
+def generate_branch_csv(path: Path, rows: int, seed: int = 42) -> Path:
+    """توليد CSV فروع مشابه لـ branch_locations.csv مع روابط نهائية تحمل الإحداثيات"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("id,branch,address,link\n")
+        for i in range(rows):
+            lat = 29.9 + rng.random() * 0.4
+            lng = 31.1 + rng.random() * 0.5
+            if i % 3 == 0:
+                link = f"https://www.google.com/maps/place/Branch+{i}/@{lat:.7f},{lng:.7f},17z"
+            elif i % 3 == 1:
+                link = f"https://maps.google.com/?q={lat:.7f},{lng:.7f}"
+            else:
+                link = f"https://maps.app.goo.gl/unresolved{i}"
+            f.write(f"Az-Shop-{i:05d},Branch {i},\"Street {i}, Cairo\",{link}\n")
+    return path
+
+
+# -------------------------------------------------------
+# Stage timing
+# -------------------------------------------------------
+class StageRecorder:
+    """تسجيل الزمن وذروة الذاكرة لكل مرحلة
+
+    tracemalloc يبطئ التخصيصات كثيراً، لذا يُستخدم فقط مع --trace-memory؛
+    وإلا تُسجَّل ru_maxrss بعد كل مرحلة، وهي أعلى RSS للعملية منذ بدايتها
+    (تراكمية: لا تنخفض بين المراحل) وليست ذروة المرحلة نفسها.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Dict] = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str, items: Optional[int] = None):
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        # أدوات المشروع تطبع كثيراً؛ لا نريد قياس زمن الطباعة
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+        elapsed = time.perf_counter() - started
+        record = {
+            "seconds": round(elapsed, 6),
+            "max_rss_so_far_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        }
+        if tracing:
+            record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        if items is not None:
+            record["items"] = items
+        self.stages[name] = record
+
+
+def bench_repair(root: Path) -> Dict:
+    """مراحل uberfix_repair: discovery, read, parse, fix, write, report"""
+    rec = StageRecorder()
+    repair = UberFixRepair(project_root=root)
+
+    with rec.stage("discovery"):
+        files = repair.get_all_source_files()
+    rec.stages["discovery"]["items"] = len(files)
+
+    contents: Dict[Path, str] = {}
+    with rec.stage("read", len(files)):
+        for path in files:
+            with open(path, "r", encoding="utf-8") as f:
+                contents[path] = f.read()
+
+    analyses: Dict[Path, Dict] = {}
+    with rec.stage("parse", len(files)):
+        for path, content in contents.items():
+            analyses[path] = repair.analyze_file(path, content)
+
+    fixed: Dict[Path, str] = {}
+    issue_types = {"ANY_TYPE", "CONSOLE_LOG", "MISSING_REACT_IMPORT"}
+    with rec.stage("fix", len(files)):
+        for path, content in contents.items():
+            if path.suffix not in (".ts", ".tsx", ".js", ".jsx"):
+                continue
+            new = repair.fix_content(path, content, issue_types)
+            if new != content:
+                fixed[path] = new
+    source_bytes = sum(len(c.encode("utf-8")) for c in contents.values())
+    rec.stages["fix"]["bytes"] = source_bytes
+    # معدل الإصلاح لكل ميجابايت من المصدر
+    rec.stages["fix"]["mb_per_s"] = round(
+        source_bytes / (1024 * 1024) / max(rec.stages["fix"]["seconds"], 1e-9), 3
+    )
+
+    with rec.stage("write", len(fixed)):
+        for path, content in fixed.items():
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            repair.fixed_files.add(str(path))
+
+    with rec.stage("report"):
+        repair.generate_report()
+
+    return rec.stages
+
+
+def bench_analyzer(root: Path, output_dir: Path) -> Dict:
+    """مراحل architecture_analyzer: discovery, read, parse, report, write"""
+    rec = StageRecorder()
+    analyzer = UberFixArchitectureAnalyzer(project_root=root)
+
+    paths: List[Path] = []
+    with rec.stage("discovery"):
+        for dirpath, dirs, names in os.walk(root):
+            dirs[:] = [d for d in dirs if d not in ["node_modules", "dist", "build", ".git", "backups", "reports"]]
+            paths.extend(Path(dirpath) / name for name in names)
+    rec.stages["discovery"]["items"] = len(paths)
+
+    # parse يحلل المحتوى المقروء هنا حتى لا تُحسب قراءة الملفات مرتين
+    sources: Dict[Path, str] = {}
+    with rec.stage("read", len(paths)):
+        for path in paths:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    sources[path] = f.read()
+            except UnicodeDecodeError:
+                pass
+
+    with rec.stage("parse", len(paths)):
+        analyzer.analyze_project_structure(sources=sources)
+        analyzer.analyze_function_relationships()
+
+    with rec.stage("report"):
+        analyzer.generate_architecture_report()
+
+    with rec.stage("write"):
+        analyzer.export_to_json(output_dir / "architecture_data.json")
+
+    return rec.stages
+
+
+def bench_analyzer_memory(root: Path) -> Dict:
+    """الذاكرة المحتجزة لنتائج المحلل: السجلات المضغوطة ثم نسخة القواميس (export_dict)"""
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    rec = StageRecorder()
+    analyzer = UberFixArchitectureAnalyzer(project_root=root)
+    try:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        with rec.stage("records"):
+            analyzer.analyze_project_structure()
+            analyzer.analyze_function_relationships()
+        gc.collect()
+        records_bytes = tracemalloc.get_traced_memory()[0] - before
+
+        before = tracemalloc.get_traced_memory()[0]
+        with rec.stage("dicts"):
+            exported = analyzer.export_dict()
+        gc.collect()
+        dict_bytes = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    files = sum(len(folder.files) for folder in analyzer.analysis_result["file_structure"].values())
+    functions = len(analyzer.analysis_result["functions_analysis"])
+    del exported
+    for stage, retained in (("records", records_bytes), ("dicts", dict_bytes)):
+        rec.stages[stage].update(items=files, retained_bytes=retained, bytes_per_file=round(retained / max(files, 1)))
+    rec.stages["dicts"]["ratio"] = round(dict_bytes / max(records_bytes, 1), 2)
+    rec.stages["records"]["functions"] = functions
+    return rec.stages
+
+
+def bench_gomap(csv_path: Path, output_dir: Path) -> Dict:
+    """مراحل gomap بدون شبكة: read, parse (استخراج الإحداثيات من الروابط), write"""
+    try:
+        import pandas as pd
+        import gomap
+    except ImportError as e:
+        return {"skipped": f"gomap dependencies not installed: {e}"}
+
+    rec = StageRecorder()
+    with rec.stage("read"):
+        df = pd.read_csv(csv_path, encoding="utf-8")
+    rec.stages["read"]["items"] = len(df)
+
+    with rec.stage("parse", len(df)):
+        coords = [gomap.parse_coordinates(url) for url in df["link"]]
+
+    with rec.stage("write", len(df)):
+        df["latitude"] = [lat for lat, _ in coords]
+        df["longitude"] = [lng for _, lng in coords]
+        df.to_csv(output_dir / "branch_locations_fixed.csv", index=False, encoding="utf-8")
+
+    return rec.stages
+
+
+# -------------------------------------------------------
+# Results
+# -------------------------------------------------------
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """مقارنة النتائج مع ملف سابق؛ يعيد قائمة التراجعات"""
+    regressions = []
+    print("\n📊 المقارنة مع:", baseline.get("commit") or baseline.get("timestamp"))
+    for tool, sizes in current["results"].items():
+        for size, stages in sizes.items():
+            old_stages = baseline.get("results", {}).get(tool, {}).get(size, {})
+            for stage, record in stages.items():
+                old = old_stages.get(stage)
+                if not isinstance(record, dict) or not isinstance(old, dict):
+                    continue
+                if not old.get("seconds"):
+                    continue
+                ratio = record["seconds"] / old["seconds"]
+                marker = "⚠️ " if ratio > 1 + threshold else "  "
+                line = (
+                    f"{marker}{tool:9s} {size:>7s} {stage:10s} "
+                    f"{old['seconds']:.4f}s → {record['seconds']:.4f}s ({ratio:.2f}x)"
+                )
+                print(line)
+                if ratio > 1 + threshold:
+                    regressions.append(line.strip())
+    return regressions
+
+
+def run_benchmarks(
+    sizes: List[int], csv_rows: List[int], tools: List[str], keep: bool, trace_memory: bool = False
+) -> Dict:
+    results: Dict[str, Dict] = {tool: {} for tool in tools}
+    if trace_memory:
+        tracemalloc.start()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="uberfix-bench-"))
+    try:
+        for size in sizes:
+            if "repair" in tools or "analyzer" in tools or "memory" in tools:
+                print(f"🏗️  توليد شجرة {size} ملف...")
+                tree = generate_ts_tree(work_dir / f"tree_{size}", size)
+
+            if "memory" in tools:
+                print(f"🧠 architecture_analyzer memory ({size})")
+                results["memory"][str(size)] = bench_analyzer_memory(tree)
+            if "analyzer" in tools:
+                # المحلل أولاً لأن الإصلاح يعدّل الملفات
+                print(f"🔍 architecture_analyzer ({size})")
+                results["analyzer"][str(size)] = bench_analyzer(tree, work_dir)
+            if "repair" in tools:
+                print(f"🔧 uberfix_repair ({size})")
+                results["repair"][str(size)] = bench_repair(tree)
+
+        if "gomap" in tools:
+            for rows in csv_rows:
+                print(f"🗺️  gomap ({rows} صف)")
+                csv_path = generate_branch_csv(work_dir / f"branches_{rows}.csv", rows)
+                results["gomap"][str(rows)] = bench_gomap(csv_path, work_dir)
+    finally:
+        tracemalloc.stop()
+        if keep:
+            print(f"📁 الملفات المولدة: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def print_results(data: Dict):
+    print("\n" + "=" * 60)
+    print("⏱️  نتائج القياس")
+    print("=" * 60)
+    for tool, sizes in data["results"].items():
+        for size, stages in sizes.items():
+            if "skipped" in stages:
+                print(f"{tool:9s} {size:>7s} — {stages['skipped']}")
+                continue
+            for stage, record in stages.items():
+                if "peak_bytes" in record:
+                    peak = f"heap peak {record['peak_bytes'] / (1024 * 1024):8.2f} MB"
+                else:
+                    peak = f"rss max so far {record['max_rss_so_far_kb'] / 1024:8.1f} MB"
+                rate = f"  {record['mb_per_s']:7.2f} MB/s" if "mb_per_s" in record else ""
+                if "retained_bytes" in record:
+                    rate += (f"  retained {record['retained_bytes'] / (1024 * 1024):8.2f} MB"
+                             f" ({record['bytes_per_file']} B/file)")
+                if "ratio" in record:
+                    rate += f"  {record['ratio']:.2f}x"
+                print(f"{tool:9s} {size:>7s} {stage:10s} {record['seconds']:9.4f}s  {peak}{rate}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UberFix tooling benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000], help="عدد ملفات TS في كل شجرة (مثلاً 1000 10000 100000)")
+    parser.add_argument("--csv-rows", type=int, nargs="+", default=[10000], help="عدد صفوف CSV لـ gomap")
+    parser.add_argument("--tools", nargs="+", default=["repair", "analyzer", "gomap"], choices=["repair", "analyzer", "gomap", "memory"])
+    parser.add_argument("--output", type=Path, default=REPO_ROOT / "reports" / "benchmarks")
+    parser.add_argument("--compare", type=Path, help="ملف نتائج سابق للمقارنة")
+    parser.add_argument("--threshold", type=float, default=0.2, help="نسبة التراجع المسموحة (0.2 = 20%%)")
+    parser.add_argument("--keep", action="store_true", help="الإبقاء على الملفات المولدة")
+    parser.add_argument("--trace-memory", action="store_true", help="ذروة الذاكرة لكل مرحلة عبر tracemalloc (أبطأ)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    data = run_benchmarks(args.sizes, args.csv_rows, args.tools, args.keep, args.trace_memory)
+    print_results(data)
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    out_path = args.output / f"bench_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    print(f"\n📄 النتائج: {out_path}")
+
+    if baseline is not None:
+        regressions = compare(data, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} مرحلة أبطأ من الحد المسموح")
+            sys.exit(1)
+        print("\n✅ لا توجد تراجعات في الأداء")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+UberFix Code Splitting
+كشف الصفحات والمكونات الثقيلة المستوردة استيراداً ثابتاً في الحمل الأولي
+واقتراح تحويلها إلى React.lazy مع تقدير التوفير في الحزمة الأولية
+
+التوفير المقدّر = ما يخرج من إغلاق نقطة الدخول عند جعل هذا الاستيراد وحده ديناميكياً
+(الملفات والحزم المشتركة مع استيرادات ثابتة أخرى لا تُحسب).
+
+الاستخدام:
+    python3 scripts/code_splitting.py --project-root /opt/UberFix
+"""
+
+import re
+import argparse
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from import_graph import STATIC, ImportGraph
+from import_weight import ENTRY_POINTS, ImportWeights, PackageWeights
+
+
+DEFAULT_PROJECT_ROOT = Path("/opt/UberFix")
+# الملفات التي تُعرّف جداول التوجيه
+ROUTE_FILE_RE = re.compile(r"^src/(App\.tsx|routes/[^/]+\.tsx)$")
+PAGES_PREFIX = "src/pages/"
+MIN_SAVINGS = 10 * 1024
+
+_LAZY_RE = re.compile(r"const\s+(\w+)\s*=\s*(?:React\.)?lazy\(\s*\(\)\s*=>\s*import\(\s*['\"]([^'\"]+)['\"]\s*\)")
+_DEFAULT_IMPORT_RE = re.compile(r"import\s+(\w+)\s*(?:,\s*\{[^}]*\})?\s+from\s+['\"]([^'\"]+)['\"]")
+_NAMED_IMPORT_RE = re.compile(r"import\s+(?:\w+\s*,\s*)?\{([^}]*)\}\s+from\s+['\"]([^'\"]+)['\"]")
+_ROUTE_RE = re.compile(r"path:\s*['\"]([^'\"]+)['\"]\s*,\s*element:\s*<(\w+)")
+_JSX_ROUTE_RE = re.compile(r"<Route\s+path=['\"]([^'\"]+)['\"]\s+element=\{\s*<(\w+)")
+
+
+def parse_route_file(content: str) -> Tuple[Dict[str, Tuple[str, bool]], List[Tuple[str, str]]]:
+    """(المعرّف ← (المصدر، lazy?)) وقائمة (المسار، المعرّف) من ملف توجيه"""
+    bindings: Dict[str, Tuple[str, bool]] = {}
+    for m in _DEFAULT_IMPORT_RE.finditer(content):
+        bindings[m.group(1)] = (m.group(2), False)
+    for m in _NAMED_IMPORT_RE.finditer(content):
+        for element in m.group(1).split(","):
+            parts = element.split(" as ")
+            local = parts[-1].strip()
+            if local and not local.startswith("type "):
+                bindings[local] = (m.group(2), False)
+    for m in _LAZY_RE.finditer(content):
+        bindings[m.group(1)] = (m.group(2), True)
+
+    routes = [(m.group(1), m.group(2)) for m in _ROUTE_RE.finditer(content)]
+    routes.extend((m.group(1), m.group(2)) for m in _JSX_ROUTE_RE.finditer(content))
+    return bindings, routes
+
+
+class CodeSplitAnalyzer:
+    """مرشحات React.lazy مرتبة حسب التوفير في الحمل الأولي"""
+
+    def __init__(self, graph: ImportGraph, weights: ImportWeights, entries=ENTRY_POINTS):
+        self.graph = graph
+        self.weights = weights
+        self.entries = [e for e in entries if e in graph.edges]
+        self.initial = self._reachable()
+
+    def _reachable(self, skip: Optional[Tuple[str, str]] = None) -> Set[str]:
+        """إغلاق نقاط الدخول عبر الاستيراد الثابت مع تجاهل حافة واحدة"""
+        seen = set(self.entries)
+        queue = deque(seen)
+        while queue:
+            current = queue.popleft()
+            for target, kind in self.graph.edges.get(current, ()):
+                if kind != STATIC or target in seen or (current, target) == skip:
+                    continue
+                seen.add(target)
+                queue.append(target)
+        return seen
+
+    def _bytes(self, files: Set[str]) -> Tuple[int, int]:
+        source = sum(self.graph.sizes.get(f, 0) for f in files)
+        packages = self.weights.packages
+        if not packages.available:
+            return source, 0
+        dirs: Set[str] = set()
+        for name in self.weights.external_packages(files):
+            dirs |= packages.closure(name)
+        return source, packages.bytes_of(dirs)
+
+    def routes(self) -> List[Dict]:
+        """كل مسارات التوجيه مع نوع تحميل صفحتها"""
+        found = []
+        for rel in sorted(self.graph.edges):
+            if not ROUTE_FILE_RE.match(rel):
+                continue
+            with open(self.graph.project_root / rel, "r", encoding="utf-8") as f:
+                bindings, routes = parse_route_file(f.read())
+            for path, ident in routes:
+                spec, lazy = bindings.get(ident, (None, False))
+                target = self.graph.resolve(rel, spec) if spec else None
+                found.append({"route": path, "component": ident, "file": rel, "target": target, "lazy": lazy})
+        return found
+
+    def candidate_edges(self) -> Set[Tuple[str, str]]:
+        """استيرادات ثابتة في الحمل الأولي: أي صفحة، أو أي مكون في ملفات التوجيه"""
+        edges = set()
+        for importer in self.initial:
+            route_file = bool(ROUTE_FILE_RE.match(importer))
+            for target, kind in self.graph.edges.get(importer, ()):
+                # جداول التوجيه نفسها ليست مكونات تُعرض
+                if kind != STATIC or not target.endswith((".tsx", ".jsx")) or target.startswith("src/routes/"):
+                    continue
+                if target.startswith(PAGES_PREFIX) or (route_file and target.startswith("src/")):
+                    edges.add((importer, target))
+        return edges
+
+    def analyze(self, min_savings: int = MIN_SAVINGS) -> Dict:
+        initial_source, initial_packages = self._bytes(self.initial)
+        routes = self.routes()
+        routes_by_target: Dict[str, List[str]] = {}
+        for route in routes:
+            if route["target"] and not route["lazy"]:
+                routes_by_target.setdefault(route["target"], []).append(route["route"])
+
+        candidates = []
+        for importer, target in self.candidate_edges():
+            removed = self.initial - self._reachable(skip=(importer, target))
+            if not removed:
+                continue
+            remaining_source, remaining_packages = self._bytes(self.initial - removed)
+            savings = (initial_source - remaining_source) + (initial_packages - remaining_packages)
+            if savings < min_savings:
+                continue
+            candidates.append(
+                {
+                    "importer": importer,
+                    "target": target,
+                    "routes": routes_by_target.get(target, []),
+                    "is_page": target.startswith(PAGES_PREFIX),
+                    "files_removed": len(removed),
+                    "source_savings": initial_source - remaining_source,
+                    "package_savings": initial_packages - remaining_packages,
+                    "savings": savings,
+                }
+            )
+        candidates.sort(key=lambda c: (-c["savings"], c["target"]))
+
+        return {
+            "entries": self.entries,
+            "initial_files": len(self.initial),
+            "initial_source_bytes": initial_source,
+            "initial_package_bytes": initial_packages,
+            "routes": len(routes),
+            "lazy_routes": sum(1 for r in routes if r["lazy"]),
+            "local_routes": sum(1 for r in routes if r["target"]),
+            # Navigate وأمثاله من مكتبات خارجية ليست صفحات محلية
+            "eager_routes": [r for r in routes if r["target"] and not r["lazy"]],
+            "candidates": candidates,
+        }
+
+
+def report_lines(result: Dict, top: int = 20) -> List[str]:
+    """أسطر جاهزة لتقرير التحليل المعماري"""
+    initial_kb = (result["initial_source_bytes"] + result["initial_package_bytes"]) / 1024
+    lines = [
+        f"🚀 الحمل الأولي: {result['initial_files']} ملف، {initial_kb:.1f} KB",
+        f"🛣️  المسارات: {result['local_routes']} (lazy: {result['lazy_routes']}، ثابتة: {len(result['eager_routes'])})",
+    ]
+    if not result["candidates"]:
+        lines.append("✅ لا توجد استيرادات ثابتة ثقيلة مرشحة للتقسيم")
+        return lines
+
+    lines.append(f"✂️  مرشحات React.lazy ({len(result['candidates'])}):")
+    for c in result["candidates"][:top]:
+        label = "📄" if c["is_page"] else "🧩"
+        routes = f" [{', '.join(c['routes'])}]" if c["routes"] else ""
+        lines.append(
+            f"  {label} {c['savings'] / 1024:8.1f} KB  {c['target']}{routes}  ← {c['importer']} "
+            f"({c['files_removed']} ملف)"
+        )
+    return lines
+
+
+def analyze_project(project_root: Path, min_savings: int = MIN_SAVINGS) -> Dict:
+    graph = ImportGraph.build(project_root)
+    packages = PackageWeights(project_root)
+    result = CodeSplitAnalyzer(graph, ImportWeights(graph, packages)).analyze(min_savings)
+    packages.save()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UberFix code-splitting candidates")
+    parser.add_argument("--project-root", type=Path, default=DEFAULT_PROJECT_ROOT)
+    parser.add_argument("--min-kb", type=float, default=MIN_SAVINGS / 1024, help="أقل توفير لعرض المرشح")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    result = analyze_project(args.project_root, int(args.min_kb * 1024))
+    for line in report_lines(result, args.top):
+        print(line)
+    for route in result["eager_routes"]:
+        print(f"  ⚠️  {route['route']} → {route['component']} ({route['file']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,25 @@
 
 import os
 import json
+import time
+from pathlib import Path
+
 import requests
 
-ROOT = "/opt/UberFix"
-ERROR_FILE = f"{ROOT}/scripts/errors-warnings.txt"
+from eslint_report import ESLintReportIndex
+from lint_client import LintWorkerClient, LintWorkerError, count_errors, format_results
+from local_fixers import LocalFixer
+
+ROOT = os.getenv("UBERFIX_ROOT", "/opt/UberFix")
+# npx eslint -f json -o scripts/errors-warnings.json "src/**/*.{ts,tsx}"
+ERROR_FILE = f"{ROOT}/scripts/errors-warnings.json"
 PATCH_OUTPUT = f"{ROOT}/scripts/deepseek_patch.diff"
 
+# LOCAL_FIXES=0 لإرسال كل شيء إلى DeepSeek بدون المسار المحلي
+LOCAL_FIXES = os.getenv("LOCAL_FIXES", "1") != "0"
+# LINT_WORKER=1 لإعادة فحص الملفات المصلحة محلياً عبر العامل الدائم (scripts/lint_worker.mjs)
+LINT_WORKER = os.getenv("LINT_WORKER", "0") == "1"
+
 API_KEY = os.getenv("DEEPSEEK_API_KEY")
 MODEL = "deepseek-coder"
 
@@ -17,40 +30,101 @@ if not API_KEY:
     exit(1)
 
 # -------------------------------------------------------
-# Load errors/warnings
+# Load errors/warnings (ESLint JSON formatter output)
 # -------------------------------------------------------
 if not os.path.exists(ERROR_FILE):
-    print("ERROR: errors-warnings.txt not found.")
+    print("ERROR: errors-warnings.json not found.")
+    print('Generate it with: npx eslint -f json -o scripts/errors-warnings.json "src/**/*.{ts,tsx}"')
     exit(1)
 
-with open(ERROR_FILE, "r", encoding="utf-8") as f:
-    ERRORS = f.read().strip()
+try:
+    REPORT = ESLintReportIndex.load(Path(ERROR_FILE), Path(ROOT))
+except (OSError, json.JSONDecodeError) as e:
+    print(f"ERROR: Failed to parse ESLint JSON report: {e}")
+    exit(1)
 
 
 # -------------------------------------------------------
-# Collect affected source files ONLY
+# Local fast path for mechanical rules (no API round-trip)
 # -------------------------------------------------------
-def extract_paths(text: str):
-    paths = set()
-    for line in text.splitlines():
-        if line.startswith("/opt/UberFix/src"):
-            # أول عنصر في السطر هو المسار
-            parts = line.split()
-            if not parts:
-                continue
-            path = parts[0]
-            if os.path.exists(path):
-                paths.add(path)
-    return sorted(paths)
-
-
-AFFECTED_FILES = extract_paths(ERRORS)
+TOTAL_FINDINGS = REPORT.total_findings
+LOCAL_RESULT = None
+
+if LOCAL_FIXES:
+    LOCAL_RESULT = LocalFixer(REPORT).run()
+    for path in list(REPORT.files):
+        REPORT.replace_findings(path, LOCAL_RESULT.remaining.get(path, []))
+    print(
+        f"Fixed {len(LOCAL_RESULT.fixed)} of {TOTAL_FINDINGS} findings locally "
+        f"in {LOCAL_RESULT.elapsed * 1000:.0f} ms "
+        f"({len(LOCAL_RESULT.files_written)} files written)."
+    )
+
+
+def validate_local_fixes(files):
+    """إعادة فحص الملفات المكتوبة محلياً بدون تشغيل npx eslint من جديد"""
+    client = LintWorkerClient(Path(ROOT))
+    if not client.available:
+        print("Lint worker unavailable (node or node_modules/eslint missing); skipping validation.")
+        return
+    started = time.perf_counter()
+    try:
+        with client:
+            results = client.check(files)
+    except LintWorkerError as e:
+        print(f"Lint worker failed: {e}")
+        return
+    for line in format_results(results):
+        print(f"  {line}")
+    print(
+        f"Validated {len(files)} locally fixed files: {count_errors(results)} errors "
+        f"({(time.perf_counter() - started) * 1000:.0f} ms)."
+    )
+
+
+if LINT_WORKER and LOCAL_RESULT and LOCAL_RESULT.files_written:
+    validate_local_fixes(sorted(LOCAL_RESULT.files_written))
+
+
+def print_fix_summary(api_elapsed=None, sent_chars=0, saved_chars=0):
+    """ملخص: محلي مقابل DeepSeek والوقت الموفّر"""
+    local = len(LOCAL_RESULT.fixed) if LOCAL_RESULT else 0
+    print("\nFIX SUMMARY")
+    print(f"  local : {local}")
+    print(f"  remote: {REPORT.total_findings}")
+    if api_elapsed is None:
+        print("  latency saved: DeepSeek request skipped entirely")
+    elif saved_chars and sent_chars:
+        # تقدير خطي: زمن الطلب يتناسب مع حجم الـ prompt
+        estimate = api_elapsed * saved_chars / sent_chars
+        print(f"  DeepSeek round-trip: {api_elapsed:.1f} s for {sent_chars} prompt chars")
+        print(f"  latency saved (estimated): {estimate:.1f} s for {saved_chars} chars not sent")
+
+
+# -------------------------------------------------------
+# Collect affected source files ONLY (errors first)
+# -------------------------------------------------------
+AFFECTED_FILES = REPORT.affected_files()
 
 if not AFFECTED_FILES:
     print("No affected files detected.")
+    if LOCAL_RESULT and LOCAL_RESULT.fixed:
+        print_fix_summary()
     exit(0)
 
-print(f"Detected {len(AFFECTED_FILES)} affected files.")
+print(
+    f"Detected {len(AFFECTED_FILES)} affected files "
+    f"({REPORT.total_findings} findings, {REPORT.duplicates} duplicates merged)."
+)
+
+# حجم ما لم يعد يحتاج الإرسال (ملفات أُصلحت بالكامل محلياً)
+SAVED_CHARS = 0
+if LOCAL_RESULT:
+    for path in LOCAL_RESULT.files_written:
+        if path not in REPORT.files and REPORT.resolve(path).exists():
+            SAVED_CHARS += REPORT.resolve(path).stat().st_size
+
+ERRORS = REPORT.render(REPORT.files[path] for path in AFFECTED_FILES)
 
 
 # -------------------------------------------------------
@@ -78,7 +152,7 @@ prompt = prompt_header + ERRORS + "\n\nAFFECTED FILES CONTENT:\n"
 
 for file_path in AFFECTED_FILES:
     try:
-        with open(file_path, "r", encoding="utf-8") as src:
+        with open(REPORT.resolve(file_path), "r", encoding="utf-8") as src:
             content = src.read()
         prompt += "\n### FILE: {}\n```\n{}\n```".format(file_path, content)
     except Exception as e:
@@ -106,7 +180,9 @@ headers = {
 
 print("Sending request to DeepSeek…")
 
+started = time.perf_counter()
 response = requests.post(url, json=payload, headers=headers, timeout=300)
+API_ELAPSED = time.perf_counter() - started
 
 if response.status_code != 200:
     print("DeepSeek API ERROR:", response.text)
@@ -138,6 +214,8 @@ os.makedirs(os.path.dirname(PATCH_OUTPUT), exist_ok=True)
 with open(PATCH_OUTPUT, "w", encoding="utf-8") as f:
     f.write(completion)
 
+print_fix_summary(API_ELAPSED, len(prompt), SAVED_CHARS)
+
 print("\nPATCH SAVED →", PATCH_OUTPUT)
 print("\nApply patch using:")
 print("  git apply deepseek_patch.diff")
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+UberFix Duplicate Code
+كشف الأجزاء المنسوخة بين ملفات TS/TSX في src/ عبر بصمات winnowing
+
+- كل ملف يُحوّل إلى رموز (ts_tokenizer) بدون المسافات والتعليقات وجمل import
+  (--normalize literals يوحّد النصوص والأرقام، و rename يوحّد المعرفات أيضاً)
+- hash متدحرج لكل k رمز متتالية ثم winnowing: أصغر hash في كل نافذة من w قيمة
+  (أي تطابق بطول w + k - 1 رمز على الأقل يُكتشف حتماً)
+- فهرس مقلوب بصمة ← مواضع، فالمقارنة بين المواضع المشتركة فقط (قريب من الخطي)
+- كل موضع مشترك يُمدّ للجهتين إلى أطول تطابق، والتطابقات بنفس تسلسل الرموز عنقود واحد
+- العناقيد مرتبة بالبايتات المكررة (ما يمكن حذفه باستخراج نسخة واحدة مشتركة)، ولا يُحسب
+  جزء مرتين إذا ظهر في أكثر من عنقود
+
+الاستخدام:
+    python3 scripts/duplicate_code.py --project-root /opt/UberFix
+    python3 scripts/duplicate_code.py --min-tokens 80 --normalize rename --top 30
+"""
+
+import json
+import time
+import argparse
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from ts_tokenizer import IDENT, NUMBER, PUNCT, STRING, TEMPLATE, JSX_TEXT, REGEX, Token, is_jsx_path, tokenize
+
+
+DEFAULT_PROJECT_ROOT = Path("/opt/UberFix")
+SOURCE_DIR = "src"
+SOURCE_SUFFIXES = (".ts", ".tsx")
+# ملفات مولّدة أو لا تدخل الحزمة (أنواع فقط / اختبارات)
+EXCLUDED_FILES = {"src/integrations/supabase/types.ts"}
+EXCLUDED_PARTS = ("__tests__", ".test.", ".spec.", ".d.ts")
+
+K = 20
+WINDOW = 16
+MIN_TOKENS = 50
+# بصمة تتكرر في مواضع أكثر من هذا نمط شائع (boilerplate) لا نسخ
+MAX_POSTINGS = 40
+# ظهور يغطي جزء سبق احتسابه بهذه النسبة لا يُحتسب مرة أخرى
+MIN_OVERLAP = 0.5
+
+EXACT = "exact"
+LITERALS = "literals"
+RENAME = "rename"
+NORMALIZE_MODES = (EXACT, LITERALS, RENAME)
+
+_BASE = 1_000_003
+_MOD = (1 << 61) - 1
+
+_LITERAL_KINDS = {STRING, TEMPLATE, NUMBER, JSX_TEXT, REGEX}
+# الكلمات المحجوزة تبقى كما هي مع rename (هيكل الكود)
+KEYWORDS = {
+    "abstract", "any", "as", "async", "await", "boolean", "break", "case", "catch", "class", "const",
+    "continue", "debugger", "declare", "default", "delete", "do", "else", "enum", "export", "extends",
+    "false", "finally", "for", "from", "function", "get", "if", "implements", "import", "in",
+    "instanceof", "interface", "keyof", "let", "new", "null", "number", "of", "private", "protected",
+    "public", "readonly", "return", "set", "static", "string", "super", "switch", "this", "throw",
+    "true", "try", "type", "typeof", "undefined", "unknown", "var", "void", "while", "yield",
+}
+
+
+class SourceFile:
+    __slots__ = ("path", "source", "tokens", "ids")
+
+    def __init__(self, path: str, source: str, tokens: List[Token], ids: List[int]):
+        self.path = path
+        self.source = source
+        # الرموز المعتمدة فقط (بعد حذف جمل import) و ids الموحّدة المقابلة لها
+        self.tokens = tokens
+        self.ids = ids
+
+    def span(self, start: int, end: int) -> Tuple[int, int]:
+        """نطاق الحروف لرموز [start, end)"""
+        return self.tokens[start].start, self.tokens[end - 1].end
+
+    def byte_size(self, start: int, end: int) -> int:
+        begin, finish = self.span(start, end)
+        return len(self.source[begin:finish].encode("utf-8"))
+
+
+def strip_imports(tokens: List[Token]) -> List[Token]:
+    """حذف جمل import الثابتة (قوائم الاستيراد متشابهة بطبيعتها وليست نسخاً)"""
+    kept: List[Token] = []
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        statement_start = not kept or kept[-1].is_punct(";") or kept[-1].is_punct("}") or tok.nl_before
+        next_tok = tokens[i + 1] if i + 1 < len(tokens) else None
+        if (tok.is_ident("import") and statement_start and next_tok is not None
+                and not next_tok.is_punct("(") and not next_tok.is_punct(".")):
+            i += 1
+            while i < len(tokens) and tokens[i].kind != STRING:
+                i += 1
+            i += 1
+            if i < len(tokens) and tokens[i].is_punct(";"):
+                i += 1
+            continue
+        kept.append(tok)
+        i += 1
+    return kept
+
+
+def rolling_hashes(ids: List[int], k: int) -> List[int]:
+    """hash لكل k-gram (Rabin-Karp بمعامل 2^61-1)"""
+    if len(ids) < k:
+        return []
+    top = pow(_BASE, k - 1, _MOD)
+    h = 0
+    for value in ids[:k]:
+        h = (h * _BASE + value) % _MOD
+    hashes = [h]
+    for i in range(k, len(ids)):
+        h = ((h - ids[i - k] * top) * _BASE + ids[i]) % _MOD
+        hashes.append(h)
+    return hashes
+
+
+def winnow(hashes: List[int], window: int) -> List[Tuple[int, int]]:
+    """(hash, موضع) المختارة: أصغر قيمة في كل نافذة (الأيمن عند التساوي)، كل موضع مرة واحدة"""
+    if not hashes:
+        return []
+    if len(hashes) <= window:
+        position = min(range(len(hashes)), key=lambda i: (hashes[i], -i))
+        return [(hashes[position], position)]
+    selected: List[Tuple[int, int]] = []
+    candidates: deque = deque()
+    last = -1
+    for i, h in enumerate(hashes):
+        while candidates and hashes[candidates[-1]] >= h:
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        if i >= window - 1 and candidates[0] != last:
+            last = candidates[0]
+            selected.append((hashes[last], last))
+    return selected
+
+
+class DuplicateDetector:
+    """فهرس بصمات لكل الملفات ثم تطابقات قصوى مجمعة في عناقيد"""
+
+    def __init__(self, k: int = K, window: int = WINDOW, min_tokens: int = MIN_TOKENS,
+                 max_postings: int = MAX_POSTINGS, normalize: str = EXACT):
+        if min_tokens < k:
+            raise ValueError(f"min_tokens ({min_tokens}) must be >= k ({k})")
+        if normalize not in NORMALIZE_MODES:
+            raise ValueError(f"normalize must be one of {', '.join(NORMALIZE_MODES)}")
+        self.k = k
+        self.window = window
+        self.min_tokens = min_tokens
+        self.max_postings = max_postings
+        self.normalize = normalize
+        self.files: List[SourceFile] = []
+        self.index: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+        self._vocabulary: Dict[str, int] = {}
+        self.stats = {"files": 0, "tokens": 0, "fingerprints": 0, "extensions": 0, "skipped_common": 0}
+
+    def _key(self, tok: Token) -> str:
+        if self.normalize != EXACT and tok.kind in _LITERAL_KINDS:
+            return f"\0{tok.kind}"
+        if self.normalize == RENAME and tok.kind == IDENT and tok.value not in KEYWORDS:
+            return "\0ident"
+        return tok.value if tok.kind in (IDENT, PUNCT) else f"{tok.kind}\0{tok.value}"
+
+    def add_file(self, path: str, source: str):
+        tokens = strip_imports(tokenize(source, jsx=is_jsx_path(path)))
+        vocabulary = self._vocabulary
+        ids = [vocabulary.setdefault(self._key(tok), len(vocabulary) + 1) for tok in tokens]
+        file_index = len(self.files)
+        self.files.append(SourceFile(path, source, tokens, ids))
+        fingerprints = winnow(rolling_hashes(ids, self.k), self.window)
+        for h, position in fingerprints:
+            self.index[h].append((file_index, position))
+        self.stats["files"] += 1
+        self.stats["tokens"] += len(ids)
+        self.stats["fingerprints"] += len(fingerprints)
+
+    def _extend(self, fa: int, pa: int, fb: int, pb: int) -> Tuple[int, int, int]:
+        """أطول تطابق يحتوي الموضعين: (بداية a، بداية b، الطول)"""
+        a, b = self.files[fa].ids, self.files[fb].ids
+        while pa > 0 and pb > 0 and a[pa - 1] == b[pb - 1]:
+            pa -= 1
+            pb -= 1
+        limit = min(len(a) - pa, len(b) - pb)
+        if fa == fb:
+            # تكرار داخل نفس الملف: النسختان لا تتداخلان
+            limit = min(limit, pb - pa)
+        length = 0
+        while length < limit and a[pa + length] == b[pb + length]:
+            length += 1
+        return pa, pb, length
+
+    def matches(self) -> List[Tuple[int, int, int, int, int]]:
+        """أزواج التطابق (ملف a، بداية a، ملف b، بداية b، الطول) بطول min_tokens فأكثر"""
+        found = []
+        # (ملف a، ملف b، الإزاحة) ← نطاقات a المغطاة (تجنب مدّ نفس التطابق من كل بصمة فيه)
+        covered: Dict[Tuple[int, int, int], List[Tuple[int, int]]] = defaultdict(list)
+        for postings in self.index.values():
+            if len(postings) < 2:
+                continue
+            if len(postings) > self.max_postings:
+                self.stats["skipped_common"] += 1
+                continue
+            for i in range(len(postings)):
+                for j in range(i + 1, len(postings)):
+                    (fa, pa), (fb, pb) = sorted((postings[i], postings[j]))
+                    if fa == fb and pa == pb:
+                        continue
+                    diagonal = (fa, fb, pb - pa)
+                    if any(start <= pa < end for start, end in covered[diagonal]):
+                        continue
+                    self.stats["extensions"] += 1
+                    start_a, start_b, length = self._extend(fa, pa, fb, pb)
+                    covered[diagonal].append((start_a, start_a + max(length, 1)))
+                    if length >= self.min_tokens:
+                        found.append((fa, start_a, fb, start_b, length))
+        return found
+
+    def clusters(self) -> List[Dict]:
+        """عناقيد التطابقات مرتبة بالبايتات المكررة (بدون احتساب نفس الجزء مرتين)"""
+        # التطابقات بنفس تسلسل الرموز الموحّدة نسخ من نفس الجزء
+        classes: Dict[Tuple[int, ...], set] = defaultdict(set)
+        for fa, pa, fb, pb, length in self.matches():
+            key = tuple(self.files[fa].ids[pa:pa + length])
+            classes[key].add((fa, pa, pa + length))
+            classes[key].add((fb, pb, pb + length))
+
+        candidates = []
+        for spans in classes.values():
+            sizes = {span: self.files[span[0]].byte_size(span[1], span[2]) for span in spans}
+            candidates.append((sum(sizes.values()) - max(sizes.values()), sizes))
+        candidates.sort(key=lambda c: -c[0])
+
+        # الأجزاء المحتسبة لكل ملف: ظهور داخلها نسخة موجودة أصلاً وليس توفيراً جديداً
+        claimed: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+
+        def is_claimed(file_index: int, start: int, end: int) -> bool:
+            return any(min(end, e) - max(start, s) >= MIN_OVERLAP * (end - start) for s, e in claimed[file_index])
+
+        result = []
+        for _, sizes in candidates:
+            fresh = [span for span in sizes if not is_claimed(*span)]
+            if not fresh:
+                continue
+            fresh_bytes = [sizes[span] for span in fresh]
+            # إن لم تكن أي نسخة محتسبة من قبل تبقى واحدة منها كنسخة مشتركة
+            duplicated = sum(fresh_bytes) - (max(fresh_bytes) if len(fresh) == len(sizes) else 0)
+            if duplicated <= 0:
+                continue
+            for file_index, start, end in fresh:
+                claimed[file_index].append((start, end))
+            result.append(self._cluster(list(sizes), duplicated))
+        result.sort(key=lambda c: (-c["duplicated_bytes"], c["occurrences"][0]["file"]))
+        return result
+
+    def _cluster(self, spans: List[Tuple[int, int, int]], duplicated: int) -> Dict:
+        items = []
+        for file_index, start, end in sorted(spans, key=lambda s: (self.files[s[0]].path, s[1])):
+            source = self.files[file_index]
+            begin, _ = source.span(start, end)
+            line_start = source.source.rfind("\n", 0, begin) + 1
+            first_line = source.source[line_start:].split("\n", 1)[0].strip()
+            items.append({
+                "file": source.path,
+                "start_line": source.tokens[start].line,
+                "end_line": source.tokens[end - 1].line,
+                "tokens": end - start,
+                "bytes": source.byte_size(start, end),
+                "preview": first_line[:80],
+            })
+        return {
+            "occurrences": items,
+            "files": len({item["file"] for item in items}),
+            "tokens": items[0]["tokens"],
+            "total_bytes": sum(item["bytes"] for item in items),
+            # استخراج نسخة مشتركة واحدة يحذف الباقي
+            "duplicated_bytes": duplicated,
+        }
+
+
+def source_files(project_root: Path, source_dir: str = SOURCE_DIR) -> Iterable[Path]:
+    for path in sorted((project_root / source_dir).rglob("*")):
+        relative = path.relative_to(project_root).as_posix()
+        if (path.suffix in SOURCE_SUFFIXES and path.is_file() and relative not in EXCLUDED_FILES
+                and not any(part in relative for part in EXCLUDED_PARTS)):
+            yield path
+
+
+def analyze_project(project_root: Path, source_dir: str = SOURCE_DIR, k: int = K, window: int = WINDOW,
+                    min_tokens: int = MIN_TOKENS, max_postings: int = MAX_POSTINGS, normalize: str = EXACT) -> Dict:
+    started = time.perf_counter()
+    detector = DuplicateDetector(k, window, min_tokens, max_postings, normalize)
+    for path in source_files(project_root, source_dir):
+        try:
+            source = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        detector.add_file(path.relative_to(project_root).as_posix(), source)
+    clusters = detector.clusters()
+    summary = dict(detector.stats)
+    summary.update({
+        "clusters": len(clusters),
+        "duplicated_bytes": sum(c["duplicated_bytes"] for c in clusters),
+        "k": k,
+        "window": window,
+        "min_tokens": min_tokens,
+        "normalize": normalize,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+    })
+    return {"summary": summary, "clusters": clusters}
+
+
+def report_lines(result: Dict, top: int = 15) -> List[str]:
+    """أسطر جاهزة لتقرير التحليل المعماري"""
+    summary = result["summary"]
+    lines = [
+        f"🧬 {summary['files']} ملف، {summary['tokens']:,} رمز، {summary['fingerprints']:,} بصمة "
+        f"({summary['extensions']:,} مقارنة)",
+    ]
+    if not result["clusters"]:
+        lines.append(f"✅ لا توجد أجزاء مكررة بطول {summary['min_tokens']} رمز فأكثر")
+        return lines
+    lines.append(
+        f"📦 {summary['clusters']} عنقود مكرر، {summary['duplicated_bytes'] / 1024:.1f} KB يمكن حذفها باستخراج نسخة مشتركة:"
+    )
+    for cluster in result["clusters"][:top]:
+        lines.append(
+            f"  🧬 {cluster['duplicated_bytes'] / 1024:7.1f} KB  {len(cluster['occurrences'])} نسخ × "
+            f"{cluster['tokens']} رمز في {cluster['files']} ملف"
+        )
+        for item in cluster["occurrences"][:5]:
+            lines.append(f"      {item['file']}:{item['start_line']}-{item['end_line']}  {item['preview']}")
+        if len(cluster["occurrences"]) > 5:
+            lines.append(f"      ... و {len(cluster['occurrences']) - 5} أخرى")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UberFix duplicate code detection (winnowing)")
+    parser.add_argument("--project-root", type=Path, default=DEFAULT_PROJECT_ROOT)
+    parser.add_argument("--source-dir", default=SOURCE_DIR)
+    parser.add_argument("--k", type=int, default=K, help="طول k-gram بالرموز")
+    parser.add_argument("--window", type=int, default=WINDOW, help="نافذة winnowing")
+    parser.add_argument("--min-tokens", type=int, default=MIN_TOKENS, help="أقل طول تطابق يُبلّغ عنه")
+    parser.add_argument("--max-postings", type=int, default=MAX_POSTINGS)
+    parser.add_argument("--normalize", choices=NORMALIZE_MODES, default=EXACT,
+                        help="literals: توحيد النصوص والأرقام، rename: والمعرفات أيضاً (نسخ مع تعديل)")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", type=Path, help="حفظ النتيجة الكاملة (الافتراضي: reports/duplicate_code.json)")
+    args = parser.parse_args()
+
+    try:
+        result = analyze_project(args.project_root, args.source_dir, args.k, args.window, args.min_tokens,
+                                 args.max_postings, args.normalize)
+    except ValueError as e:
+        parser.error(str(e))
+    for line in report_lines(result, args.top):
+        print(line)
+
+    output = args.json or args.project_root / "reports" / "duplicate_code.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"⏱️  {result['summary']['elapsed_seconds']:.2f}s | 📄 {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+UberFix ESLint Report Index
+فهرسة تقرير ESLint بصيغة JSON (ملف ← قاعدة ← نطاقات أسطر)
+
+يُنشأ التقرير بالأمر:
+    npx eslint -f json -o scripts/errors-warnings.json "src/**/*.{ts,tsx}"
+"""
+
+import os
+import sys
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+SEVERITY_ERROR = 2
+SEVERITY_WARNING = 1
+
+
+@dataclass
+class Finding:
+    """رسالة ESLint واحدة (بعد إزالة التكرار)"""
+
+    file: str
+    rule: str
+    line: int
+    column: int
+    end_line: int
+    severity: int
+    message: str
+    fix: Optional[Dict] = None
+    suggestions: List[Dict] = field(default_factory=list)
+    occurrences: int = 1
+
+    @property
+    def key(self) -> Tuple:
+        return (self.file, self.rule, self.line, self.column, self.message)
+
+
+@dataclass
+class FileEntry:
+    """كل ما يخص ملفاً واحداً في التقرير"""
+
+    path: str
+    source: Optional[str] = None
+    errors: int = 0
+    warnings: int = 0
+    # rule -> [(start_line, end_line), ...] مدمجة ومرتبة
+    rules: Dict[str, List[Tuple[int, int]]] = field(default_factory=dict)
+    findings: List[Finding] = field(default_factory=list)
+
+    @property
+    def priority(self) -> Tuple[int, int]:
+        """الأولوية: الأخطاء أولاً ثم عدد التحذيرات"""
+        return (self.errors, self.warnings)
+
+
+class ESLintReportIndex:
+    """فهرس مضغوط لمخرجات ESLint (formatter json)
+
+    يُبنى في مرور واحد على الرسائل، ولا يفترض جذراً ثابتاً للمسارات:
+    تُحفظ المسارات نسبةً إلى ``root`` إن أمكن وإلا كما هي.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root).resolve() if root else None
+        self.files: Dict[str, FileEntry] = {}
+        self.duplicates = 0
+        self._seen: Dict[Tuple, Finding] = {}
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+    @classmethod
+    def load(cls, report_path: Path, root: Optional[Path] = None) -> "ESLintReportIndex":
+        """تحميل ملف تقرير JSON"""
+        with open(report_path, "r", encoding="utf-8") as f:
+            results = json.load(f)
+        index = cls(root)
+        index.ingest(results)
+        return index
+
+    def ingest(self, results: Iterable[Dict]):
+        """إضافة نتائج ESLint (قائمة كائنات filePath/messages)"""
+        for result in results:
+            messages = result.get("messages") or []
+            if not messages:
+                continue
+
+            path = self.normalize_path(result.get("filePath", ""))
+            entry = self.files.get(path)
+            if entry is None:
+                entry = self.files[path] = FileEntry(path=path, source=result.get("source"))
+
+            for msg in messages:
+                self._add_message(entry, msg)
+
+    def _add_message(self, entry: FileEntry, msg: Dict):
+        line = msg.get("line") or 0
+        finding = Finding(
+            file=entry.path,
+            # parsing errors have no ruleId
+            rule=msg.get("ruleId") or "parsing-error",
+            line=line,
+            column=msg.get("column") or 0,
+            end_line=msg.get("endLine") or line,
+            severity=msg.get("severity", SEVERITY_WARNING),
+            message=msg.get("message", ""),
+            fix=msg.get("fix"),
+            suggestions=msg.get("suggestions") or [],
+        )
+
+        existing = self._seen.get(finding.key)
+        if existing is not None:
+            existing.occurrences += 1
+            self.duplicates += 1
+            return
+        self._seen[finding.key] = finding
+
+        self._append(entry, finding)
+
+    @staticmethod
+    def _append(entry: FileEntry, finding: Finding):
+        entry.findings.append(finding)
+        if finding.severity >= SEVERITY_ERROR:
+            entry.errors += 1
+        else:
+            entry.warnings += 1
+
+        ranges = entry.rules.setdefault(finding.rule, [])
+        start, end = finding.line, max(finding.end_line, finding.line)
+        # ESLint يرتب الرسائل حسب السطر، لذا يكفي الدمج مع آخر نطاق
+        if ranges and ranges[-1][0] <= start <= ranges[-1][1] + 1:
+            last_start, last_end = ranges[-1]
+            ranges[-1] = (last_start, max(last_end, end))
+        else:
+            ranges.append((start, end))
+            if len(ranges) > 1 and ranges[-2][0] > start:
+                ranges.sort()
+
+    def replace_findings(self, path: str, findings: List[Finding]):
+        """استبدال رسائل ملف (مثلاً بعد إصلاح جزء منها محلياً)"""
+        if not findings:
+            self.files.pop(path, None)
+            return
+
+        old = self.files.get(path)
+        entry = self.files[path] = FileEntry(path=path, source=old.source if old else None)
+        for finding in sorted(findings, key=lambda f: (f.line, f.column)):
+            self._append(entry, finding)
+
+    def normalize_path(self, file_path: str) -> str:
+        """تحويل المسار إلى مسار نسبي للجذر إن أمكن"""
+        if not file_path:
+            return file_path
+        if self.root is None:
+            return file_path
+        try:
+            return str(Path(file_path).resolve().relative_to(self.root))
+        except ValueError:
+            return file_path
+
+    def resolve(self, path: str) -> Path:
+        """المسار الفعلي على القرص لمدخل في الفهرس"""
+        p = Path(path)
+        if p.is_absolute() or self.root is None:
+            return p
+        return self.root / p
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    @property
+    def total_findings(self) -> int:
+        return sum(len(entry.findings) for entry in self.files.values())
+
+    def prioritized_files(self) -> List[FileEntry]:
+        """الملفات مرتبة حسب الأولوية (الأخطاء ثم التحذيرات ثم المسار)"""
+        return sorted(
+            self.files.values(),
+            key=lambda e: (-e.errors, -e.warnings, e.path),
+        )
+
+    def affected_files(self) -> List[str]:
+        """قائمة المسارات الموجودة فعلاً على القرص"""
+        return [
+            entry.path
+            for entry in self.prioritized_files()
+            if self.resolve(entry.path).exists()
+        ]
+
+    def rule_counts(self) -> Dict[str, int]:
+        """عدد الرسائل لكل قاعدة"""
+        counts: Dict[str, int] = {}
+        for entry in self.files.values():
+            for finding in entry.findings:
+                counts[finding.rule] = counts.get(finding.rule, 0) + 1
+        return counts
+
+    def batches(self, max_files: int = 10, max_findings: int = 200) -> List[List[FileEntry]]:
+        """تقسيم الملفات (حسب الأولوية) إلى دفعات محدودة الحجم"""
+        batches: List[List[FileEntry]] = []
+        current: List[FileEntry] = []
+        current_findings = 0
+
+        for entry in self.prioritized_files():
+            count = len(entry.findings)
+            if current and (
+                len(current) >= max_files or current_findings + count > max_findings
+            ):
+                batches.append(current)
+                current, current_findings = [], 0
+            current.append(entry)
+            current_findings += count
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def render(self, entries: Optional[Iterable[FileEntry]] = None) -> str:
+        """عرض نصي مضغوط للرسائل (للاستخدام داخل الـ prompt)"""
+        entries = self.prioritized_files() if entries is None else entries
+        lines: List[str] = []
+        for entry in entries:
+            lines.append(entry.path)
+            for finding in entry.findings:
+                level = "error" if finding.severity >= SEVERITY_ERROR else "warning"
+                repeat = f" (x{finding.occurrences})" if finding.occurrences > 1 else ""
+                lines.append(
+                    f"  {finding.line}:{finding.column}  {level}  "
+                    f"{finding.message}  {finding.rule}{repeat}"
+                )
+            lines.append("")
+        return "\n".join(lines).rstrip()
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: eslint_report.py <eslint-report.json> [project-root]")
+        sys.exit(1)
+
+    root = Path(sys.argv[2]) if len(sys.argv) > 2 else Path(os.getcwd())
+    index = ESLintReportIndex.load(Path(sys.argv[1]), root)
+
+    print(f"📁 الملفات: {len(index.files)}")
+    print(f"⚠️  الرسائل: {index.total_findings} (مكرر: {index.duplicates})")
+    for rule, count in sorted(index.rule_counts().items(), key=lambda kv: -kv[1]):
+        print(f"  {count:5d}  {rule}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+UberFix Import Graph
+رسم بياني للاستيرادات بين ملفات src/ مع حل المسارات النسبية والاختصار @/
+
+يميّز بين ثلاثة أنواع من الحواف:
+- static: import/export ... from (تدخل في الحزمة الأولية)
+- dynamic: import("...") (تقسيم الكود / React.lazy)
+- type: import type (تُحذف عند الترجمة)
+"""
+
+import os
+import re
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+SOURCE_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs")
+RESOLVE_EXTENSIONS = SOURCE_EXTENSIONS + (".json", ".css", ".png", ".jpg", ".jpeg", ".svg", ".webp", ".gif")
+IGNORE_DIRS = {"node_modules", "dist", "build", ".git", "backups"}
+
+STATIC = "static"
+DYNAMIC = "dynamic"
+TYPE = "type"
+
+# نفس نمط ملفات الاختبار في architecture_analyzer
+TEST_FILE_RE = re.compile(r"\.(test|spec)\.(ts|tsx|js|jsx)$")
+
+_STATIC_RE = re.compile(
+    r"(?:^|[;}\n])[ \t]*(?:import|export)\s+(type\s+)?"
+    r"(?:[\w$*{}\s,]+?\s+from\s+)?['\"]([^'\"\n]+)['\"]"
+)
+_DYNAMIC_RE = re.compile(r"\bimport\s*\(\s*['\"]([^'\"\n]+)['\"]\s*\)")
+_REQUIRE_RE = re.compile(r"\brequire\s*\(\s*['\"]([^'\"\n]+)['\"]\s*\)")
+
+
+def scan_imports(content: str) -> List[Tuple[str, str]]:
+    """استخراج (المصدر، النوع) لكل استيراد في الملف"""
+    found: List[Tuple[str, str]] = []
+    for m in _STATIC_RE.finditer(content):
+        type_only, spec = m.group(1), m.group(2)
+        found.append((spec, TYPE if type_only else STATIC))
+    for m in _DYNAMIC_RE.finditer(content):
+        found.append((m.group(1), DYNAMIC))
+    for m in _REQUIRE_RE.finditer(content):
+        found.append((m.group(1), STATIC))
+    return found
+
+
+def package_name(spec: str) -> str:
+    """اسم الحزمة من مصدر خارجي: react-dom/client → react-dom ، @scope/pkg/x → @scope/pkg"""
+    parts = spec.split("/")
+    if spec.startswith("@") and len(parts) > 1:
+        return "/".join(parts[:2])
+    return parts[0]
+
+
+class ImportGraph:
+    """حواف الاستيراد بين الملفات (مسارات نسبية لجذر المشروع)"""
+
+    def __init__(self, project_root: Path, alias_root: str = "src"):
+        self.project_root = Path(project_root)
+        self.alias_root = alias_root
+        self.files: Set[str] = set()
+        self.sizes: Dict[str, int] = {}
+        # file -> [(target, kind)]
+        self.edges: Dict[str, List[Tuple[str, str]]] = {}
+        # file -> [(package, kind)]
+        self.externals: Dict[str, List[Tuple[str, str]]] = {}
+        self.unresolved: Dict[str, List[str]] = {}
+        self._reverse: Optional[Dict[str, List[Tuple[str, str]]]] = None
+
+    @classmethod
+    def build(cls, project_root: Path, roots: Iterable[str] = ("src",)) -> "ImportGraph":
+        """مسح المجلدات وبناء الرسم البياني"""
+        graph = cls(project_root)
+        contents: Dict[str, str] = {}
+
+        for root in roots:
+            base = graph.project_root / root
+            for dirpath, dirs, names in os.walk(base):
+                dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+                for name in names:
+                    path = Path(dirpath) / name
+                    rel = path.relative_to(graph.project_root).as_posix()
+                    if name.endswith(RESOLVE_EXTENSIONS):
+                        graph.files.add(rel)
+                        graph.sizes[rel] = path.stat().st_size
+                    if name.endswith(SOURCE_EXTENSIONS):
+                        try:
+                            with open(path, "r", encoding="utf-8") as f:
+                                contents[rel] = f.read()
+                        except (OSError, UnicodeDecodeError):
+                            continue
+
+        for rel, content in contents.items():
+            graph.add_file(rel, content)
+        return graph
+
+    def add_file(self, rel: str, content: str):
+        edges: List[Tuple[str, str]] = []
+        externals: List[Tuple[str, str]] = []
+        for spec, kind in scan_imports(content):
+            if spec.startswith((".", "@/", "/")):
+                target = self.resolve(rel, spec)
+                if target:
+                    edges.append((target, kind))
+                else:
+                    self.unresolved.setdefault(rel, []).append(spec)
+            else:
+                externals.append((package_name(spec), kind))
+        self.files.add(rel)
+        self.edges[rel] = edges
+        self.externals[rel] = externals
+        self._reverse = None
+
+    def resolve(self, importer: str, spec: str) -> Optional[str]:
+        """حل مصدر محلي إلى مسار ملف داخل المشروع"""
+        spec = spec.split("?")[0]
+        if spec.startswith("@/"):
+            base = f"{self.alias_root}/{spec[2:]}"
+        elif spec.startswith("/"):
+            base = f"public{spec}"
+        else:
+            base = os.path.normpath(os.path.join(os.path.dirname(importer), spec))
+        base = base.replace(os.sep, "/")
+
+        if base in self.files:
+            return base
+        for ext in RESOLVE_EXTENSIONS:
+            if base + ext in self.files:
+                return base + ext
+        for ext in SOURCE_EXTENSIONS:
+            candidate = f"{base}/index{ext}"
+            if candidate in self.files:
+                return candidate
+        return None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def reverse(self) -> Dict[str, List[Tuple[str, str]]]:
+        """target -> [(importer, kind)]"""
+        if self._reverse is None:
+            reverse: Dict[str, List[Tuple[str, str]]] = {}
+            for source, edges in self.edges.items():
+                for target, kind in edges:
+                    reverse.setdefault(target, []).append((source, kind))
+            self._reverse = reverse
+        return self._reverse
+
+    def closure(self, start: str, kinds: Iterable[str] = (STATIC,)) -> Set[str]:
+        """كل الملفات التي يصل إليها start عبر حواف من الأنواع المحددة (يتضمن start)"""
+        kinds = set(kinds)
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            for target, kind in self.edges.get(current, ()):
+                if kind in kinds and target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def dependents(self, files: Iterable[str], kinds: Iterable[str] = (STATIC, DYNAMIC, TYPE)) -> Set[str]:
+        """كل الملفات التي تستورد (مباشرة أو بشكل متعدٍ) أحد الملفات المعطاة"""
+        kinds = set(kinds)
+        reverse = self.reverse()
+        seen = set(files)
+        queue = deque(seen)
+        while queue:
+            current = queue.popleft()
+            for importer, kind in reverse.get(current, ()):
+                if kind in kinds and importer not in seen:
+                    seen.add(importer)
+                    queue.append(importer)
+        return seen
+
+    def affected_tests(self, changed: Iterable[str]) -> List[str]:
+        """ملفات الاختبار المتأثرة بتغيير الملفات المعطاة"""
+        return sorted(f for f in self.dependents(changed) if TEST_FILE_RE.search(f))
+
+
+def main():
+    root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("/opt/UberFix")
+    graph = ImportGraph.build(root)
+    edges = sum(len(e) for e in graph.edges.values())
+    print(f"📁 الملفات: {len(graph.files)}  🔗 الحواف: {edges}")
+    unresolved = sum(len(v) for v in graph.unresolved.values())
+    if unresolved:
+        print(f"⚠️  استيرادات غير محلولة: {unresolved}")
+    for changed in sys.argv[2:]:
+        print(f"🧪 {changed}:")
+        for test in graph.affected_tests([changed]):
+            print(f"  {test}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+UberFix Import Weight
+حساب الوزن المتعدي لكل وحدة في src/: حجم كل الملفات التي تصل إليها عبر الاستيراد الثابت
+مضافاً إليه وزن حزم node_modules المستخدمة في هذا الإغلاق
+
+الاستيرادات الديناميكية (React.lazy) واستيرادات type لا تدخل في الوزن لأنها
+لا تُحمّل مع الحزمة الأولية.
+
+الاستخدام:
+    python3 scripts/import_weight.py --project-root /opt/UberFix
+    python3 scripts/import_weight.py --top 30 --json reports/import_weight.json
+"""
+
+import os
+import json
+import time
+import argparse
+import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from import_graph import STATIC, ImportGraph
+
+
+DEFAULT_PROJECT_ROOT = Path("/opt/UberFix")
+ENTRY_POINTS = ("src/main.tsx",)
+JS_EXTENSIONS = (".js", ".mjs", ".cjs")
+# مجلدات داخل الحزم لا تُشحن للمتصفح
+PACKAGE_SKIP_DIRS = {"node_modules", "test", "tests", "__tests__", "docs", "example", "examples", "bin"}
+
+
+class PackageWeights:
+    """وزن حزم node_modules (ملفات JS في مجلد نقطة الدخول) مع تخزين مؤقت على القرص"""
+
+    def __init__(self, project_root: Path, cache_path: Optional[Path] = None):
+        self.project_root = Path(project_root)
+        self.node_modules = self.project_root / "node_modules"
+        self.cache_path = cache_path or self.project_root / "reports" / "package_weights.json"
+        self.cache: Dict[str, Dict] = {}
+        self._dirty = False
+        self._closures: Dict[str, Set[str]] = {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                self.cache = json.load(f)
+        except (OSError, ValueError):
+            self.cache = {}
+
+    @property
+    def available(self) -> bool:
+        return self.node_modules.is_dir()
+
+    def locate(self, name: str, from_dir: Optional[Path] = None) -> Optional[Path]:
+        """حل مجلد الحزمة بنفس ترتيب Node (يدعم تخطيط pnpm عبر المسار الحقيقي)"""
+        current = from_dir or self.project_root
+        while True:
+            candidate = current / "node_modules" / name
+            if (candidate / "package.json").exists():
+                return candidate.resolve()
+            if current == current.parent:
+                return None
+            current = current.parent
+
+    def info(self, package_dir: Path) -> Dict:
+        """الحجم والتبعيات لحزمة واحدة (من الذاكرة المؤقتة إن لم تتغير النسخة)"""
+        key = str(package_dir)
+        with open(package_dir / "package.json", "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        version = manifest.get("version", "")
+        cached = self.cache.get(key)
+        if cached and cached.get("version") == version:
+            return cached
+
+        entry_dir = self._entry_dir(package_dir, manifest)
+        info = {
+            "name": manifest.get("name", package_dir.name),
+            "version": version,
+            "bytes": self._js_bytes(entry_dir),
+            "dependencies": sorted(manifest.get("dependencies", {})),
+        }
+        self.cache[key] = info
+        self._dirty = True
+        return info
+
+    def closure(self, name: str) -> Set[str]:
+        """مسارات الحزمة وكل تبعياتها المتعدية"""
+        if name in self._closures:
+            return self._closures[name]
+        root = self.locate(name)
+        seen: Set[str] = set()
+        stack = [root] if root else []
+        while stack:
+            package_dir = stack.pop()
+            key = str(package_dir)
+            if key in seen:
+                continue
+            seen.add(key)
+            try:
+                deps = self.info(package_dir)["dependencies"]
+            except (OSError, ValueError):
+                continue
+            for dep in deps:
+                dep_dir = self.locate(dep, package_dir)
+                if dep_dir and str(dep_dir) not in seen:
+                    stack.append(dep_dir)
+        self._closures[name] = seen
+        return seen
+
+    def bytes_of(self, package_dirs: Iterable[str]) -> int:
+        return sum(self.cache[key]["bytes"] for key in package_dirs if key in self.cache)
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump(self.cache, f)
+        self._dirty = False
+
+    @staticmethod
+    def _entry_dir(package_dir: Path, manifest: Dict) -> Path:
+        """مجلد نسخة ESM إن وجدت (حتى لا تُحسب نسختا cjs و esm معاً)"""
+        entry = manifest.get("module")
+        exports = manifest.get("exports")
+        if not entry and isinstance(exports, dict):
+            root_export = exports.get(".", exports)
+            if isinstance(root_export, dict):
+                for key in ("import", "browser", "default", "require"):
+                    value = root_export.get(key)
+                    if isinstance(value, dict):
+                        value = value.get("default")
+                    if isinstance(value, str):
+                        entry = value
+                        break
+            elif isinstance(root_export, str):
+                entry = root_export
+        entry = entry or manifest.get("main") or "index.js"
+        entry_dir = (package_dir / entry).parent
+        return entry_dir if entry_dir.is_dir() else package_dir
+
+    @staticmethod
+    def _js_bytes(directory: Path) -> int:
+        total = 0
+        for dirpath, dirs, names in os.walk(directory):
+            dirs[:] = [d for d in dirs if d not in PACKAGE_SKIP_DIRS]
+            for name in names:
+                if name.endswith(JS_EXTENSIONS) and not name.endswith((".d.ts", ".min.js")):
+                    total += os.path.getsize(os.path.join(dirpath, name))
+        return total
+
+
+class ImportWeights:
+    """الإغلاق المتعدي للاستيراد الثابت لكل ملف ووزنه"""
+
+    def __init__(self, graph: ImportGraph, packages: PackageWeights):
+        self.graph = graph
+        self.packages = packages
+        self._closures: Dict[str, Set[str]] = {}
+
+    def closure(self, path: str) -> Set[str]:
+        if path not in self._closures:
+            self._closures[path] = self.graph.closure(path, kinds=(STATIC,))
+        return self._closures[path]
+
+    def external_packages(self, files: Iterable[str]) -> Set[str]:
+        """أسماء الحزم الخارجية المستوردة استيراداً ثابتاً من هذه الملفات"""
+        names = set()
+        for path in files:
+            for name, kind in self.graph.externals.get(path, ()):
+                if kind == STATIC:
+                    names.add(name)
+        return names
+
+    def weigh(self, path: str) -> Dict:
+        files = self.closure(path)
+        source_bytes = sum(self.graph.sizes.get(f, 0) for f in files)
+        names = self.external_packages(files)
+        package_dirs: Set[str] = set()
+        if self.packages.available:
+            for name in names:
+                package_dirs |= self.packages.closure(name)
+        package_bytes = self.packages.bytes_of(package_dirs)
+        return {
+            "path": path,
+            "files": len(files),
+            "source_bytes": source_bytes,
+            "packages": sorted(names),
+            "package_bytes": package_bytes,
+            "total_bytes": source_bytes + package_bytes,
+        }
+
+    def rank(self, paths: Iterable[str]) -> List[Dict]:
+        return sorted((self.weigh(p) for p in paths), key=lambda w: -w["total_bytes"])
+
+    def package_breakdown(self, path: str) -> List[Tuple[str, int]]:
+        """وزن كل حزمة مباشرة (مع تبعياتها) في إغلاق ملف واحد"""
+        if not self.packages.available:
+            return []
+        rows = [
+            (name, self.packages.bytes_of(self.packages.closure(name)))
+            for name in self.external_packages(self.closure(path))
+        ]
+        return sorted(rows, key=lambda row: -row[1])
+
+
+def _kb(size: int) -> str:
+    return f"{size / 1024:9.1f} KB"
+
+
+def build_report(weights: ImportWeights, entries: List[Dict], ranked: List[Dict], pages: List[Dict], top: int) -> str:
+    report = [
+        "=" * 80,
+        "⚖️  تقرير وزن الاستيرادات - UberFix",
+        "=" * 80,
+        f"وقت التوليد: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "",
+    ]
+    if not weights.packages.available:
+        report.extend(["⚠️  node_modules غير موجود - أوزان الحزم الخارجية = 0 (شغّل pnpm install)", ""])
+
+    report.extend(["🚀 الحمل الأولي (نقاط الدخول):", "-" * 40])
+    for entry in entries:
+        report.append(
+            f"  {entry['path']}: {entry['files']} ملف، المصدر {_kb(entry['source_bytes'])}، "
+            f"الحزم {_kb(entry['package_bytes'])}، الإجمالي {_kb(entry['total_bytes'])}"
+        )
+        for name, size in weights.package_breakdown(entry["path"])[:top]:
+            report.append(f"    📦 {_kb(size)}  {name}")
+    report.append("")
+
+    report.extend([f"📄 أثقل {min(top, len(pages))} صفحات (src/pages):", "-" * 40])
+    for item in pages[:top]:
+        report.append(f"  {_kb(item['total_bytes'])}  {item['files']:4d} ملف  {item['path']}")
+    report.append("")
+
+    report.extend([f"🧱 أثقل {min(top, len(ranked))} وحدات:", "-" * 40])
+    for item in ranked[:top]:
+        report.append(
+            f"  {_kb(item['total_bytes'])}  (مصدر {_kb(item['source_bytes']).strip()}، "
+            f"حزم {_kb(item['package_bytes']).strip()})  {item['path']}"
+        )
+    report.extend(["", "=" * 80])
+    return "\n".join(report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UberFix transitive import weight")
+    parser.add_argument("--project-root", type=Path, default=DEFAULT_PROJECT_ROOT)
+    parser.add_argument("--entry", action="append", help="نقطة دخول (الافتراضي: src/main.tsx)")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", type=Path, help="حفظ النتائج الكاملة بصيغة JSON")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    graph = ImportGraph.build(args.project_root)
+    packages = PackageWeights(args.project_root)
+    weights = ImportWeights(graph, packages)
+
+    modules = sorted(p for p in graph.edges)
+    ranked = weights.rank(modules)
+    pages = [item for item in ranked if item["path"].startswith("src/pages/")]
+    entries = [weights.weigh(e) for e in (args.entry or ENTRY_POINTS) if e in graph.edges]
+    packages.save()
+
+    report = build_report(weights, entries, ranked, pages, args.top)
+    reports_dir = args.project_root / "reports"
+    reports_dir.mkdir(exist_ok=True)
+    report_path = reports_dir / f"import_weight_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    with open(report_path, "w", encoding="utf-8") as f:
+        f.write(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"entries": entries, "modules": ranked}, f, ensure_ascii=False, indent=1)
+
+    print(report)
+    print(f"\n📄 التقرير: {report_path}")
+    print(f"⏱️  {len(modules)} وحدة في {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+UberFix Lint Client
+عميل Python لعامل الفحص الدائم scripts/lint_worker.mjs (ESLint + TypeScript)
+
+يتصل بالعامل عبر Unix socket ويشغّله في الخلفية عند أول طلب إن لم يكن يعمل،
+فتصبح كل جولة تحقق بعدها طلباً واحداً بأجزاء من الثانية بدلاً من تشغيل
+npx eslint / tsc من جديد. العامل يخرج وحده بعد 15 دقيقة خمول.
+
+الاستخدام:
+    python3 scripts/lint_client.py --project-root /opt/UberFix check src/App.tsx src/main.tsx
+    python3 scripts/lint_client.py status
+    python3 scripts/lint_client.py stop
+"""
+
+import json
+import time
+import shutil
+import socket
+import argparse
+import itertools
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+DEFAULT_PROJECT_ROOT = Path("/opt/UberFix")
+WORKER_SCRIPT = Path(__file__).resolve().parent / "lint_worker.mjs"
+STARTUP_TIMEOUT = 60
+REQUEST_TIMEOUT = 120
+
+
+class LintWorkerError(RuntimeError):
+    """العامل غير متاح أو رد بخطأ"""
+
+
+class LintWorkerClient:
+    """طلبات lint/typecheck لملفات محددة عبر العامل الدائم"""
+
+    def __init__(self, project_root: Path, socket_path: Optional[Path] = None, autostart: bool = True):
+        self.project_root = Path(project_root).resolve()
+        self.socket_path = socket_path or self.project_root / "node_modules" / ".cache" / "uberfix" / "lint-worker.sock"
+        self.autostart = autostart
+        self._ids = itertools.count(1)
+        self._sock: Optional[socket.socket] = None
+        self._buffer = b""
+
+    @property
+    def available(self) -> bool:
+        """Node مثبت و eslint موجود في node_modules (وإلا لا فائدة من تشغيل العامل)"""
+        return shutil.which("node") is not None and (self.project_root / "node_modules" / "eslint").exists()
+
+    def start(self):
+        """تشغيل العامل في الخلفية (جلسة مستقلة حتى يعيش بعد انتهاء هذه العملية)"""
+        log_path = self.socket_path.with_suffix(".log")
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "ab") as log:
+            subprocess.Popen(
+                ["node", str(WORKER_SCRIPT), "--project-root", str(self.project_root), "--socket", str(self.socket_path)],
+                cwd=self.project_root,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
+
+    def connect(self):
+        if self._sock is not None:
+            return
+        try:
+            self._sock = self._open()
+            return
+        except OSError:
+            if not self.autostart:
+                raise LintWorkerError(f"عامل الفحص لا يعمل: {self.socket_path}")
+        self.start()
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
+            try:
+                self._sock = self._open()
+                return
+            except OSError:
+                continue
+        raise LintWorkerError(f"لم يبدأ عامل الفحص خلال {STARTUP_TIMEOUT}s (انظر {self.socket_path.with_suffix('.log')})")
+
+    def _open(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(REQUEST_TIMEOUT)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            self._buffer = b""
+
+    def request(self, op: str, files: Optional[List[str]] = None, contents: Optional[Dict[str, str]] = None) -> Dict:
+        self.connect()
+        message = {"id": next(self._ids), "op": op}
+        if files is not None:
+            message["files"] = [self._relative(f) for f in files]
+        if contents:
+            message["contents"] = {self._relative(f): text for f, text in contents.items()}
+        try:
+            self._sock.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+            while b"\n" not in self._buffer:
+                chunk = self._sock.recv(65536)
+                if not chunk:
+                    raise LintWorkerError("أغلق عامل الفحص الاتصال")
+                self._buffer += chunk
+        except OSError as e:
+            self.close()
+            raise LintWorkerError(f"فشل الاتصال بعامل الفحص: {e}") from e
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise LintWorkerError(response.get("error", "unknown error"))
+        return response
+
+    def ping(self) -> Dict:
+        return self.request("ping")
+
+    def lint(self, files: List[str], contents: Optional[Dict[str, str]] = None) -> List[Dict]:
+        return self.request("lint", files, contents)["results"]
+
+    def typecheck(self, files: List[str], contents: Optional[Dict[str, str]] = None) -> List[Dict]:
+        return self.request("typecheck", files, contents)["results"]
+
+    def check(self, files: List[str], contents: Optional[Dict[str, str]] = None) -> List[Dict]:
+        """ESLint و TypeScript معاً: نتيجة واحدة لكل ملف"""
+        return self.request("check", files, contents)["results"]
+
+    def shutdown(self) -> bool:
+        """إيقاف العامل إن كان يعمل (بدون تشغيله)"""
+        autostart, self.autostart = self.autostart, False
+        try:
+            self.request("shutdown")
+            return True
+        except LintWorkerError:
+            return False
+        finally:
+            self.autostart = autostart
+            self.close()
+
+    def _relative(self, path) -> str:
+        path = Path(path)
+        if path.is_absolute():
+            try:
+                return path.resolve().relative_to(self.project_root).as_posix()
+            except ValueError:
+                return str(path)
+        return path.as_posix()
+
+    def __enter__(self) -> "LintWorkerClient":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def count_errors(results: List[Dict]) -> int:
+    return sum(1 for r in results for m in r["messages"] if m["severity"] == 2)
+
+
+def unchecked(results: List[Dict]) -> int:
+    """عدد الملفات التي تعذّر فحصها بأداة واحدة على الأقل (eslint/typescript غير مثبت)"""
+    return sum(1 for r in results if r.get("errors"))
+
+
+def format_results(results: List[Dict]) -> List[str]:
+    lines = []
+    for result in results:
+        for error in result.get("errors", []):
+            lines.append(f"⚠️  {result['file']}: {error}")
+        for m in result["messages"]:
+            icon = "❌" if m["severity"] == 2 else "⚠️ "
+            lines.append(f"{icon} {result['file']}:{m['line']}:{m['column']} [{m['rule'] or m['source']}] {m['message']}")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UberFix persistent lint/type-check worker client")
+    parser.add_argument("--project-root", type=Path, default=DEFAULT_PROJECT_ROOT)
+    parser.add_argument("--socket", type=Path, default=None)
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name in ("check", "lint", "typecheck"):
+        sub.add_parser(name).add_argument("files", nargs="+")
+    sub.add_parser("start", help="تشغيل العامل وانتظار جاهزيته")
+    sub.add_parser("status")
+    sub.add_parser("stop")
+    args = parser.parse_args()
+
+    client = LintWorkerClient(args.project_root, args.socket, autostart=args.command not in ("status", "stop"))
+    try:
+        if args.command == "stop":
+            print("🛑 تم إيقاف عامل الفحص" if client.shutdown() else "ℹ️  عامل الفحص لا يعمل")
+            return
+        if args.command in ("start", "status"):
+            info = client.ping()
+            print(f"✅ عامل الفحص يعمل (pid {info['pid']}) - eslint: {info['eslint']} | typescript: {info['typescript']}")
+            return
+
+        started = time.perf_counter()
+        results = getattr(client, args.command)(args.files)
+        elapsed = (time.perf_counter() - started) * 1000
+        for line in format_results(results):
+            print(line)
+        errors = count_errors(results)
+        print(f"{'❌' if errors else '✅'} {len(args.files)} ملف، {errors} خطأ ({elapsed:.0f} ms)")
+        if not errors and unchecked(results):
+            print("⚠️  بعض الأدوات غير متاحة - النتيجة غير مكتملة (pnpm install)")
+            raise SystemExit(2)
+        raise SystemExit(1 if errors else 0)
+    except LintWorkerError as e:
+        print(f"❌ {e}")
+        raise SystemExit(2)
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env node
+/**
+ * 🧹 عامل فحص دائم (ESLint + TypeScript) - UberFix
+ *
+ * يبقى دافئاً في الخلفية ويستقبل طلبات فحص ملفات محددة عبر Unix socket
+ * بدلاً من تشغيل npx eslint / tsc من جديد في كل جولة تحقق:
+ *  - ESLint: نسخة واحدة من ESLint تحتفظ بالإعدادات والـ parser محمّلة
+ *  - TypeScript: LanguageService تدريجي (يُعاد فحص ما تغيّر فقط حسب mtime)
+ *
+ * البروتوكول: سطر JSON لكل طلب وسطر JSON لكل رد
+ *   → {"id": 1, "op": "check", "files": ["src/App.tsx"]}
+ *   ← {"id": 1, "ok": true, "results": [{"file": "...", "messages": [...]}], "elapsed_ms": 12.3}
+ *   العمليات: ping | lint | typecheck | check | shutdown
+ *   "contents": {"src/App.tsx": "..."} لفحص محتوى لم يُكتب على القرص بعد
+ *
+ * التشغيل (يشغّله scripts/lint_client.py تلقائياً عند الحاجة):
+ *   node scripts/lint_worker.mjs --project-root /opt/UberFix
+ */
+import { createRequire } from 'node:module';
+import { existsSync, mkdirSync, rmSync, statSync } from 'node:fs';
+import net from 'node:net';
+import path from 'node:path';
+import { performance } from 'node:perf_hooks';
+
+// ====== الإعدادات ======
+const args = process.argv.slice(2);
+const option = (name, fallback) => {
+  const index = args.indexOf(name);
+  return index >= 0 && args[index + 1] ? args[index + 1] : fallback;
+};
+
+const PROJECT_ROOT = path.resolve(option('--project-root', process.cwd()));
+const SOCKET_PATH = path.resolve(
+  option('--socket', path.join(PROJECT_ROOT, 'node_modules', '.cache', 'uberfix', 'lint-worker.sock')),
+);
+// الخروج تلقائياً بعد فترة خمول حتى لا يبقى العامل معلقاً
+const IDLE_MINUTES = Number(option('--idle-minutes', '15'));
+const TSCONFIG_CANDIDATES = ['tsconfig.app.json', 'tsconfig.json'];
+const TS_EXTENSIONS = new Set(['.ts', '.tsx', '.mts', '.cts']);
+
+const projectRequire = createRequire(path.join(PROJECT_ROOT, 'package.json'));
+
+const log = (msg) => console.log(`[lint-worker] ${msg}`);
+
+// ====== ESLint ======
+let eslintInstance = null;
+let eslintError = null;
+
+async function getESLint() {
+  if (eslintInstance || eslintError) return eslintInstance;
+  try {
+    const { ESLint } = projectRequire('eslint');
+    eslintInstance = new ESLint({ cwd: PROJECT_ROOT, cache: false });
+  } catch (error) {
+    eslintError = `eslint unavailable: ${error.message.split('\n')[0]}`;
+  }
+  return eslintInstance;
+}
+
+async function lintFiles(files, contents) {
+  const eslint = await getESLint();
+  if (!eslint) return files.map((file) => ({ file, error: eslintError, messages: [] }));
+
+  const results = [];
+  for (const file of files) {
+    const absolute = path.resolve(PROJECT_ROOT, file);
+    if (await eslint.isPathIgnored(absolute)) {
+      results.push({ file, ignored: true, messages: [] });
+      continue;
+    }
+    const reports = contents[file] !== undefined
+      ? await eslint.lintText(contents[file], { filePath: absolute })
+      : await eslint.lintFiles([absolute]);
+    const messages = reports.flatMap((report) => report.messages.map((m) => ({
+      source: 'eslint',
+      rule: m.ruleId,
+      severity: m.severity,
+      line: m.line,
+      column: m.column,
+      message: m.message,
+    })));
+    results.push({ file, messages });
+  }
+  return results;
+}
+
+// ====== TypeScript ======
+let tsService = null;
+let tsError = null;
+let ts = null;
+const overrides = new Map();
+let overrideVersion = 0;
+
+function getTypeScript() {
+  if (tsService || tsError) return tsService;
+  try {
+    ts = projectRequire('typescript');
+    const configName = TSCONFIG_CANDIDATES.find((name) => existsSync(path.join(PROJECT_ROOT, name)));
+    if (!configName) throw new Error('tsconfig not found');
+    const parsed = ts.getParsedCommandLineOfConfigFile(path.join(PROJECT_ROOT, configName), {}, {
+      ...ts.sys,
+      onUnRecoverableConfigFileDiagnostic: (d) => {
+        throw new Error(ts.flattenDiagnosticMessageText(d.messageText, '\n'));
+      },
+    });
+    const rootNames = new Set(parsed.fileNames);
+    const host = {
+      getScriptFileNames: () => [...rootNames, ...overrides.keys()],
+      getScriptVersion: (fileName) => {
+        const override = overrides.get(fileName);
+        if (override) return `o${override.version}`;
+        try {
+          return String(statSync(fileName).mtimeMs);
+        } catch {
+          return '0';
+        }
+      },
+      getScriptSnapshot: (fileName) => {
+        const override = overrides.get(fileName);
+        const text = override ? override.text : ts.sys.readFile(fileName);
+        return text === undefined ? undefined : ts.ScriptSnapshot.fromString(text);
+      },
+      getCurrentDirectory: () => PROJECT_ROOT,
+      getCompilationSettings: () => parsed.options,
+      getDefaultLibFileName: (options) => ts.getDefaultLibFilePath(options),
+      fileExists: (fileName) => overrides.has(fileName) || ts.sys.fileExists(fileName),
+      readFile: (fileName) => overrides.get(fileName)?.text ?? ts.sys.readFile(fileName),
+      readDirectory: ts.sys.readDirectory,
+      directoryExists: ts.sys.directoryExists,
+      getDirectories: ts.sys.getDirectories,
+    };
+    tsService = ts.createLanguageService(host, ts.createDocumentRegistry());
+  } catch (error) {
+    tsError = `typescript unavailable: ${error.message.split('\n')[0]}`;
+  }
+  return tsService;
+}
+
+function typecheckFiles(files, contents) {
+  const service = getTypeScript();
+  if (!service) return files.map((file) => ({ file, error: tsError, messages: [] }));
+
+  overrides.clear();
+  for (const [file, text] of Object.entries(contents)) {
+    overrides.set(path.resolve(PROJECT_ROOT, file), { text, version: ++overrideVersion });
+  }
+
+  return files.map((file) => {
+    const absolute = path.resolve(PROJECT_ROOT, file);
+    if (!TS_EXTENSIONS.has(path.extname(absolute))) return { file, ignored: true, messages: [] };
+    const diagnostics = [
+      ...service.getSyntacticDiagnostics(absolute),
+      ...service.getSemanticDiagnostics(absolute),
+    ];
+    const messages = diagnostics.map((d) => {
+      const position = d.file && d.start !== undefined
+        ? d.file.getLineAndCharacterOfPosition(d.start)
+        : { line: 0, character: 0 };
+      return {
+        source: 'tsc',
+        rule: `TS${d.code}`,
+        severity: d.category === ts.DiagnosticCategory.Error ? 2 : 1,
+        line: position.line + 1,
+        column: position.character + 1,
+        message: ts.flattenDiagnosticMessageText(d.messageText, '\n'),
+      };
+    });
+    return { file, messages };
+  });
+}
+
+// ====== معالجة الطلبات ======
+function merge(...groups) {
+  const byFile = new Map();
+  for (const group of groups) {
+    for (const result of group) {
+      const current = byFile.get(result.file) ?? { file: result.file, messages: [], ignoredBy: 0 };
+      current.messages.push(...result.messages);
+      if (result.error) current.errors = [...(current.errors ?? []), result.error];
+      if (result.ignored) current.ignoredBy += 1;
+      byFile.set(result.file, current);
+    }
+  }
+  // الملف متجاهَل فقط إذا تجاهلته كل الأدوات (ملف .js مثلاً يُفحص بـ ESLint فقط)
+  return [...byFile.values()].map(({ ignoredBy, ...result }) => (
+    ignoredBy === groups.length ? { ...result, ignored: true } : result
+  ));
+}
+
+async function handle(request) {
+  const relative = (file) => path.relative(PROJECT_ROOT, path.resolve(PROJECT_ROOT, file));
+  const files = (request.files ?? []).map(relative);
+  const contents = Object.fromEntries(
+    Object.entries(request.contents ?? {}).map(([file, text]) => [relative(file), text]),
+  );
+  switch (request.op) {
+    case 'ping':
+      return {
+        pid: process.pid,
+        project_root: PROJECT_ROOT,
+        eslint: Boolean(await getESLint()) || eslintError,
+        typescript: Boolean(getTypeScript()) || tsError,
+      };
+    case 'lint':
+      return { results: await lintFiles(files, contents) };
+    case 'typecheck':
+      return { results: typecheckFiles(files, contents) };
+    case 'check':
+      return { results: merge(await lintFiles(files, contents), typecheckFiles(files, contents)) };
+    case 'shutdown':
+      setImmediate(shutdown);
+      return {};
+    default:
+      throw new Error(`unknown op: ${request.op}`);
+  }
+}
+
+// الطلبات تُنفّذ بالتتابع: ESLint و LanguageService ليسا آمنين للتداخل
+let queue = Promise.resolve();
+let idleTimer = null;
+
+function touch() {
+  clearTimeout(idleTimer);
+  if (IDLE_MINUTES > 0) idleTimer = setTimeout(shutdown, IDLE_MINUTES * 60 * 1000).unref();
+}
+
+function respond(socket, line) {
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (error) {
+    socket.write(`${JSON.stringify({ ok: false, error: `invalid json: ${error.message}` })}\n`);
+    return;
+  }
+  queue = queue.then(async () => {
+    touch();
+    const started = performance.now();
+    try {
+      const result = await handle(request);
+      const elapsed = Math.round((performance.now() - started) * 10) / 10;
+      socket.write(`${JSON.stringify({ id: request.id, ok: true, ...result, elapsed_ms: elapsed })}\n`);
+    } catch (error) {
+      socket.write(`${JSON.stringify({ id: request.id, ok: false, error: error.message })}\n`);
+    }
+  });
+}
+
+const server = net.createServer((socket) => {
+  socket.setEncoding('utf8');
+  let buffer = '';
+  socket.on('data', (chunk) => {
+    buffer += chunk;
+    let newline;
+    while ((newline = buffer.indexOf('\n')) >= 0) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      if (line) respond(socket, line);
+    }
+  });
+  socket.on('error', () => socket.destroy());
+});
+
+function shutdown() {
+  server.close();
+  rmSync(SOCKET_PATH, { force: true });
+  log('stopped');
+  process.exit(0);
+}
+
+process.on('SIGINT', shutdown);
+process.on('SIGTERM', shutdown);
+
+mkdirSync(path.dirname(SOCKET_PATH), { recursive: true });
+// socket قديم من عامل انتهى بشكل غير طبيعي
+rmSync(SOCKET_PATH, { force: true });
+server.listen(SOCKET_PATH, () => {
+  touch();
+  log(`listening on ${SOCKET_PATH} (pid ${process.pid}, root ${PROJECT_ROOT})`);
+  // تحميل الأدوات مسبقاً حتى يكون أول طلب سريعاً
+  queue = queue.then(async () => {
+    await getESLint();
+    // بناء البرنامج الكامل مرة واحدة؛ الطلبات التالية تعيد فحص ما تغيّر فقط
+    getTypeScript()?.getProgram();
+    log(`eslint: ${eslintError ?? 'ready'} | typescript: ${tsError ?? 'ready'}`);
+  });
+});
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+UberFix Local ESLint Fixers
+إصلاحات محلية حتمية لأخطاء ESLint الميكانيكية قبل إرسال الباقي إلى DeepSeek
+
+القواعد المدعومة:
+- no-unused-vars / @typescript-eslint/no-unused-vars: إضافة البادئة "_"
+- react-hooks/exhaustive-deps: إضافة الاعتماديات الناقصة إلى المصفوفة
+- أي رسالة تحمل fix جاهزاً من ESLint نفسه
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from eslint_report import ESLintReportIndex, FileEntry, Finding
+from ts_tokenizer import (
+    IDENT,
+    PUNCT,
+    Edit,
+    LineIndex,
+    Token,
+    apply_edits,
+    find_token,
+    is_jsx_path,
+    matching_index,
+    tokenize,
+)
+
+
+UNUSED_VARS_RULES = {"no-unused-vars", "@typescript-eslint/no-unused-vars"}
+EXHAUSTIVE_DEPS_RULE = "react-hooks/exhaustive-deps"
+
+_QUOTED_NAME_RE = re.compile(r"'([^']+)'")
+_MISSING_DEPS_RE = re.compile(r"has (?:a )?missing dependenc(?:y|ies): (.+?)\. ")
+
+
+@dataclass
+class LocalFixResult:
+    """ملخص الإصلاح المحلي"""
+
+    fixed: List[Finding] = field(default_factory=list)
+    remaining: Dict[str, List[Finding]] = field(default_factory=dict)
+    files_written: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def remaining_count(self) -> int:
+        return sum(len(findings) for findings in self.remaining.values())
+
+
+class LocalFixer:
+    """تطبيق الإصلاحات المحلية على الملفات الموجودة في فهرس ESLint"""
+
+    def __init__(self, index: ESLintReportIndex, dry_run: bool = False):
+        self.index = index
+        self.dry_run = dry_run
+
+    def run(self) -> LocalFixResult:
+        result = LocalFixResult()
+        started = time.perf_counter()
+
+        for entry in self.index.prioritized_files():
+            path = self.index.resolve(entry.path)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    source = f.read()
+            except OSError:
+                result.remaining[entry.path] = list(entry.findings)
+                continue
+
+            new_source, fixed, remaining = self.fix_source(path, source, entry)
+            result.fixed.extend(fixed)
+            if remaining:
+                result.remaining[entry.path] = remaining
+
+            if new_source != source:
+                if not self.dry_run:
+                    with open(path, "w", encoding="utf-8") as f:
+                        f.write(new_source)
+                result.files_written.append(entry.path)
+
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def fix_source(
+        self, path: Path, source: str, entry: FileEntry
+    ) -> Tuple[str, List[Finding], List[Finding]]:
+        """إصلاح ملف واحد؛ يعيد (المصدر الجديد، المُصلح، المتبقي)"""
+        tokens = tokenize(source, is_jsx_path(path))
+        starts = [t.start for t in tokens]
+        lines = LineIndex(source)
+
+        planned: List[Tuple[Finding, List[Edit]]] = []
+        remaining: List[Finding] = []
+
+        for finding in entry.findings:
+            edits = self.plan(finding, source, tokens, starts, lines)
+            if edits:
+                planned.append((finding, edits))
+            else:
+                remaining.append(finding)
+
+        if not planned:
+            return source, [], remaining
+
+        # تعديلات الرسالة الواحدة تُقبل أو تُرفض معاً
+        accepted: List[Edit] = []
+        fixed: List[Finding] = []
+        taken: List[Tuple[int, int]] = []
+        for finding, edits in planned:
+            if any(_overlaps(e, taken) for e in edits):
+                remaining.append(finding)
+                continue
+            accepted.extend(edits)
+            taken.extend((s, e) for s, e, _ in edits)
+            fixed.append(finding)
+
+        new_source, _ = apply_edits(source, accepted)
+        return new_source, fixed, [_shift(f, accepted, source, lines) for f in remaining]
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+    def plan(
+        self,
+        finding: Finding,
+        source: str,
+        tokens: List[Token],
+        starts: List[int],
+        lines: LineIndex,
+    ) -> Optional[List[Edit]]:
+        if finding.rule in UNUSED_VARS_RULES:
+            return self.plan_unused_var(finding, tokens, starts, lines)
+        if finding.rule == EXHAUSTIVE_DEPS_RULE:
+            return self.plan_missing_deps(finding, source, tokens, starts, lines)
+        if finding.fix:
+            return [_range_edit(finding.fix, lines)]
+        return None
+
+    def plan_unused_var(
+        self, finding: Finding, tokens: List[Token], starts: List[int], lines: LineIndex
+    ) -> Optional[List[Edit]]:
+        m = _QUOTED_NAME_RE.search(finding.message)
+        if not m or m.group(1).startswith("_"):
+            return None
+        name = m.group(1)
+
+        i = find_token(tokens, lines.offset(finding.line, finding.column), starts)
+        if i < 0 or not tokens[i].is_ident(name):
+            return None
+
+        # إعادة التسمية آمنة فقط إذا لم يظهر الاسم في أي مكان آخر
+        if sum(1 for t in tokens if t.kind == IDENT and t.value == name) != 1:
+            return None
+
+        tok = tokens[i]
+        prev = tokens[i - 1] if i > 0 else None
+        nxt = tokens[i + 1] if i + 1 < len(tokens) else None
+        braced = prev is not None and (prev.is_punct("{") or prev.is_punct(","))
+        closes = nxt is not None and (
+            nxt.is_punct(",") or nxt.is_punct("}") or nxt.is_punct("=")
+        )
+
+        if braced and closes and self._inside_braces_of(tokens, i):
+            if self._in_import(tokens, i):
+                # import { foo } → import { foo as _foo }
+                return [(tok.end, tok.end, f" as _{name}")]
+            # const { foo } = obj → const { foo: _foo } = obj
+            return [(tok.end, tok.end, f": _{name}")]
+
+        return [(tok.start, tok.start, "_")]
+
+    def plan_missing_deps(
+        self,
+        finding: Finding,
+        source: str,
+        tokens: List[Token],
+        starts: List[int],
+        lines: LineIndex,
+    ) -> Optional[List[Edit]]:
+        # ESLint يقترح المصفوفة الكاملة في suggestions
+        for suggestion in finding.suggestions:
+            fix = suggestion.get("fix")
+            if not fix:
+                continue
+            start, end, text = _range_edit(fix, lines)
+            if source[start:end].startswith("[") and text.startswith("["):
+                return [(start, end, text)]
+
+        m = _MISSING_DEPS_RE.search(finding.message)
+        if not m:
+            return None
+        missing = _QUOTED_NAME_RE.findall(m.group(1))
+        if not missing:
+            return None
+
+        i = find_token(tokens, lines.offset(finding.line, finding.column), starts)
+        if i < 0 or not tokens[i].is_punct("["):
+            return None
+        close = matching_index(tokens, i)
+        if close < 0:
+            return None
+
+        current = [
+            source[a.start:b.end].strip() for a, b in _split_top_level(tokens, i + 1, close)
+        ]
+        additions = [dep for dep in missing if dep not in current]
+        if not additions:
+            return None
+
+        deps = ", ".join(current + additions)
+        return [(tokens[i].start, tokens[close].end, f"[{deps}]")]
+
+    @staticmethod
+    def _inside_braces_of(tokens: List[Token], i: int) -> bool:
+        """هل الرمز عنصر مباشر داخل { ... } (وليس داخل قوس متداخل)؟"""
+        depth = 0
+        for j in range(i - 1, -1, -1):
+            tok = tokens[j]
+            if tok.kind != PUNCT:
+                continue
+            if tok.value in (")", "]", "}"):
+                depth += 1
+            elif tok.value in ("(", "["):
+                if depth == 0:
+                    return False
+                depth -= 1
+            elif tok.value == "{":
+                if depth == 0:
+                    return True
+                depth -= 1
+        return False
+
+    @staticmethod
+    def _in_import(tokens: List[Token], i: int) -> bool:
+        """هل الرمز داخل import { ... } ؟"""
+        for j in range(i - 1, -1, -1):
+            if tokens[j].is_punct("{"):
+                before = [t.value for t in tokens[max(j - 3, 0):j]]
+                return bool(before) and (
+                    before[-1] in ("import", "type")
+                    or (before[-1] == "," and len(before) == 3 and before[0] == "import")
+                )
+        return False
+
+
+def _range_edit(fix: Dict, lines: LineIndex) -> Edit:
+    start, end = fix["range"]
+    return lines.from_utf16(start), lines.from_utf16(end), fix.get("text", "")
+
+
+def _split_top_level(tokens: List[Token], begin: int, end: int) -> List[Tuple[Token, Token]]:
+    """تقسيم tokens[begin:end] عند الفواصل في المستوى الأعلى إلى (أول رمز، آخر رمز)"""
+    items: List[Tuple[Token, Token]] = []
+    depth = 0
+    first: Optional[Token] = None
+    last: Optional[Token] = None
+    for tok in tokens[begin:end]:
+        if tok.kind == PUNCT and tok.value in ("(", "[", "{"):
+            depth += 1
+        elif tok.kind == PUNCT and tok.value in (")", "]", "}"):
+            depth -= 1
+        elif depth == 0 and tok.is_punct(","):
+            if first is not None:
+                items.append((first, last))
+            first = last = None
+            continue
+        if first is None:
+            first = tok
+        last = tok
+    if first is not None:
+        items.append((first, last))
+    return items
+
+
+def _overlaps(edit: Edit, taken: List[Tuple[int, int]]) -> bool:
+    start, end, _ = edit
+    return any(start < t_end and t_start < end or start == t_start for t_start, t_end in taken)
+
+
+def _shift(finding: Finding, edits: List[Edit], source: str, lines: LineIndex) -> Finding:
+    """تحديث رقم السطر بعد التعديلات التي تضيف أو تحذف أسطراً"""
+    offset = lines.starts[min(finding.line, len(lines.starts)) - 1]
+    delta = 0
+    for start, end, text in edits:
+        if end <= offset:
+            delta += text.count("\n") - source.count("\n", start, end)
+    if delta:
+        finding.line += delta
+        finding.end_line += delta
+    return finding
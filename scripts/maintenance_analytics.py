@@ -0,0 +1,662 @@
+#!/usr/bin/env python3
+"""
+UberFix Maintenance Analytics
+محرك تحليلات عمودي لأرشيف طلبات الصيانة (public/data/maintenance_requests_archive_rows.csv)
+مع ربط stores_rows.csv و rate_items_rows.csv
+
+تُقرأ ملفات CSV مرة واحدة إلى أعمدة numpy مضغوطة الأنواع:
+- الأعمدة النصية المتكررة (store_id, status, priority ...) ← أكواد int32 + قائمة فئات
+- التكاليف ← float64 (NaN للقيم الفارغة)
+- التواريخ ← datetime64[s] (NaT للقيم الفارغة)
+
+وتُحفظ نسخة .npz في reports/analytics_cache/ تُستخدم طالما لم يتغير الملف الأصلي.
+كل التقارير عمليات متجهة (bincount / lexsort) بدون حلقات على الصفوف.
+
+الاستخدام:
+    python3 scripts/maintenance_analytics.py report
+    python3 scripts/maintenance_analytics.py generate --rows 2000000 --output /tmp/archive.csv
+    python3 scripts/maintenance_analytics.py bench --rows 1000000
+"""
+
+import os
+import csv
+import sys
+import time
+import uuid
+import hashlib
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+DEFAULT_PROJECT_ROOT = Path("/opt/UberFix")
+ARCHIVE_FILE = "maintenance_requests_archive_rows.csv"
+STORES_FILE = "stores_rows.csv"
+RATES_FILE = "rate_items_rows.csv"
+
+CAT = "category"
+FLOAT = "float"
+DATE = "date"
+BOOL = "bool"
+
+# الأعمدة غير المذكورة (id, title, description ...) لا تُحمّل
+ARCHIVE_SCHEMA = {
+    "store_id": CAT,
+    "status": CAT,
+    "priority": CAT,
+    "service_type": CAT,
+    "primary_service_id": CAT,
+    "assigned_to": CAT,
+    "created_by": CAT,
+    "estimated_cost": FLOAT,
+    "actual_cost": FLOAT,
+    "scheduled_date": DATE,
+    "completion_date": DATE,
+    "created_at": DATE,
+    "is_deleted": BOOL,
+}
+STORES_SCHEMA = {
+    "id": CAT,
+    "name": CAT,
+    "area": FLOAT,
+    "category": CAT,
+    "status": CAT,
+    "region_id": CAT,
+}
+RATES_SCHEMA = {
+    "rate_card_id": CAT,
+    "trade_id": CAT,
+    "normal_hourly": FLOAT,
+    "after_hours_hourly": FLOAT,
+    "min_billable_hours": FLOAT,
+    "trip_charge": FLOAT,
+    "min_invoice": FLOAT,
+}
+
+# نفس قيم trigger الـ SLA في supabase/migrations (complete_hours حسب الأولوية)
+SLA_COMPLETE_HOURS = {"high": 8, "medium": 24, "low": 48}
+DEFAULT_SLA_HOURS = 24
+
+# مراحل القمع بالترتيب؛ الحالات المرفوضة/الملغاة تخرج من القمع
+STATUS_FUNNEL = [
+    ("open", {"open", "pending", "new"}),
+    ("assigned", {"assigned"}),
+    ("in_progress", {"inprogress", "in progress", "in_progress", "waiting", "on hold", "on_hold"}),
+    ("completed", {"completed", "closed"}),
+]
+DROPPED_STATUSES = {"rejected", "cancelled", "canceled"}
+OPEN_STATUSES = {name for _, names in STATUS_FUNNEL[:3] for name in names}
+
+CHUNK_ROWS = 250_000
+CACHE_VERSION = 2
+
+
+class ColumnTable:
+    """جدول عمودي: مصفوفة numpy لكل عمود + قائمة الفئات للأعمدة الفئوية"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], categories: Dict[str, np.ndarray], dropped_rows: int = 0):
+        self.columns = columns
+        self.categories = categories
+        self.dropped_rows = dropped_rows
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def labels(self, name: str) -> np.ndarray:
+        return self.categories[name]
+
+    def code_lookup(self, name: str, mapping: Dict[str, object], default=None) -> np.ndarray:
+        """مصفوفة بحث (code ← قيمة) لتحويل عمود فئوي كاملاً بفهرسة واحدة"""
+        return np.array([mapping.get(label, default) for label in self.categories[name]])
+
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.columns.values()) + sum(a.nbytes for a in self.categories.values())
+
+    def save(self, path: Path, meta: Dict[str, str]):
+        arrays = {f"col__{k}": v for k, v in self.columns.items()}
+        arrays.update({f"cat__{k}": v for k, v in self.categories.items()})
+        arrays.update({f"meta__{k}": np.array(v) for k, v in meta.items()})
+        arrays["meta__dropped_rows"] = np.array(str(self.dropped_rows))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + f".tmp{os.getpid()}.npz")
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Tuple["ColumnTable", Dict[str, str]]:
+        with np.load(path, allow_pickle=False) as data:
+            columns, categories, meta = {}, {}, {}
+            for key in data.files:
+                kind, name = key.split("__", 1)
+                if kind == "col":
+                    columns[name] = data[key]
+                elif kind == "cat":
+                    categories[name] = data[key]
+                else:
+                    meta[name] = str(data[key])
+        return cls(columns, categories, int(meta.get("dropped_rows", 0))), meta
+
+
+# ----------------------------------------------------------------------
+# Ingestion
+# ----------------------------------------------------------------------
+def _convert(values: Sequence[str], kind: str, index: Optional[Dict[str, int]]) -> np.ndarray:
+    """تحويل عمود واحد من قطعة CSV إلى مصفوفة numpy"""
+    if kind == CAT:
+        uniques, inverse = np.unique(np.array(values, dtype=str), return_inverse=True)
+        mapping = np.array([index.setdefault(u, len(index)) for u in uniques.tolist()], dtype=np.int32)
+        return mapping[inverse.reshape(-1)]
+    arr = np.array(values, dtype=str)
+    if kind == FLOAT:
+        arr[arr == ""] = "nan"
+        return arr.astype(np.float64)
+    if kind == DATE:
+        # "2025-04-07 00:46:16.496529+00" ← أول 19 حرفاً كافية لدقة الثانية
+        arr = arr.astype("U19")
+        arr[arr == ""] = "NaT"
+        return arr.astype("datetime64[s]")
+    if kind == BOOL:
+        return np.char.lower(arr) == "true"
+    raise ValueError(f"نوع عمود غير معروف: {kind}")
+
+
+def ingest_csv(path: Path, schema: Dict[str, str], chunk_rows: int = CHUNK_ROWS) -> ColumnTable:
+    """قراءة CSV على دفعات وتحويل كل دفعة إلى أعمدة numpy (الصفوف بعدد أعمدة مختلف تُعد في dropped_rows)"""
+    indexes = {name: {} for name, kind in schema.items() if kind == CAT}
+    parts: Dict[str, List[np.ndarray]] = {name: [] for name in schema}
+    dropped = 0
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        positions = {name: header.index(name) for name in schema if name in header}
+        missing = set(schema) - set(positions)
+        if missing:
+            raise ValueError(f"أعمدة غير موجودة في {path.name}: {', '.join(sorted(missing))}")
+
+        while True:
+            chunk = [row for _, row in zip(range(chunk_rows), reader)]
+            if not chunk:
+                break
+            width = len(header)
+            kept = [row for row in chunk if len(row) == width]
+            dropped += len(chunk) - len(kept)
+            chunk = kept
+            columns = list(zip(*chunk)) if chunk else [() for _ in header]
+            for name, kind in schema.items():
+                parts[name].append(_convert(columns[positions[name]], kind, indexes.get(name)))
+
+    columns = {
+        name: np.concatenate(chunks) if chunks else np.array([])
+        for name, chunks in parts.items()
+    }
+    categories = {name: np.array(list(index), dtype=str) for name, index in indexes.items()}
+    return ColumnTable(columns, categories, dropped)
+
+
+def load_table(path: Path, schema: Dict[str, str], cache_dir: Optional[Path] = None) -> ColumnTable:
+    """تحميل من ذاكرة .npz المؤقتة إن كانت حديثة وإلا قراءة CSV وحفظها"""
+    stat = path.stat()
+    signature = hashlib.sha1(
+        f"{CACHE_VERSION}|{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{sorted(schema.items())}".encode()
+    ).hexdigest()
+    cache_path = cache_dir / f"{path.stem}.npz" if cache_dir else None
+
+    if cache_path and cache_path.exists():
+        try:
+            table, meta = ColumnTable.load(cache_path)
+            if meta.get("signature") == signature:
+                return table
+        except (OSError, ValueError, KeyError):
+            pass
+
+    table = ingest_csv(path, schema)
+    if cache_path:
+        table.save(cache_path, {"signature": signature, "source": str(path)})
+    return table
+
+
+# ----------------------------------------------------------------------
+# Vectorized helpers
+# ----------------------------------------------------------------------
+def grouped_percentiles(codes: np.ndarray, values: np.ndarray, groups: int, quantiles: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """(عدد القيم لكل مجموعة، مصفوفة [مجموعة × quantile]) بطريقة nearest-rank بعد lexsort واحد"""
+    valid = ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+    order = np.lexsort((values, codes))
+    sorted_values = values[order]
+    counts = np.bincount(codes, minlength=groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    result = np.full((groups, len(quantiles)), np.nan)
+    has = counts > 0
+    for j, q in enumerate(quantiles):
+        offsets = np.floor((counts[has] - 1) * q / 100.0).astype(np.int64)
+        result[has, j] = sorted_values[starts[has] + offsets]
+    return counts, result
+
+
+def _hours(end: np.ndarray, start: np.ndarray) -> np.ndarray:
+    delta = (end - start).astype("timedelta64[s]").astype(np.float64) / 3600.0
+    delta[np.isnat(end) | np.isnat(start)] = np.nan
+    return delta
+
+
+class MaintenanceAnalytics:
+    """تقارير متجهة فوق الأرشيف (تكلفة، أزمنة الإنجاز، SLA، القمع، أحمال الفنيين)"""
+
+    def __init__(
+        self,
+        data_dir: Path,
+        cache_dir: Optional[Path] = None,
+        archive_path: Optional[Path] = None,
+    ):
+        self.data_dir = Path(data_dir)
+        self.cache_dir = cache_dir
+        self.archive_path = Path(archive_path or self.data_dir / ARCHIVE_FILE)
+        self._archive: Optional[ColumnTable] = None
+        self._stores: Optional[ColumnTable] = None
+        self._rates: Optional[ColumnTable] = None
+
+    @property
+    def archive(self) -> ColumnTable:
+        if self._archive is None:
+            self._archive = load_table(self.archive_path, ARCHIVE_SCHEMA, self.cache_dir)
+        return self._archive
+
+    @property
+    def stores(self) -> Optional[ColumnTable]:
+        path = self.data_dir / STORES_FILE
+        if self._stores is None and path.exists():
+            self._stores = load_table(path, STORES_SCHEMA, self.cache_dir)
+        return self._stores
+
+    @property
+    def rates(self) -> Optional[ColumnTable]:
+        path = self.data_dir / RATES_FILE
+        if self._rates is None and path.exists():
+            self._rates = load_table(path, RATES_SCHEMA, self.cache_dir)
+        return self._rates
+
+    def _active(self) -> np.ndarray:
+        return ~self.archive["is_deleted"]
+
+    def store_names(self) -> Dict[str, str]:
+        stores = self.stores
+        if stores is None:
+            return {}
+        ids = stores.labels("id")[stores["id"]]
+        names = stores.labels("name")[stores["name"]]
+        return dict(zip(ids.tolist(), names.tolist()))
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+    def cost_per_store(self, top: Optional[int] = 20) -> List[Dict]:
+        """إجمالي ومتوسط التكلفة الفعلية لكل فرع ونسبة تجاوز التقدير"""
+        a = self.archive
+        active = self._active()
+        codes = a["store_id"][active]
+        groups = len(a.labels("store_id"))
+        actual = np.nan_to_num(a["actual_cost"][active])
+        estimated = np.nan_to_num(a["estimated_cost"][active])
+
+        count = np.bincount(codes, minlength=groups)
+        actual_total = np.bincount(codes, weights=actual, minlength=groups)
+        estimated_total = np.bincount(codes, weights=estimated, minlength=groups)
+
+        order = np.argsort(-actual_total)
+        order = order[count[order] > 0][:top]
+        names = self.store_names()
+        labels = a.labels("store_id")
+        rows = []
+        for code in order.tolist():
+            store_id = labels[code]
+            rows.append(
+                {
+                    "store_id": store_id,
+                    "store": names.get(store_id, store_id),
+                    "requests": int(count[code]),
+                    "actual_total": float(actual_total[code]),
+                    "actual_mean": float(actual_total[code] / count[code]),
+                    "estimated_total": float(estimated_total[code]),
+                    "overrun_pct": float((actual_total[code] / estimated_total[code] - 1) * 100)
+                    if estimated_total[code] else None,
+                }
+            )
+        return rows
+
+    def completion_hours(self, start: str = "scheduled_date") -> np.ndarray:
+        a = self.archive
+        return _hours(a["completion_date"], a[start])
+
+    def completion_percentiles(
+        self,
+        group_by: Optional[str] = "priority",
+        quantiles: Sequence[float] = (50, 90, 95, 99),
+        start: str = "scheduled_date",
+    ) -> List[Dict]:
+        """نسب مئوية لزمن الإنجاز بالساعات (إجمالاً أو حسب عمود فئوي)"""
+        a = self.archive
+        active = self._active()
+        hours = self.completion_hours(start)[active]
+        if group_by:
+            codes = a[group_by][active]
+            labels = a.labels(group_by)
+        else:
+            codes = np.zeros(len(hours), dtype=np.int32)
+            labels = np.array(["all"])
+        counts, values = grouped_percentiles(codes, hours, len(labels), quantiles)
+        rows = []
+        for code in np.argsort(-counts).tolist():
+            if not counts[code]:
+                continue
+            row = {"group": labels[code], "count": int(counts[code])}
+            row.update({f"p{int(q)}": float(values[code, j]) for j, q in enumerate(quantiles)})
+            rows.append(row)
+        return rows
+
+    def sla_compliance(self, start: str = "scheduled_date") -> List[Dict]:
+        """نسبة الطلبات المنجزة ضمن مهلة SLA حسب الأولوية"""
+        a = self.archive
+        active = self._active()
+        priority = a["priority"][active]
+        hours = self.completion_hours(start)[active]
+        limits = a.code_lookup("priority", SLA_COMPLETE_HOURS, DEFAULT_SLA_HOURS).astype(np.float64)[priority]
+
+        measured = ~np.isnan(hours)
+        breached = measured & (hours > limits)
+        groups = len(a.labels("priority"))
+        total = np.bincount(priority[measured], minlength=groups)
+        late = np.bincount(priority[breached], minlength=groups)
+        rows = []
+        for code in np.flatnonzero(total).tolist():
+            label = a.labels("priority")[code]
+            rows.append(
+                {
+                    "priority": label,
+                    "sla_hours": SLA_COMPLETE_HOURS.get(label, DEFAULT_SLA_HOURS),
+                    "measured": int(total[code]),
+                    "breached": int(late[code]),
+                    "compliance_pct": float(100 * (1 - late[code] / total[code])),
+                }
+            )
+        return rows
+
+    def status_funnel(self) -> List[Dict]:
+        """عدد الطلبات التي وصلت لكل مرحلة على الأقل + الخارجة من القمع"""
+        a = self.archive
+        stage_of = {}
+        for stage, (_, names) in enumerate(STATUS_FUNNEL):
+            for name in names:
+                stage_of[name] = stage
+        for name in DROPPED_STATUSES:
+            stage_of[name] = len(STATUS_FUNNEL)
+
+        normalized = {label: stage_of.get(label.strip().lower(), -1) for label in a.labels("status")}
+        stages = a.code_lookup("status", normalized, -1).astype(np.int64)[a["status"][self._active()]]
+        counts = np.bincount(stages[stages >= 0], minlength=len(STATUS_FUNNEL) + 1)
+        reached = np.cumsum(counts[:len(STATUS_FUNNEL)][::-1])[::-1]
+
+        total = int(len(stages))
+        rows = []
+        previous = total
+        for stage, (name, _) in enumerate(STATUS_FUNNEL):
+            rows.append(
+                {
+                    "stage": name,
+                    "current": int(counts[stage]),
+                    "reached": int(reached[stage]),
+                    "conversion_pct": float(100 * reached[stage] / previous) if previous else 0.0,
+                }
+            )
+            previous = int(reached[stage])
+        rows.append({"stage": "dropped", "current": int(counts[-1]), "reached": int(counts[-1]), "conversion_pct": None})
+        rows.append({"stage": "unknown", "current": int((stages < 0).sum()), "reached": 0, "conversion_pct": None})
+        return rows
+
+    def technician_workload(self, top: Optional[int] = 20) -> List[Dict]:
+        """عدد الطلبات المفتوحة والمنجزة والتكلفة ووسيط زمن الإنجاز لكل فني"""
+        a = self.archive
+        active = self._active()
+        codes = a["assigned_to"][active]
+        groups = len(a.labels("assigned_to"))
+        is_open = a.code_lookup("status", {s: s.strip().lower() in OPEN_STATUSES for s in a.labels("status")}, False)
+        open_mask = is_open.astype(bool)[a["status"][active]]
+
+        count = np.bincount(codes, minlength=groups)
+        open_count = np.bincount(codes[open_mask], minlength=groups)
+        cost = np.bincount(codes, weights=np.nan_to_num(a["actual_cost"][active]), minlength=groups)
+        _, median = grouped_percentiles(codes, self.completion_hours()[active], groups, (50,))
+
+        order = np.argsort(-count)
+        order = order[count[order] > 0][:top]
+        labels = a.labels("assigned_to")
+        return [
+            {
+                "technician": labels[code] or "<unassigned>",
+                "requests": int(count[code]),
+                "open": int(open_count[code]),
+                "actual_total": float(cost[code]),
+                "median_hours": float(median[code, 0]),
+            }
+            for code in order.tolist()
+        ]
+
+    def cost_vs_rate_card(self) -> List[Dict]:
+        """مقارنة التكاليف الفعلية ببنود rate_items (الحد الأدنى للفاتورة والساعات المكافئة)
+
+        الأرشيف لا يحتوي trade_id، لذا تُقارن كل الطلبات ببند كل حرفة.
+        """
+        rates = self.rates
+        if rates is None or not len(rates):
+            return []
+        actual = self.archive["actual_cost"][self._active()]
+        actual = actual[~np.isnan(actual)]
+        trades = rates.labels("trade_id")[rates["trade_id"]]
+        rows = []
+        for i in range(len(rates)):
+            hourly = rates["normal_hourly"][i]
+            trip = np.nan_to_num(rates["trip_charge"][i])
+            minimum = rates["min_invoice"][i]
+            hours = np.maximum(actual - trip, 0) / hourly if hourly else np.full(len(actual), np.nan)
+            rows.append(
+                {
+                    "trade_id": trades[i],
+                    "min_invoice": float(minimum),
+                    "below_min_pct": float(100 * np.mean(actual < minimum)) if len(actual) else 0.0,
+                    "median_hours": float(np.median(hours)) if len(hours) else float("nan"),
+                }
+            )
+        return rows
+
+
+# ----------------------------------------------------------------------
+# Synthetic archives
+# ----------------------------------------------------------------------
+def generate_archive(output: Path, rows: int, seed: int = 7, store_ids: Optional[List[str]] = None) -> Path:
+    """أرشيف اصطناعي بنفس أعمدة التصدير لقياس الأداء (يُكتب على دفعات)"""
+    rng = np.random.default_rng(seed)
+    store_ids = store_ids or [str(uuid.UUID(int=int(rng.integers(1 << 62)))) for _ in range(500)]
+    technicians = [str(uuid.UUID(int=int(rng.integers(1 << 62)))) for _ in range(300)] + [""]
+    users = [str(uuid.UUID(int=int(rng.integers(1 << 62)))) for _ in range(50)]
+    statuses = np.array(["Open", "Assigned", "In Progress", "Waiting", "Completed", "Closed", "Cancelled", "Rejected"])
+    status_p = [0.06, 0.05, 0.07, 0.02, 0.65, 0.1, 0.03, 0.02]
+    priorities = np.array(["high", "medium", "low"])
+    service = "faabfd61-2345-4567-8901-abcdefabcdef"
+    base = np.datetime64("2022-01-01T00:00:00", "s")
+
+    header = [
+        "id", "store_id", "title", "description", "status", "priority", "service_type",
+        "primary_service_id", "created_by", "updated_by", "assigned_to", "estimated_cost",
+        "actual_cost", "scheduled_date", "completion_date", "is_deleted", "created_at", "updated_at",
+    ]
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        done = 0
+        while done < rows:
+            n = min(CHUNK_ROWS, rows - done)
+            status = statuses[rng.choice(len(statuses), n, p=status_p)]
+            priority = priorities[rng.choice(3, n, p=[0.2, 0.6, 0.2])]
+            store = rng.integers(len(store_ids), size=n)
+            tech = rng.integers(len(technicians), size=n)
+            creator = rng.integers(len(users), size=n)
+            estimated = np.round(rng.lognormal(7.2, 0.8, n), -1)
+            actual = np.round(estimated * rng.normal(1.05, 0.15, n), -1)
+            scheduled = base + rng.integers(0, 3 * 365 * 86400, n).astype("timedelta64[s]")
+            completed = scheduled + (rng.gamma(2.0, 14.0, n) * 3600).astype("timedelta64[s]")
+            created = scheduled - rng.integers(0, 5 * 86400, n).astype("timedelta64[s]")
+            finished = np.isin(status, ["Completed", "Closed"])
+            deleted = rng.random(n) < 0.01
+
+            scheduled_s = np.datetime_as_string(scheduled, unit="s")
+            completed_s = np.where(finished, np.datetime_as_string(completed, unit="s"), "")
+            created_s = np.datetime_as_string(created, unit="s")
+            for i in range(n):
+                writer.writerow(
+                    (
+                        uuid.UUID(int=done + i + 1),
+                        store_ids[store[i]],
+                        "طلب صيانة",
+                        "",
+                        status[i],
+                        priority[i],
+                        "maintenance",
+                        service,
+                        users[creator[i]],
+                        users[creator[i]],
+                        technicians[tech[i]],
+                        estimated[i],
+                        actual[i] if finished[i] else "",
+                        scheduled_s[i].replace("T", " "),
+                        completed_s[i].replace("T", " "),
+                        "true" if deleted[i] else "false",
+                        created_s[i].replace("T", " ") + "+00",
+                        created_s[i].replace("T", " ") + "+00",
+                    )
+                )
+            done += n
+    return output
+
+
+# ----------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------
+def _fmt(value) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return "nan" if np.isnan(value) else f"{value:,.1f}"
+    return str(value)
+
+
+def _print_table(title: str, rows: List[Dict], elapsed: float):
+    print(f"\n{title} ({elapsed * 1000:.1f} ms)")
+    print("-" * 60)
+    if not rows:
+        print("  لا توجد بيانات")
+        return
+    keys = list(rows[0])
+    print("  " + "  ".join(f"{k:>14s}" for k in keys))
+    for row in rows:
+        print("  " + "  ".join(f"{_fmt(row[k])[:28]:>14s}" for k in keys))
+
+
+def run_reports(analytics: MaintenanceAnalytics, top: int = 15) -> Dict[str, float]:
+    """تشغيل كل التقارير وطباعتها مع زمن كل منها"""
+    timings = {}
+    started = time.perf_counter()
+    rows = len(analytics.archive)
+    timings["load"] = time.perf_counter() - started
+    print(f"📦 {rows:,} طلب، {analytics.archive.nbytes() / 1e6:.1f} MB في الذاكرة ({timings['load'] * 1000:.0f} ms)")
+    if analytics.archive.dropped_rows:
+        print(f"⚠️  {analytics.archive.dropped_rows:,} صف بعدد أعمدة مختلف لم يُقرأ من {analytics.archive_path.name}")
+
+    reports = [
+        ("💰 التكلفة لكل فرع", "cost_per_store", lambda: analytics.cost_per_store(top)),
+        ("⏱️  زمن الإنجاز (ساعات) حسب الأولوية", "completion_percentiles", analytics.completion_percentiles),
+        ("🎯 الالتزام بـ SLA", "sla_compliance", analytics.sla_compliance),
+        ("🔻 قمع الحالات", "status_funnel", analytics.status_funnel),
+        ("👷 أحمال الفنيين", "technician_workload", lambda: analytics.technician_workload(top)),
+        ("📋 مقارنة ببنود الأسعار", "cost_vs_rate_card", analytics.cost_vs_rate_card),
+    ]
+    for title, key, report in reports:
+        started = time.perf_counter()
+        result = report()
+        timings[key] = time.perf_counter() - started
+        _print_table(title, result, timings[key])
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UberFix maintenance archive analytics")
+    parser.add_argument("--project-root", type=Path, default=DEFAULT_PROJECT_ROOT)
+    parser.add_argument("--no-cache", action="store_true", help="عدم استخدام/حفظ نسخة .npz")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    report = sub.add_parser("report", help="تقارير الأرشيف")
+    report.add_argument("--archive", type=Path, help="ملف أرشيف بديل (مثلاً أرشيف اصطناعي)")
+    report.add_argument("--top", type=int, default=15)
+
+    generate = sub.add_parser("generate", help="توليد أرشيف اصطناعي")
+    generate.add_argument("--rows", type=int, default=1_000_000)
+    generate.add_argument("--output", type=Path, required=True)
+    generate.add_argument("--seed", type=int, default=7)
+
+    bench = sub.add_parser("bench", help="قياس القراءة الأولى والتحميل من الذاكرة المؤقتة والتقارير")
+    bench.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    data_dir = args.project_root / "public" / "data"
+    cache_dir = None if args.no_cache else args.project_root / "reports" / "analytics_cache"
+
+    def store_ids() -> Optional[List[str]]:
+        path = data_dir / STORES_FILE
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return [row["id"] for row in csv.DictReader(f)]
+
+    if args.command == "generate":
+        started = time.perf_counter()
+        generate_archive(args.output, args.rows, args.seed, store_ids())
+        print(f"✅ {args.rows:,} صف في {args.output} ({time.perf_counter() - started:.1f}s)")
+        return
+
+    if args.command == "report":
+        analytics = MaintenanceAnalytics(data_dir, cache_dir, args.archive)
+        if not analytics.archive_path.exists():
+            print(f"❌ الملف غير موجود: {analytics.archive_path}")
+            sys.exit(1)
+        run_reports(analytics, args.top)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = Path(tmp) / "archive.csv"
+        started = time.perf_counter()
+        generate_archive(archive, args.rows, store_ids=store_ids())
+        print(f"🧪 توليد {args.rows:,} صف: {time.perf_counter() - started:.1f}s "
+              f"({archive.stat().st_size / 1e6:.0f} MB)")
+
+        bench_cache = Path(tmp) / "cache"
+        started = time.perf_counter()
+        MaintenanceAnalytics(data_dir, bench_cache, archive).archive
+        print(f"📥 القراءة الأولى (CSV ← أعمدة): {time.perf_counter() - started:.2f}s")
+
+        analytics = MaintenanceAnalytics(data_dir, bench_cache, archive)
+        timings = run_reports(analytics, top=5)
+        print("\n⏱️  الملخص:")
+        for key, seconds in timings.items():
+            print(f"  {key:24s} {seconds * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+UberFix Performance Spans
+قياس اختياري لزمن المراحل والملفات مع عدّادات، وتصدير بصيغة Chrome Trace
+
+الاستخدام:
+    tracer = Tracer()
+    with tracer.span("discovery"):
+        ...
+    with tracer.file_span("src/App.tsx"):
+        tracer.count("bytes_read", 1024)
+    tracer.export_chrome_trace(Path("reports/trace.json"))
+
+يمكن فتح الملف الناتج في chrome://tracing أو https://ui.perfetto.dev
+"""
+
+import os
+import json
+import time
+import threading
+import contextlib
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+STAGE = "stage"
+FILE = "file"
+
+
+class Tracer:
+    """مسجّل spans وعدّادات؛ عند enabled=False لا يكلّف شيئاً تقريباً"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.events: List[Dict] = []
+        self.counters: Dict[str, int] = {}
+        self.file_times: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str = STAGE, **args):
+        """قياس زمن كتلة كود"""
+        if not self.enabled:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((started - self.origin) * 1e6, 3),
+                "dur": round((ended - started) * 1e6, 3),
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            with self._lock:
+                self.events.append(event)
+                if category == FILE:
+                    self.file_times[name] = self.file_times.get(name, 0.0) + ended - started
+
+    def file_span(self, path: str, **args):
+        """span لملف واحد (يدخل في قائمة الملفات الأبطأ)"""
+        return self.span(str(path), FILE, **args)
+
+    def count(self, name: str, value: int = 1):
+        """زيادة عدّاد (bytes_read, records_extracted, fixes_applied ...)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def stage_times(self) -> List[Tuple[str, float]]:
+        """زمن كل مرحلة بالثواني بترتيب التنفيذ"""
+        return [
+            (event["name"], event["dur"] / 1e6)
+            for event in sorted(self.events, key=lambda e: e["ts"])
+            if event["cat"] == STAGE
+        ]
+
+    def slowest_files(self, top: int = 10) -> List[Tuple[str, float]]:
+        return sorted(self.file_times.items(), key=lambda kv: -kv[1])[:top]
+
+    def summary_lines(self, top: int = 10) -> List[str]:
+        """أسطر جاهزة للإضافة إلى التقارير النصية"""
+        if not self.enabled:
+            return []
+
+        lines = ["⏱️  أزمنة المراحل:"]
+        for name, seconds in self.stage_times():
+            lines.append(f"  {name:24s} {seconds * 1000:10.1f} ms")
+
+        if self.counters:
+            lines.extend(["", "🔢 العدّادات:"])
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"  {name:24s} {value:>12,}")
+
+        slowest = self.slowest_files(top)
+        if slowest:
+            lines.extend(["", f"🐢 أبطأ {len(slowest)} ملفات:"])
+            for path, seconds in slowest:
+                lines.append(f"  {seconds * 1000:8.2f} ms  {path}")
+
+        return lines
+
+    def export_chrome_trace(self, output_path: Path):
+        """تصدير بصيغة Chrome Trace Event (JSON)"""
+        ended = round((time.perf_counter() - self.origin) * 1e6, 3)
+        counter_events = [
+            {
+                "name": name,
+                "ph": "C",
+                "ts": ended,
+                "pid": os.getpid(),
+                "args": {name: value},
+            }
+            for name, value in sorted(self.counters.items())
+        ]
+        data = {
+            "traceEvents": self.events + counter_events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "counters": self.counters,
+                "slowest_files": [
+                    {"path": path, "ms": round(seconds * 1000, 3)}
+                    for path, seconds in self.slowest_files(50)
+                ],
+            },
+        }
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
@@ -18,7 +18,7 @@ cd /opt/UberFix
 
 # تشغيل المحلل المعماري
 echo "🚀 بدء التحليل المعماري الشامل..."
-python3 scripts/architecture_analyzer.py
+python3 scripts/architecture_analyzer.py "$@"
 
 # البحث عن أحدث التقارير في مجلد reports/
 LATEST_REPORT=$(find /opt/UberFix/reports -name "architecture_report_*.txt" 2>/dev/null | sort -r | head -1)
@@ -18,7 +18,7 @@ cd /opt/UberFix
 
 # تشغيل سكريبت الإصلاح
 echo "🚀 بدء عملية الإصلاح الشاملة..."
-python3 scripts/uberfix_repair.py
+python3 scripts/uberfix_repair.py "$@"
 
 # حفظ التقرير في مجلد reports/
 REPORT_FILE=$(find /opt/UberFix/reports -name "repair_report_*.txt" 2>/dev/null | sort -r | head -1)
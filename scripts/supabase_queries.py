@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+UberFix Supabase Query Index
+فهرس لكل مواضع استعلامات Supabase في src/ (الجدول، الأعمدة، الفلاتر، المكون/الـ hook)
+مع كشف الأنماط المكلفة:
+
+- in_loop: استعلام داخل .map / forEach / for / while
+- per_item_effect: استعلام داخل مكون يُعرض لكل عنصر في قائمة (<Item /> داخل .map)
+- select_star: select('*') على جدول عريض (حسب supabase/migrations)
+- duplicate: نفس الاستعلام في أكثر من مكون (يجب مشاركة cache عبر useQuery)
+
+تكرار الاستدعاء المقدّر تقريبي: وزن السياق (render / useEffect / useQuery / معالج حدث)
+مضروباً في الحلقات وفي عدد الملفات التي تستورد الملف.
+
+الاستخدام:
+    python3 scripts/supabase_queries.py --project-root /opt/UberFix
+    python3 scripts/supabase_queries.py --sort table --flag select_star
+"""
+
+import os
+import re
+import json
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from import_graph import IGNORE_DIRS, ImportGraph
+from ts_tokenizer import IDENT, PUNCT, STRING, TEMPLATE, Token, is_jsx_path, tokenize
+
+
+DEFAULT_PROJECT_ROOT = Path("/opt/UberFix")
+WIDE_TABLE_COLUMNS = 15
+
+WRITE_METHODS = {"insert", "update", "upsert", "delete"}
+FILTER_METHODS = {
+    "eq", "neq", "gt", "gte", "lt", "lte", "like", "ilike", "is", "in", "contains",
+    "containedBy", "match", "not", "or", "filter", "textSearch", "overlaps",
+}
+LOOP_METHODS = {"map", "forEach", "flatMap", "reduce"}
+EFFECT_HOOKS = {"useEffect", "useLayoutEffect"}
+CACHED_HOOKS = {"useQuery", "useInfiniteQuery", "useSuspenseQuery", "useCachedQuery"}
+# تُنفّذ عند تفاعل المستخدم فقط مثل معالجات الأحداث
+MUTATION_HOOKS = {"useMutation"}
+HOOK_BLOCKS = {
+    **{name: "effect" for name in EFFECT_HOOKS},
+    **{name: "cached" for name in CACHED_HOOKS},
+    **{name: "handler" for name in MUTATION_HOOKS},
+}
+WRAPPER_CALLS = {"useCallback", "useMemo", "memo", "forwardRef"}
+
+# أوزان تقريبية لعدد مرات تنفيذ الاستعلام لكل عرض للمكون
+CONTEXT_WEIGHTS = {"render": 10, "effect": 2, "cached": 1, "handler": 1, "function": 2, "module": 1}
+LOOP_FACTOR = 10
+
+_HANDLER_RE = re.compile(r"^(handle|on)[A-Z]|Submit|Click|Change$")
+_CREATE_TABLE_RE = re.compile(
+    r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:public\.)?\"?(\w+)\"?\s*\(", re.IGNORECASE
+)
+_ADD_COLUMN_RE = re.compile(
+    r"ALTER\s+TABLE\s+(?:ONLY\s+)?(?:IF\s+EXISTS\s+)?(?:public\.)?\"?(\w+)\"?\s+([^;]*)", re.IGNORECASE
+)
+_ADD_COLUMN_ITEM_RE = re.compile(r"ADD\s+COLUMN\s+(?:IF\s+NOT\s+EXISTS\s+)?\"?(\w+)\"?", re.IGNORECASE)
+_CONSTRAINT_RE = re.compile(r"^\s*(CONSTRAINT|PRIMARY|UNIQUE|FOREIGN|CHECK|EXCLUDE|LIKE)\b", re.IGNORECASE)
+
+
+def table_columns(migrations_dir: Path) -> Dict[str, Set[str]]:
+    """أعمدة كل جدول من ملفات الترحيل (CREATE TABLE + ALTER TABLE ADD COLUMN)"""
+    columns: Dict[str, Set[str]] = {}
+    if not migrations_dir.is_dir():
+        return columns
+    for path in sorted(migrations_dir.glob("*.sql")):
+        sql = path.read_text(encoding="utf-8", errors="replace")
+        for m in _CREATE_TABLE_RE.finditer(sql):
+            depth, i = 1, m.end()
+            while i < len(sql) and depth:
+                depth += {"(": 1, ")": -1}.get(sql[i], 0)
+                i += 1
+            body = sql[m.end():i - 1]
+            parts, depth, start = [], 0, 0
+            for j, ch in enumerate(body):
+                if ch == "(":
+                    depth += 1
+                elif ch == ")":
+                    depth -= 1
+                elif ch == "," and depth == 0:
+                    parts.append(body[start:j])
+                    start = j + 1
+            parts.append(body[start:])
+            names = columns.setdefault(m.group(1), set())
+            for part in parts:
+                part = re.sub(r"--[^\n]*", "", part).strip()
+                if part and not _CONSTRAINT_RE.match(part):
+                    names.add(part.split()[0].strip('"'))
+        for m in _ADD_COLUMN_RE.finditer(sql):
+            for column in _ADD_COLUMN_ITEM_RE.findall(m.group(2)):
+                columns.setdefault(m.group(1), set()).add(column)
+    return columns
+
+
+def _literal(tok: Token) -> Optional[str]:
+    if tok.kind == STRING:
+        return tok.value[1:-1]
+    if tok.kind == TEMPLATE and tok.value.endswith("`") and "${" not in tok.value:
+        return tok.value[1:-1]
+    return None
+
+
+class _Span:
+    __slots__ = ("name", "kind", "start", "end")
+
+    def __init__(self, name: str, kind: str, start: int, end: int):
+        self.name = name
+        self.kind = kind
+        self.start = start
+        self.end = end
+
+    def contains(self, offset: int) -> bool:
+        return self.start <= offset < self.end
+
+
+class FileScanner:
+    """مسح ملف واحد: مواضع الاستعلامات ونطاقات الدوال والحلقات والـ hooks"""
+
+    def __init__(self, rel: str, content: str):
+        self.rel = rel
+        self.tokens = tokenize(content, jsx=is_jsx_path(rel))
+        self.functions: List[_Span] = []
+        self.blocks: List[_Span] = []  # loop / effect / cached / handler
+        self.looped_components: Set[str] = set()
+        self.queries: List[Dict] = []
+        self._pairs = self._bracket_pairs()
+
+    def _bracket_pairs(self) -> Dict[int, int]:
+        """كل الأقواس المتقابلة في مرور واحد بدلاً من matching_index لكل نطاق"""
+        pairs: Dict[int, int] = {}
+        stack: List[int] = []
+        for i, tok in enumerate(self.tokens):
+            if tok.kind != PUNCT:
+                continue
+            if tok.value in ("(", "[", "{"):
+                stack.append(i)
+            elif tok.value in (")", "]", "}") and stack:
+                pairs[stack.pop()] = i
+        return pairs
+
+    def _match(self, open_index: int) -> int:
+        return self._pairs.get(open_index, -1)
+
+    def scan(self) -> "FileScanner":
+        tokens = self.tokens
+        n = len(tokens)
+        for i, tok in enumerate(tokens):
+            if tok.kind == IDENT:
+                if tok.value == "function" and i + 2 < n and tokens[i + 1].kind == IDENT and tokens[i + 2].is_punct("("):
+                    self._function(tokens[i + 1].value, i + 2)
+                elif tok.value in ("const", "let", "var") and i + 2 < n and tokens[i + 1].kind == IDENT and tokens[i + 2].is_punct("="):
+                    self._binding(tokens[i + 1].value, i + 3)
+                elif tok.value in ("for", "while") and i + 1 < n and tokens[i + 1].is_punct("("):
+                    self._loop_statement(i + 1)
+                elif i + 1 < n and tokens[i + 1].is_punct("(") and tok.value in HOOK_BLOCKS:
+                    close = self._match(i + 1)
+                    if close != -1:
+                        kind = HOOK_BLOCKS[tok.value]
+                        self.blocks.append(_Span(tok.value, kind, tokens[i + 1].start, tokens[close].end))
+            elif tok.kind == PUNCT and tok.value in (".", "?.") and i + 2 < n:
+                name = tokens[i + 1]
+                if name.kind != IDENT or not tokens[i + 2].is_punct("("):
+                    continue
+                if name.value in LOOP_METHODS:
+                    close = self._match(i + 2)
+                    if close != -1:
+                        self.blocks.append(_Span(name.value, "loop", tokens[i + 2].start, tokens[close].end))
+                        self._jsx_in(i + 2, close)
+                elif name.value in ("from", "rpc") and self._is_supabase_chain(i):
+                    self._query(i)
+        return self
+
+    # ------------------------------------------------------------------
+    # Scopes
+    # ------------------------------------------------------------------
+    def _body_after(self, index: int) -> int:
+        """فهرس { الذي يبدأ جسم الدالة بعد المعاملات (يتجاوز نوع الإرجاع)"""
+        tokens = self.tokens
+        for j in range(index, min(index + 200, len(tokens))):
+            tok = tokens[j]
+            if tok.is_punct("{") and not tokens[j - 1].is_punct(":") and not tokens[j - 1].is_punct("<"):
+                return j
+            if tok.is_punct(";"):
+                return -1
+        return -1
+
+    def _function(self, name: str, params_open: int):
+        close = self._match(params_open)
+        if close == -1:
+            return
+        body = self._body_after(close + 1)
+        if body != -1:
+            end = self._match(body)
+            if end != -1:
+                self.functions.append(_Span(name, "function", self.tokens[params_open].start, self.tokens[end].end))
+
+    def _binding(self, name: str, index: int):
+        """const X = (...) => {...} / async / useCallback(...) / memo(...)"""
+        tokens = self.tokens
+        n = len(tokens)
+        if index < n and tokens[index].is_ident("async"):
+            index += 1
+        if index >= n:
+            return
+        tok = tokens[index]
+        if tok.kind == IDENT and tok.value in ("React",) and index + 2 < n and tokens[index + 1].is_punct("."):
+            index += 2
+            tok = tokens[index]
+        if tok.kind == IDENT and tok.value in WRAPPER_CALLS and index + 1 < n and tokens[index + 1].is_punct("("):
+            close = self._match(index + 1)
+            if close != -1:
+                self.functions.append(_Span(name, "function", tok.start, tokens[close].end))
+            return
+
+        if tok.is_punct("("):
+            close = self._match(index)
+        elif tok.kind == IDENT and index + 1 < n and tokens[index + 1].is_punct("=>"):
+            close = index
+        else:
+            return
+        if close == -1:
+            return
+        arrow = close + 1
+        while arrow < n and not tokens[arrow].is_punct("=>"):
+            if tokens[arrow].is_punct(";") or tokens[arrow].is_punct("{") and not tokens[arrow - 1].is_punct(":"):
+                return
+            arrow += 1
+        if arrow + 1 >= n:
+            return
+        if tokens[arrow + 1].is_punct("{"):
+            end = self._match(arrow + 1)
+        else:
+            end = arrow + 1
+            depth = 0
+            while end < n:
+                t = tokens[end]
+                if t.kind == PUNCT and t.value in "([{":
+                    depth += 1
+                elif t.kind == PUNCT and t.value in ")]}":
+                    if depth == 0:
+                        break
+                    depth -= 1
+                elif depth == 0 and (t.is_punct(";") or t.is_punct(",")):
+                    break
+                end += 1
+            end -= 1
+        if end != -1:
+            self.functions.append(_Span(name, "function", tok.start, tokens[end].end))
+
+    def _loop_statement(self, params_open: int):
+        tokens = self.tokens
+        close = self._match(params_open)
+        if close == -1 or close + 1 >= len(tokens):
+            return
+        end = self._match(close + 1) if tokens[close + 1].is_punct("{") else close + 1
+        if end != -1:
+            self.blocks.append(_Span("for", "loop", tokens[params_open].start, tokens[end].end))
+
+    def _jsx_in(self, start: int, end: int):
+        """أسماء المكونات المعروضة داخل .map (<Item ...)"""
+        tokens = self.tokens
+        for j in range(start, end):
+            if tokens[j].is_punct("<") and tokens[j + 1].kind == IDENT and tokens[j + 1].value[:1].isupper():
+                self.looped_components.add(tokens[j + 1].value)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def _is_supabase_chain(self, dot: int) -> bool:
+        """supabase.from / (supabase as any).from وليس Array.from أو supabase.storage.from"""
+        tokens = self.tokens
+        before = tokens[max(0, dot - 6):dot]
+        names = [t.value for t in before if t.kind == IDENT]
+        if not names or "storage" in names[-1:]:
+            return False
+        return any("supabase" in name.lower() for name in names)
+
+    def _query(self, dot: int):
+        tokens = self.tokens
+        method = tokens[dot + 1].value
+        open_paren = dot + 2
+        close = self._match(open_paren)
+        if close == -1:
+            return
+        target = _literal(tokens[open_paren + 1]) if open_paren + 1 < close else None
+        site = {
+            "file": self.rel,
+            "line": tokens[dot + 1].line,
+            "offset": tokens[dot + 1].start,
+            "table": (f"rpc:{target}" if method == "rpc" else target) or "<dynamic>",
+            "operation": "rpc" if method == "rpc" else "select",
+            "select": None,
+            "filters": [],
+            "modifiers": [],
+        }
+        explicit_select = False
+
+        j = close + 1
+        n = len(tokens)
+        while j + 2 < n and tokens[j].kind == PUNCT and tokens[j].value in (".", "?.") and tokens[j + 1].kind == IDENT and tokens[j + 2].is_punct("("):
+            name = tokens[j + 1].value
+            end = self._match(j + 2)
+            if end == -1:
+                break
+            first = _literal(tokens[j + 3]) if j + 3 < end else None
+            if name == "select":
+                explicit_select = True
+                if site["operation"] == "select" or site["select"] is None:
+                    args = end - (j + 3)
+                    if j + 3 == end:
+                        site["select"] = "*"
+                    elif first is not None and args == 1 or (first is not None and tokens[j + 4].is_punct(",")):
+                        site["select"] = " ".join(first.split())
+                    else:
+                        site["select"] = "<dynamic>"
+            elif name in WRITE_METHODS and method == "from":
+                site["operation"] = name
+            elif name in FILTER_METHODS:
+                site["filters"].append(f"{name}:{first}" if first is not None else name)
+            else:
+                site["modifiers"].append(name)
+            j = end + 1
+
+        if method == "from" and site["operation"] == "select" and not explicit_select:
+            site["select"] = "*"
+        self.queries.append(site)
+
+    def enclosing(self, offset: int) -> Tuple[Optional[_Span], Optional[_Span]]:
+        """(أقرب دالة، أبعد مكون/hook) يحتويان الموضع"""
+        containing = [f for f in self.functions if f.contains(offset)]
+        if not containing:
+            return None, None
+        innermost = min(containing, key=lambda f: f.end - f.start)
+        components = [f for f in containing if f.name[:1].isupper() or f.name.startswith("use")]
+        outermost = max(components, key=lambda f: f.end - f.start) if components else None
+        return innermost, outermost
+
+
+class SupabaseQueryIndex:
+    """كل مواضع الاستعلام في المشروع مع الأعلام وتقدير التكرار"""
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root)
+        self.sites: List[Dict] = []
+        self.columns: Dict[str, Set[str]] = {}
+
+    def build(self) -> "SupabaseQueryIndex":
+        self.columns = table_columns(self.project_root / "supabase" / "migrations")
+        graph = ImportGraph.build(self.project_root)
+        reverse = graph.reverse()
+
+        scanners: List[FileScanner] = []
+        looped: Set[str] = set()
+        for dirpath, dirs, names in os.walk(self.project_root / "src"):
+            dirs[:] = [d for d in dirs if d not in IGNORE_DIRS and d != "__tests__"]
+            for name in names:
+                if not name.endswith((".ts", ".tsx")) or re.search(r"\.(test|spec)\.", name):
+                    continue
+                path = Path(dirpath) / name
+                try:
+                    content = path.read_text(encoding="utf-8")
+                except (OSError, UnicodeDecodeError):
+                    continue
+                if "supabase" not in content and ".map(" not in content:
+                    continue
+                scanner = FileScanner(path.relative_to(self.project_root).as_posix(), content).scan()
+                looped |= scanner.looped_components
+                if scanner.queries:
+                    scanners.append(scanner)
+
+        for scanner in scanners:
+            fan_in = len({importer for importer, _ in reverse.get(scanner.rel, ())})
+            for site in scanner.queries:
+                self.sites.append(self._classify(scanner, site, fan_in, looped))
+        self._mark_duplicates()
+        return self
+
+    def _classify(self, scanner: FileScanner, site: Dict, fan_in: int, looped: Set[str]) -> Dict:
+        offset = site.pop("offset")
+        innermost, component = scanner.enclosing(offset)
+        blocks = [b for b in scanner.blocks if b.contains(offset)]
+        kinds = {b.kind for b in blocks}
+
+        if "cached" in kinds:
+            context = "cached"
+        elif "effect" in kinds:
+            context = "effect"
+        elif "handler" in kinds:
+            context = "handler"
+        elif innermost is None:
+            context = "module"
+        elif _HANDLER_RE.search(innermost.name):
+            context = "handler"
+        elif innermost is component and component.name[:1].isupper():
+            context = "render"
+        else:
+            context = "function"
+
+        flags = []
+        frequency = CONTEXT_WEIGHTS[context]
+        if "loop" in kinds:
+            flags.append("in_loop")
+            frequency *= LOOP_FACTOR
+        if component and component.name in looped and context in ("render", "effect"):
+            flags.append("per_item_effect")
+            frequency *= LOOP_FACTOR
+
+        width = len(self.columns.get(site["table"], ()))
+        if site["select"] == "*" and site["operation"] == "select":
+            if not self.columns or width >= WIDE_TABLE_COLUMNS:
+                flags.append("select_star")
+
+        site.update(
+            {
+                "function": innermost.name if innermost else "<module>",
+                "component": component.name if component else (innermost.name if innermost else "<module>"),
+                "context": context,
+                "table_columns": width,
+                "fan_in": fan_in,
+                "frequency": frequency * (1 + fan_in),
+                "flags": flags,
+            }
+        )
+        return site
+
+    @staticmethod
+    def signature(site: Dict) -> Tuple:
+        filters = tuple(sorted(f.split(":")[0] + ":" + f.split(":", 1)[-1] for f in site["filters"]))
+        return (site["table"], site["operation"], site["select"], filters)
+
+    def _mark_duplicates(self):
+        """نفس الجدول والأعمدة والفلاتر في أكثر من مكون"""
+        groups: Dict[Tuple, List[Dict]] = {}
+        for site in self.sites:
+            if site["operation"] == "select" and site["table"] != "<dynamic>":
+                groups.setdefault(self.signature(site), []).append(site)
+        for sites in groups.values():
+            owners = {(s["file"], s["component"]) for s in sites}
+            if len(owners) < 2:
+                continue
+            for site in sites:
+                site["flags"].append("duplicate")
+                site["duplicates"] = len(sites)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def sorted_sites(self, sort: str = "frequency", flag: Optional[str] = None) -> List[Dict]:
+        sites = [s for s in self.sites if not flag or flag in s["flags"]]
+        keys = {
+            "frequency": lambda s: (-s["frequency"], s["file"], s["line"]),
+            "table": lambda s: (s["table"], -s["frequency"]),
+            "file": lambda s: (s["file"], s["line"]),
+            "flags": lambda s: (-len(s["flags"]), -s["frequency"]),
+        }
+        return sorted(sites, key=keys[sort])
+
+    def summary(self) -> Dict:
+        flags: Dict[str, int] = {}
+        tables: Dict[str, int] = {}
+        for site in self.sites:
+            for flag in site["flags"]:
+                flags[flag] = flags.get(flag, 0) + 1
+            tables[site["table"]] = tables.get(site["table"], 0) + site["frequency"]
+        return {
+            "sites": len(self.sites),
+            "files": len({s["file"] for s in self.sites}),
+            "tables": len(tables),
+            "flags": flags,
+            "hot_tables": sorted(tables.items(), key=lambda kv: -kv[1])[:10],
+        }
+
+    def to_dict(self) -> Dict:
+        return {"summary": self.summary(), "sites": self.sorted_sites()}
+
+
+def format_site(site: Dict) -> str:
+    flags = ",".join(site["flags"]) or "-"
+    select = site["select"] or ""
+    if len(select) > 30:
+        select = select[:27] + "..."
+    return (
+        f"  {site['frequency']:6d}  {site['table']:28s} {site['operation']:7s} {select:30s} "
+        f"{flags:28s} {site['file']}:{site['line']} ({site['component']})"
+    )
+
+
+def report_lines(result: Dict, top: int = 15) -> List[str]:
+    """أسطر جاهزة لتقرير التحليل المعماري"""
+    summary = result["summary"]
+    lines = [
+        f"🗄️  {summary['sites']} موضع استعلام في {summary['files']} ملف على {summary['tables']} جدول",
+    ]
+    for flag, count in sorted(summary["flags"].items()):
+        lines.append(f"  ⚠️  {flag}: {count}")
+    lines.append(f"🔥 أعلى {min(top, len(result['sites']))} مواضع حسب التكرار المقدّر:")
+    lines.extend(format_site(site) for site in result["sites"][:top])
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UberFix Supabase query index")
+    parser.add_argument("--project-root", type=Path, default=DEFAULT_PROJECT_ROOT)
+    parser.add_argument("--sort", choices=("frequency", "table", "file", "flags"), default="frequency")
+    parser.add_argument("--flag", choices=("in_loop", "per_item_effect", "select_star", "duplicate"))
+    parser.add_argument("--top", type=int, default=50)
+    parser.add_argument("--json", type=Path, help="حفظ الفهرس الكامل بصيغة JSON")
+    args = parser.parse_args()
+
+    index = SupabaseQueryIndex(args.project_root).build()
+    summary = index.summary()
+    print(f"🗄️  {summary['sites']} موضع استعلام في {summary['files']} ملف على {summary['tables']} جدول")
+    for flag, count in sorted(summary["flags"].items()):
+        print(f"  ⚠️  {flag}: {count}")
+    print()
+    print(f"  {'freq':>6s}  {'table':28s} {'op':7s} {'select':30s} {'flags':28s} location")
+    for site in index.sorted_sites(args.sort, args.flag)[:args.top]:
+        print(format_site(site))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(index.to_dict(), f, ensure_ascii=False, indent=1)
+        print(f"\n📊 الفهرس الكامل: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
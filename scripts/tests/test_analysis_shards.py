@@ -0,0 +1,68 @@
+import copy
+import os
+
+import pytest
+
+import architecture_analyzer
+from analysis_shards import PartialResult, ShardMismatchError, merge_all
+from architecture_analyzer import UberFixArchitectureAnalyzer
+
+
+FILES = {
+    "package.json": "{}",
+    "src/main.tsx": "export function main() { return 1; }\n",
+    "src/App.tsx": "export default function App() { return null; }\n",
+    "src/lib/utils.ts": "export const add = (a: number, b: number) => a + b;\n",
+    "src/hooks/useThing.ts": "export function useThing() { return 0; }\n",
+    "docs/notes.md": "# notes\n",
+}
+
+
+@pytest.fixture
+def project(tmp_path):
+    for name, content in FILES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return tmp_path
+
+
+def _reversed_walk(walk):
+    """os.walk بترتيب إدراج معكوس (نظام ملفات آخر)؛ نفس القوائم حتى يبقى تقليم dirs فعّالاً"""
+    def reversed_walk(top, *args, **kwargs):
+        for root, dirs, files in walk(top, *args, **kwargs):
+            dirs.reverse()
+            files.reverse()
+            yield root, dirs, files
+    return reversed_walk
+
+
+def _layout(structure):
+    return [(folder, list(record.subfolders), [f.path for f in record.files]) for folder, record in structure.items()]
+
+
+def test_merge_partials_from_different_listing_orders(project, monkeypatch):
+    first = UberFixArchitectureAnalyzer(project).analyze_shard(0, 2)
+    monkeypatch.setattr(architecture_analyzer.os, "walk", _reversed_walk(os.walk))
+    second = UberFixArchitectureAnalyzer(project).analyze_shard(1, 2)
+    monkeypatch.undo()
+
+    merged = merge_all([first, second])
+    assert merged.complete
+    expected = UberFixArchitectureAnalyzer(project).analyze_project_structure()
+    assert _layout(merged.structure()) == _layout(expected)
+
+
+def test_merge_ignores_skeleton_order_but_not_content(project):
+    partial = UberFixArchitectureAnalyzer(project).analyze_shard(0, 2)
+    other = UberFixArchitectureAnalyzer(project).analyze_shard(1, 2)
+
+    shuffled = copy.deepcopy(other.to_dict())
+    for entry in shuffled["skeleton"].values():
+        entry["files"].reverse()
+        entry["subfolders"].reverse()
+    assert partial.merge(PartialResult.from_dict(shuffled)).complete
+
+    shuffled["skeleton"]["src"]["files"].append("extra.ts")
+    with pytest.raises(ShardMismatchError):
+        partial.merge(PartialResult.from_dict(shuffled))
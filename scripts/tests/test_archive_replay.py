@@ -0,0 +1,87 @@
+import asyncio
+import datetime
+
+import pytest
+
+from archive_replay import (CREATE, STATUS, HttpPool, ReplayEvent, load_events, replay, schedule, serve_stub,
+                            summarize)
+
+ARCHIVE = [
+    "id,title,store_id,priority,estimated_cost,status,created_at,scheduled_date,completion_date,is_deleted",
+    # created_at وقت استيراد واحد ← يُستخدم scheduled_date
+    "r1,تسريب,s1,high,150,completed,2024-06-01 09:00:00,2024-01-01,2024-01-01,false",
+    # إغلاق مسجل قبل الجدولة: الحالة لا تسبق الإنشاء
+    "r2,كهرباء,s2,low,,cancelled,2024-06-01 09:00:00,2024-01-03,2024-01-02,false",
+    "r3,تكييف,s1,medium,90,pending,2024-06-01 09:00:00,2024-01-02,,false",
+    "r4,محذوف,s3,low,10,completed,2024-06-01 09:00:00,2024-01-02,2024-01-05,true",
+]
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = tmp_path / "archive.csv"
+    path.write_text("\n".join(ARCHIVE) + "\n", encoding="utf-8")
+    return path
+
+
+def test_load_events_orders_status_after_create(archive):
+    events, column = load_events(archive)
+    assert column == "scheduled_date"
+    assert [e.at for e in events] == sorted(e.at for e in events)
+    assert {e.request_id for e in events} == {"r1", "r2", "r3"}
+    assert [e.request_id for e in events if e.kind == STATUS] == ["r1", "r2"]
+
+    position = {(e.request_id, e.kind): i for i, e in enumerate(events)}
+    at = {(e.request_id, e.kind): e.at for e in events}
+    for request_id in ("r1", "r2"):
+        assert position[(request_id, CREATE)] < position[(request_id, STATUS)]
+        assert at[(request_id, CREATE)] <= at[(request_id, STATUS)]
+    # التواريخ بدون وقت تُوزع داخل اليوم بدلاً من منتصف الليل
+    assert all(e.at.time() != datetime.time() for e in events if e.kind == CREATE)
+
+
+def test_schedule_offsets_and_max_gap():
+    start = datetime.datetime(2024, 1, 1)
+    events = [ReplayEvent(start + datetime.timedelta(days=d), CREATE, str(d), {}) for d in (0, 1, 1, 10)]
+    assert schedule(events, speed=86400) == [0.0, 1.0, 1.0, 10.0]
+    assert schedule(events, speed=86400, max_gap=2.0) == [0.0, 1.0, 1.0, 3.0]
+    assert schedule(events, speed=86400 * 2) == [0.0, 0.5, 0.5, 5.0]
+
+
+async def _replay_against_stub(events, error_rate):
+    server = await serve_stub(port=0, latency_ms=1.0, jitter_ms=0.0, error_rate=error_rate)
+    port = server.sockets[0].getsockname()[1]
+    pool = HttpPool(f"http://127.0.0.1:{port}", size=4, timeout=5.0)
+    try:
+        offsets = schedule(events, speed=86400 * 1000, max_gap=0.01)
+        return await replay(events, offsets, pool, progress=False), pool.connections_opened
+    finally:
+        await pool.close()
+        server.close()
+        await server.wait_closed()
+
+
+def test_replay_against_stub_counts_ok(archive):
+    events, _ = load_events(archive)
+    (outcomes, elapsed), opened = asyncio.run(_replay_against_stub(events, error_rate=0.0))
+    assert sorted((o.kind, o.status) for o in outcomes) == sorted(
+        (e.kind, 201 if e.kind == CREATE else 204) for e in events
+    )
+    assert opened <= 4
+
+    summary = summarize(outcomes, elapsed)
+    assert summary["all"]["requests"] == summary["all"]["ok"] == len(events)
+    assert summary[CREATE]["ok"] == 3 and summary[STATUS]["ok"] == 2
+    assert summary["all"]["http_errors"] == summary["all"]["failed"] == 0
+
+
+def test_replay_against_stub_counts_http_errors(archive):
+    events, _ = load_events(archive)
+    (outcomes, elapsed), _ = asyncio.run(_replay_against_stub(events, error_rate=1.0))
+    assert {o.status for o in outcomes} == {503}
+
+    summary = summarize(outcomes, elapsed)
+    assert summary["all"]["ok"] == 0
+    assert summary["all"]["http_errors"] == len(events)
+    assert summary["all"]["failed"] == 0
+    assert summary["all"]["throughput_rps"] == 0.0
@@ -0,0 +1,96 @@
+import csv
+from collections import Counter, defaultdict
+
+import numpy as np
+import pytest
+
+from maintenance_analytics import (ARCHIVE_SCHEMA, CAT, DROPPED_STATUSES, FLOAT, STATUS_FUNNEL, ColumnTable,
+                                   MaintenanceAnalytics, generate_archive, ingest_csv, load_table)
+
+
+SCHEMA = {"id": CAT, "area": FLOAT}
+
+
+@pytest.fixture(scope="module")
+def archive(tmp_path_factory):
+    path = tmp_path_factory.mktemp("archive") / "archive.csv"
+    return generate_archive(path, 3000, store_ids=[f"store-{i}" for i in range(12)])
+
+
+def _active_rows(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return [row for row in csv.DictReader(f) if row["is_deleted"] != "true"]
+
+
+def test_cost_per_store_matches_row_by_row(archive, tmp_path):
+    expected = defaultdict(lambda: [0, 0.0, 0.0])
+    for row in _active_rows(archive):
+        totals = expected[row["store_id"]]
+        totals[0] += 1
+        totals[1] += float(row["actual_cost"] or 0)
+        totals[2] += float(row["estimated_cost"] or 0)
+
+    rows = MaintenanceAnalytics(tmp_path, archive_path=archive).cost_per_store(top=None)
+    assert {row["store_id"] for row in rows} == set(expected)
+    assert [row["actual_total"] for row in rows] == sorted((row["actual_total"] for row in rows), reverse=True)
+    for row in rows:
+        count, actual, estimated = expected[row["store_id"]]
+        assert row["requests"] == count
+        assert row["actual_total"] == pytest.approx(actual)
+        assert row["estimated_total"] == pytest.approx(estimated)
+        assert row["actual_mean"] == pytest.approx(actual / count)
+
+
+def test_status_funnel_matches_row_by_row(archive, tmp_path):
+    stage_of = {name: stage for stage, (_, names) in enumerate(STATUS_FUNNEL) for name in names}
+    current = Counter()
+    for row in _active_rows(archive):
+        status = row["status"].strip().lower()
+        if status in DROPPED_STATUSES:
+            current["dropped"] += 1
+        elif status in stage_of:
+            current[STATUS_FUNNEL[stage_of[status]][0]] += 1
+        else:
+            current["unknown"] += 1
+
+    rows = {row["stage"]: row for row in MaintenanceAnalytics(tmp_path, archive_path=archive).status_funnel()}
+    assert {name: row["current"] for name, row in rows.items()} == {
+        name: current[name] for name in [*(name for name, _ in STATUS_FUNNEL), "dropped", "unknown"]
+    }
+    for i, (name, _) in enumerate(STATUS_FUNNEL):
+        assert rows[name]["reached"] == sum(current[later] for later, _ in STATUS_FUNNEL[i:])
+
+
+def test_npz_round_trip_is_identical(archive, tmp_path):
+    table = ingest_csv(archive, ARCHIVE_SCHEMA, chunk_rows=700)
+    table.save(tmp_path / "archive.npz", {"signature": "test"})
+    loaded, meta = ColumnTable.load(tmp_path / "archive.npz")
+
+    assert meta["signature"] == "test"
+    assert loaded.columns.keys() == table.columns.keys()
+    for name, column in table.columns.items():
+        assert loaded[name].dtype == column.dtype
+        np.testing.assert_array_equal(loaded[name], column)
+    assert loaded.categories.keys() == table.categories.keys()
+    for name, labels in table.categories.items():
+        np.testing.assert_array_equal(loaded.labels(name), labels)
+    # الدفعات الصغيرة لا تغير الأكواد عن القراءة في دفعة واحدة
+    whole = ingest_csv(archive, ARCHIVE_SCHEMA)
+    for name in ("store_id", "status"):
+        np.testing.assert_array_equal(whole.labels(name)[whole[name]], loaded.labels(name)[loaded[name]])
+
+
+def test_load_table_counts_dropped_rows_and_caches_them(tmp_path):
+    path = tmp_path / "stores.csv"
+    path.write_text("id,area,status\ns1,120,active\ns2,broken\ns3,80,active,extra\ns4,,active\n", encoding="utf-8")
+    cache = tmp_path / "cache"
+
+    table = load_table(path, SCHEMA, cache)
+    assert len(table) == 2
+    assert table.dropped_rows == 2
+    assert list(table.labels("id")[table["id"]]) == ["s1", "s4"]
+
+    cached = load_table(path, SCHEMA, cache)
+    assert (cache / "stores.npz").exists()
+    assert cached.dropped_rows == 2
+    assert len(cached) == 2
@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+from pg_bulk_loader import BulkLoader, Dataset, csv_batches
+
+
+def _write(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_csv_batches_counts_dropped_rows(tmp_path):
+    path = _write(tmp_path / "malls.csv", [
+        "id,name,location",
+        "1,Agora,Fifth Settlement",
+        "2,broken",
+        "3,City Stars,Nasr City",
+        "4,Mall,Maadi,extra",
+    ])
+    batches = list(csv_batches(path, ["id", "name"], batch_rows=1))
+    assert [(rows, dropped) for _, rows, dropped in batches] == [(1, 0), (1, 1), (0, 1)]
+    assert b"".join(data for data, _, _ in batches) == b"1,Agora\n3,City Stars\n"
+
+
+@pytest.fixture
+def pg():
+    """اتصال بقاعدة PG_DSN وschema مؤقت يُحذف بعد الاختبار (يُتخطى بدون خادم)"""
+    dsn = os.getenv("PG_DSN")
+    if not dsn:
+        pytest.skip("PG_DSN not set")
+    psycopg = pytest.importorskip("psycopg")
+    try:
+        conn = psycopg.connect(dsn, connect_timeout=3)
+    except psycopg.OperationalError as e:
+        pytest.skip(f"Postgres unavailable: {e}")
+    schema = f"uberfix_loader_test_{os.getpid()}"
+    with conn.cursor() as cur:
+        cur.execute(f'CREATE SCHEMA "{schema}"')
+        cur.execute(
+            f'CREATE TABLE "{schema}".malls (id serial PRIMARY KEY, name text NOT NULL, location text, '
+            f"type text DEFAULT 'مول')"
+        )
+    conn.commit()
+    try:
+        yield conn, schema
+    finally:
+        conn.rollback()
+        with conn.cursor() as cur:
+            cur.execute(f'DROP SCHEMA "{schema}" CASCADE')
+        conn.commit()
+        conn.close()
+
+
+def test_copy_staging_upsert_and_sequence_sync(pg, tmp_path):
+    conn, schema = pg
+    dataset = Dataset("malls", f"{schema}.malls", "malls_rows.csv")
+    loader = BulkLoader(conn, batch_rows=2)
+
+    first = _write(tmp_path / "first.csv", [
+        "id,name,location,unknown_column",
+        "1,Agora,Fifth Settlement,x",
+        "2,City Stars,Nasr City,x",
+        "2,City Stars Mall,Nasr City,x",
+        "3,broken",
+        "10,Mall of Egypt,October,x",
+    ])
+    result = loader.load(dataset, first)
+    assert result["rows"] == 4
+    assert result["dropped_rows"] == 1
+    assert result["skipped_columns"] == ["unknown_column"]
+
+    # تحميل ثانٍ لنفس المفاتيح يحدّث ولا يكرر
+    second = _write(tmp_path / "second.csv", [
+        "id,name,location",
+        "1,Agora Mall,Fifth Settlement",
+    ])
+    assert loader.load(dataset, second)["upserted"] == 1
+
+    with conn.cursor() as cur:
+        cur.execute(f'SELECT id, name, type FROM "{schema}".malls ORDER BY id')
+        assert cur.fetchall() == [(1, "Agora Mall", "مول"), (2, "City Stars Mall", "مول"), (10, "Mall of Egypt", "مول")]
+        # التسلسل تقدم بعد المعرفات الصريحة فلا يتعارض الإدخال التالي
+        cur.execute(f"INSERT INTO \"{schema}\".malls (name) VALUES ('Cairo Festival') RETURNING id")
+        assert cur.fetchone()[0] == 11
+    conn.commit()
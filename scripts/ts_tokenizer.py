@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+UberFix TS/JSX Tokenizer
+محلل رموز خفيف لملفات TypeScript/JSX مع دعم القوالب والتعابير المنتظمة و JSX
+
+يُستخدم من أدوات الإصلاح والتحليل بدلاً من البحث النصي، ويحتفظ لكل رمز
+بموضعه في الملف حتى يمكن تطبيق التعديلات كنطاقات (span) دفعة واحدة.
+"""
+
+import re
+import bisect
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+
+IDENT = "ident"
+NUMBER = "number"
+STRING = "string"
+TEMPLATE = "template"
+REGEX = "regex"
+PUNCT = "punct"
+JSX_TEXT = "jsx_text"
+
+# '>' يبقى رمزاً مفرداً حتى لا تختلط أقواس الأنواع العامة Array<Array<T>>
+PUNCTUATORS = sorted(
+    [
+        "...", "===", "!==", "**=", "<<=", "&&=", "||=", "??=",
+        "=>", "==", "!=", "<=", ">=", "&&", "||", "??", "?.", "++", "--",
+        "+=", "-=", "*=", "/=", "%=", "&=", "|=", "^=", "**", "<<",
+        "{", "}", "(", ")", "[", "]", ";", ",", "<", ">", "+", "-", "*",
+        "/", "%", "&", "|", "^", "!", "~", "?", ":", "=", ".", "@", "#",
+    ],
+    key=len,
+    reverse=True,
+)
+
+# بعد هذه الكلمات يبدأ تعبير جديد (regex أو JSX وليس قسمة/مقارنة)
+EXPRESSION_KEYWORDS = {
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+    "throw", "case", "do", "else", "yield", "await", "default", "extends",
+}
+
+_IDENT_RE = re.compile(r"[A-Za-z_$\u0080-\uffff][\w$\u0080-\uffff]*")
+_NUMBER_RE = re.compile(
+    r"0[xX][\da-fA-F_]+n?|0[bB][01_]+n?|0[oO][0-7_]+n?|"
+    r"(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?"
+)
+_PUNCT_RE = re.compile("|".join(re.escape(p) for p in PUNCTUATORS))
+_SPACE_RE = re.compile(r"[ \t\r\f\v\ufeff\u00a0]+")
+_JSX_NAME_RE = re.compile(r"[A-Za-z_$][\w$.:-]*")
+_GENERIC_ARROW_RE = re.compile(r"<\s*[A-Za-z_$][\w$]*\s*(?:,|extends\b)")
+
+
+class Token:
+    """رمز واحد مع موضعه (start/end بالحروف، line يبدأ من 1)"""
+
+    __slots__ = ("kind", "value", "start", "end", "line", "nl_before")
+
+    def __init__(self, kind: str, value: str, start: int, end: int, line: int, nl_before: bool):
+        self.kind = kind
+        self.value = value
+        self.start = start
+        self.end = end
+        self.line = line
+        self.nl_before = nl_before
+
+    def is_punct(self, value: str) -> bool:
+        return self.kind == PUNCT and self.value == value
+
+    def is_ident(self, value: Optional[str] = None) -> bool:
+        return self.kind == IDENT and (value is None or self.value == value)
+
+    def __repr__(self) -> str:
+        return f"Token({self.kind}, {self.value!r}, {self.start}:{self.end}, L{self.line})"
+
+
+class _Tokenizer:
+    def __init__(self, source: str, jsx: bool):
+        self.src = source
+        self.n = len(source)
+        self.jsx = jsx
+        self.i = 0
+        self.line = 1
+        self.nl = False
+        self.tokens: List[Token] = []
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def emit(self, kind: str, start: int, end: int):
+        value = self.src[start:end]
+        self.tokens.append(Token(kind, value, start, end, self.line, self.nl))
+        self.nl = False
+        self.line += value.count("\n")
+        self.i = end
+
+    def skip_trivia(self):
+        """تخطي المسافات والتعليقات"""
+        src, n = self.src, self.n
+        while self.i < n:
+            c = src[self.i]
+            if c == "\n":
+                self.line += 1
+                self.nl = True
+                self.i += 1
+            elif c in " \t\r\f\v\ufeff\u00a0":
+                self.i = _SPACE_RE.match(src, self.i).end()
+            elif src.startswith("//", self.i):
+                end = src.find("\n", self.i)
+                self.i = n if end == -1 else end
+            elif src.startswith("/*", self.i):
+                end = src.find("*/", self.i + 2)
+                end = n if end == -1 else end + 2
+                newlines = src.count("\n", self.i, end)
+                if newlines:
+                    self.line += newlines
+                    self.nl = True
+                self.i = end
+            else:
+                break
+
+    def expression_allowed(self) -> bool:
+        """هل الموضع الحالي بداية تعبير؟"""
+        if not self.tokens:
+            return True
+        prev = self.tokens[-1]
+        if prev.kind == PUNCT:
+            return prev.value not in (")", "]", "}")
+        if prev.kind == IDENT:
+            return prev.value in EXPRESSION_KEYWORDS
+        return prev.kind == JSX_TEXT
+
+    # ------------------------------------------------------------------
+    # Code mode
+    # ------------------------------------------------------------------
+    def code(self, stop_at_brace: bool = False):
+        """مسح كود عادي؛ عند stop_at_brace يتوقف قبل '}' غير المتوازنة"""
+        src = self.src
+        depth = 0
+        while True:
+            self.skip_trivia()
+            if self.i >= self.n:
+                return
+            c = src[self.i]
+            start = self.i
+
+            if c == "}" and stop_at_brace and depth == 0:
+                return
+            if c in "'\"":
+                self.emit(STRING, start, self.string_end(start))
+            elif c == "`":
+                self.template()
+            elif c.isdigit() or (c == "." and src[start + 1:start + 2].isdigit()):
+                m = _NUMBER_RE.match(src, start)
+                self.emit(NUMBER, start, m.end() if m else start + 1)
+            elif c == "/" and self.expression_allowed():
+                self.emit(REGEX, start, self.regex_end(start))
+            elif c == "<" and self.jsx and self.expression_allowed() and self.jsx_starts(start):
+                self.jsx_element()
+            else:
+                m = _IDENT_RE.match(src, start)
+                if m:
+                    self.emit(IDENT, start, m.end())
+                    continue
+                m = _PUNCT_RE.match(src, start)
+                p = m.group() if m else c
+                if p == "{":
+                    depth += 1
+                elif p == "}":
+                    depth -= 1
+                self.emit(PUNCT, start, start + len(p))
+
+    def string_end(self, start: int) -> int:
+        src, quote = self.src, self.src[start]
+        i = start + 1
+        while i < self.n:
+            c = src[i]
+            if c == "\\":
+                i += 2
+                continue
+            if c == quote or c == "\n":
+                return i + 1
+            i += 1
+        return self.n
+
+    def regex_end(self, start: int) -> int:
+        src = self.src
+        i = start + 1
+        in_class = False
+        while i < self.n:
+            c = src[i]
+            if c == "\\":
+                i += 2
+                continue
+            if c == "\n":
+                return i
+            if c == "[":
+                in_class = True
+            elif c == "]":
+                in_class = False
+            elif c == "/" and not in_class:
+                i += 1
+                while i < self.n and (src[i].isalnum() or src[i] == "_"):
+                    i += 1
+                return i
+            i += 1
+        return self.n
+
+    def template(self):
+        """قالب نصي `...${expr}...` مع تداخل التعابير"""
+        src = self.src
+        chunk_start = self.i
+        i = self.i + 1
+        while i < self.n:
+            c = src[i]
+            if c == "\\":
+                i += 2
+                continue
+            if c == "`":
+                self.emit(TEMPLATE, chunk_start, i + 1)
+                return
+            if c == "$" and src.startswith("${", i):
+                self.emit(TEMPLATE, chunk_start, i + 2)
+                self.code(stop_at_brace=True)
+                if self.i >= self.n:
+                    return
+                chunk_start = self.i
+                i = self.i + 1
+                continue
+            i += 1
+        self.emit(TEMPLATE, chunk_start, self.n)
+
+    # ------------------------------------------------------------------
+    # JSX mode
+    # ------------------------------------------------------------------
+    def jsx_starts(self, start: int) -> bool:
+        nxt = self.src[start + 1:start + 2]
+        if nxt == ">":
+            return True
+        if not (nxt.isalpha() or nxt in "_$"):
+            return False
+        # <T,>(x) => ... أو <T extends X> دالة عامة وليست JSX
+        return not _GENERIC_ARROW_RE.match(self.src, start)
+
+    def jsx_element(self):
+        src = self.src
+        self.emit(PUNCT, self.i, self.i + 1)  # <
+        self.skip_trivia()
+        if src.startswith(">", self.i):
+            self.emit(PUNCT, self.i, self.i + 1)
+            self.jsx_children()
+            return
+
+        m = _JSX_NAME_RE.match(src, self.i)
+        if m:
+            self.emit(IDENT, self.i, m.end())
+
+        # attributes
+        while True:
+            self.skip_trivia()
+            if self.i >= self.n:
+                return
+            c = src[self.i]
+            if src.startswith("/>", self.i):
+                self.emit(PUNCT, self.i, self.i + 2)
+                return
+            if c == ">":
+                self.emit(PUNCT, self.i, self.i + 1)
+                self.jsx_children()
+                return
+            if c == "{":
+                self.jsx_expression()
+            elif c in "'\"":
+                end = src.find(c, self.i + 1)
+                self.emit(STRING, self.i, self.n if end == -1 else end + 1)
+            elif c == "<":
+                self.jsx_element()
+            else:
+                m = _JSX_NAME_RE.match(src, self.i)
+                self.emit(IDENT if m else PUNCT, self.i, m.end() if m else self.i + 1)
+
+    def jsx_expression(self):
+        self.emit(PUNCT, self.i, self.i + 1)  # {
+        self.code(stop_at_brace=True)
+        if self.i < self.n:
+            self.emit(PUNCT, self.i, self.i + 1)  # }
+
+    def jsx_children(self):
+        src = self.src
+        while self.i < self.n:
+            c = src[self.i]
+            if c == "{":
+                self.jsx_expression()
+            elif c == "<":
+                j = self.i + 1
+                while j < self.n and src[j] in " \t\r\n":
+                    j += 1
+                if src.startswith("/", j):
+                    self.jsx_closing_tag()
+                    return
+                self.jsx_element()
+            else:
+                start = self.i
+                end = start
+                while end < self.n and src[end] not in "{<":
+                    end += 1
+                text = src[start:end]
+                if text.strip():
+                    self.emit(JSX_TEXT, start, end)
+                else:
+                    self.line += text.count("\n")
+                    self.nl = self.nl or "\n" in text
+                    self.i = end
+
+    def jsx_closing_tag(self):
+        src = self.src
+        self.emit(PUNCT, self.i, self.i + 1)  # <
+        self.skip_trivia()
+        self.emit(PUNCT, self.i, self.i + 1)  # /
+        self.skip_trivia()
+        m = _JSX_NAME_RE.match(src, self.i)
+        if m:
+            self.emit(IDENT, self.i, m.end())
+            self.skip_trivia()
+        if src.startswith(">", self.i):
+            self.emit(PUNCT, self.i, self.i + 1)
+
+
+def tokenize(source: str, jsx: bool = True) -> List[Token]:
+    """تحويل مصدر TS/TSX إلى قائمة رموز (بدون المسافات والتعليقات)"""
+    tokenizer = _Tokenizer(source, jsx)
+    tokenizer.code()
+    return tokenizer.tokens
+
+
+def is_jsx_path(path) -> bool:
+    """ملفات .tsx/.jsx/.js تسمح بصيغة JSX"""
+    return str(path).endswith((".tsx", ".jsx", ".js"))
+
+
+def matching_index(tokens: Sequence[Token], open_index: int) -> int:
+    """فهرس القوس المغلق المقابل لـ ( أو [ أو { (أو -1)"""
+    pairs = {"(": ")", "[": "]", "{": "}"}
+    opener = tokens[open_index].value
+    closer = pairs[opener]
+    depth = 0
+    for j in range(open_index, len(tokens)):
+        tok = tokens[j]
+        if tok.kind != PUNCT:
+            continue
+        if tok.value == opener:
+            depth += 1
+        elif tok.value == closer:
+            depth -= 1
+            if depth == 0:
+                return j
+    return -1
+
+
+class LineIndex:
+    """تحويل (سطر، عمود) إلى موضع في النص والعكس"""
+
+    def __init__(self, source: str):
+        self.starts = [0]
+        pos = source.find("\n")
+        while pos != -1:
+            self.starts.append(pos + 1)
+            pos = source.find("\n", pos + 1)
+        # ESLint يحسب الأعمدة والمواضع بوحدات UTF-16
+        self.astral = [i for i, ch in enumerate(source) if ord(ch) > 0xFFFF]
+
+    def offset(self, line: int, column: int) -> int:
+        """line و column يبدآن من 1 (كما في ESLint)"""
+        start = self.starts[min(max(line, 1), len(self.starts)) - 1]
+        if not self.astral:
+            return start + column - 1
+        units = column - 1
+        pos = start
+        first = bisect.bisect_left(self.astral, start)
+        for idx in self.astral[first:]:
+            if idx >= pos + units:
+                break
+            units -= 1
+        return pos + units
+
+    def from_utf16(self, offset: int) -> int:
+        """تحويل موضع UTF-16 (range في ESLint) إلى موضع Python"""
+        if not self.astral:
+            return offset
+        pos = offset
+        for idx in self.astral:
+            if idx >= pos:
+                break
+            pos -= 1
+        return pos
+
+    def line_of(self, offset: int) -> int:
+        return bisect.bisect_right(self.starts, offset)
+
+
+def find_token(tokens: Sequence[Token], offset: int, starts: Optional[List[int]] = None) -> int:
+    """فهرس الرمز الذي يبدأ عند offset أو يحتويه (أو -1)
+
+    مرّر ``starts`` (مواضع بداية الرموز) عند تكرار البحث في الملف نفسه.
+    """
+    if starts is None:
+        starts = [t.start for t in tokens]
+    lo = bisect.bisect_right(starts, offset) - 1
+    if lo >= 0 and tokens[lo].start <= offset < tokens[lo].end:
+        return lo
+    return -1
+
+
+Edit = Tuple[int, int, str]
+
+
+def apply_edits(source: str, edits: Iterable[Edit]) -> Tuple[str, List[Edit]]:
+    """تطبيق تعديلات (start, end, text) دفعة واحدة
+
+    تُرفض التعديلات المتداخلة مع تعديل سابق وتُعاد في القائمة الثانية.
+    """
+    ordered = sorted(edits, key=lambda e: (e[0], e[1]))
+    parts: List[str] = []
+    rejected: List[Edit] = []
+    cursor = 0
+    for start, end, text in ordered:
+        if start < cursor:
+            rejected.append((start, end, text))
+            continue
+        parts.append(source[cursor:start])
+        parts.append(text)
+        cursor = end
+    parts.append(source[cursor:])
+    return "".join(parts), rejected
@@ -7,17 +7,54 @@ UberFix Code Repair & Validator
 import os
 import sys
 import json
+import time
+import argparse
+import threading
 import subprocess
+from collections import deque
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Tuple
 import datetime
 
+from backup_store import BackupStore
+from import_graph import ImportGraph
+from lint_client import LintWorkerClient, LintWorkerError, count_errors, format_results
+from perf_spans import Tracer
+from ts_tokenizer import Edit, Token, apply_edits, is_jsx_path, matching_index, tokenize
+
 
 class UberFixRepair:
-    def __init__(self):
-        self.project_root = Path("/opt/UberFix")
+    # عدد الملفات المعدّلة التي تُكتب معاً (النسخ الاحتياطية أولاً ثم المصادر)
+    WRITE_BATCH_SIZE = 64
+    TEST_TIMEOUT = 300
+    # تغيير هذه الملفات يؤثر على كل الاختبارات وليس على ما يستوردها فقط
+    FULL_SUITE_TRIGGERS = {
+        "package.json",
+        "vitest.config.ts",
+        "vite.config.ts",
+        "tsconfig.json",
+        "tsconfig.app.json",
+        "src/__tests__/setup.ts",
+    }
+
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        tracer: Optional[Tracer] = None,
+        backup_dir: Optional[Path] = None,
+        lint_worker: bool = False,
+    ):
+        self.project_root = Path(project_root or "/opt/UberFix")
+        # التحقق عبر عامل ESLint/TypeScript الدائم (scripts/lint_worker.mjs) بدلاً من npx
+        self.lint_worker = lint_worker
         self.repair_log: List[str] = []
         self.fixed_files = set()
+        # القياس اختياري ومعطّل افتراضياً
+        self.tracer = tracer or Tracer(enabled=False)
+
+        # نسخ احتياطية معنونة بالمحتوى خارج src/ بدلاً من ملفات .backup.* بجانب المصدر
+        self.backup_store = BackupStore(self.project_root, backup_dir)
+        self.pending_writes: Dict[Path, str] = {}
 
         # تحديد مدير الحزم (pnpm / npm)
         self.package_manager = self.detect_package_manager()
@@ -40,6 +77,9 @@ class UberFixRepair:
         self.repair_log.append(log_entry)
         print(log_entry)
 
+        if action.startswith(("FIXED_", "REMOVED_", "ADDED_")):
+            self.tracer.count("fixes_applied")
+
     def get_all_source_files(self) -> List[Path]:
         """جمع كل ملفات المصدر"""
         patterns = [
@@ -65,13 +105,15 @@ class UberFixRepair:
 
         return list(set(source_files))
 
-    def analyze_file(self, file_path: Path) -> Dict:
-        """تحليل ملف لاكتشاف المشاكل"""
+    def analyze_file(self, file_path: Path, content: Optional[str] = None) -> Dict:
+        """تحليل ملف لاكتشاف المشاكل (content: محتوى مقروء مسبقاً بدلاً من قراءة الملف)"""
         issues = []
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            if content is None:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+                self.tracer.count("bytes_read", len(content))
 
             file_ext = file_path.suffix.lower()
 
@@ -137,43 +179,127 @@ class UberFixRepair:
 
     def fix_any_types(self, file_path: Path, content: str) -> str:
         """إصلاح أنواع any"""
-        fixed_content = content
-
-        replacements = {
-            ": any": ": unknown",
-            ": any[]": ": unknown[]",
-            "Promise<any>": "Promise<unknown>",
-            "Array<any>": "Array<unknown>",
-            "Record<string, any>": "Record<string, unknown>",
-        }
+        return self.fix_token_issues(file_path, content, {"ANY_TYPE"})
 
-        for old, new in replacements.items():
-            if old in fixed_content:
-                fixed_content = fixed_content.replace(old, new)
-                self.log_action("FIXED_ANY_TYPE", str(file_path), f"{old} -> {new}")
+    def fix_console_logs(self, file_path: Path, content: str) -> str:
+        """إزالة console.log"""
+        return self.fix_token_issues(file_path, content, {"CONSOLE_LOG"})
+
+    def fix_token_issues(self, file_path: Path, content: str, issue_types: Set[str]) -> str:
+        """إصلاحات تعتمد على الرموز: مسح واحد للملف وتطبيق كل التعديلات دفعة واحدة"""
+        tokens = tokenize(content, is_jsx_path(file_path))
+        edits: List[Edit] = []
+
+        if "ANY_TYPE" in issue_types:
+            any_edits = self.any_type_edits(tokens)
+            edits.extend(edit for edit, _ in any_edits)
+            patterns: Dict[str, int] = {}
+            for _, pattern in any_edits:
+                patterns[pattern] = patterns.get(pattern, 0) + 1
+            for pattern, count in patterns.items():
+                new = pattern.replace("any", "unknown")
+                self.log_action(
+                    "FIXED_ANY_TYPE", str(file_path), f"{pattern} -> {new} (x{count})"
+                )
 
+        if "CONSOLE_LOG" in issue_types:
+            console_edits = self.console_log_edits(content, tokens)
+            edits.extend(console_edits)
+            if console_edits:
+                self.log_action(
+                    "REMOVED_CONSOLE_LOG",
+                    str(file_path),
+                    f"تم إزالة {len(console_edits)} console.log",
+                )
+
+        if not edits:
+            return content
+        fixed_content, _ = apply_edits(content, edits)
         return fixed_content
 
-    def fix_console_logs(self, file_path: Path, content: str) -> str:
-        """إزالة console.log"""
-        lines = content.split("\n")
-        fixed_lines = []
-        removed_count = 0
+    def any_type_edits(self, tokens: List[Token]) -> List[Tuple[Edit, str]]:
+        """مواضع any في سياق نوع: `: any` و `: any[]` و Promise/Array<any> و Record<string, any>"""
+        edits: List[Tuple[Edit, str]] = []
 
-        for line in lines:
-            if "console.log" in line and not line.strip().startswith("//"):
-                removed_count += 1
+        for i, tok in enumerate(tokens):
+            if not tok.is_ident("any") or i == 0:
+                continue
+            prev = tokens[i - 1]
+            nxt = tokens[i + 1] if i + 1 < len(tokens) else None
+
+            if prev.is_punct(":"):
+                is_array = nxt is not None and nxt.is_punct("[") and i + 2 < len(tokens) and tokens[i + 2].is_punct("]")
+                pattern = ": any[]" if is_array else ": any"
+            elif nxt is not None and nxt.is_punct(">") and i >= 2:
+                if prev.is_punct("<") and tokens[i - 2].value in ("Promise", "Array"):
+                    pattern = f"{tokens[i - 2].value}<any>"
+                elif (
+                    prev.is_punct(",") and i >= 4
+                    and tokens[i - 2].is_ident("string")
+                    and tokens[i - 3].is_punct("<")
+                    and tokens[i - 4].is_ident("Record")
+                ):
+                    pattern = "Record<string, any>"
+                else:
+                    continue
+            else:
                 continue
-            fixed_lines.append(line)
 
-        if removed_count > 0:
-            self.log_action(
-                "REMOVED_CONSOLE_LOG",
-                str(file_path),
-                f"تم إزالة {removed_count} console.log",
-            )
+            edits.append(((tok.start, tok.end, "unknown"), pattern))
 
-        return "\n".join(fixed_lines)
+        return edits
+
+    def console_log_edits(self, content: str, tokens: List[Token]) -> List[Edit]:
+        """حذف جمل console.log(...) كاملة بما فيها الاستدعاءات متعددة الأسطر"""
+        edits: List[Edit] = []
+        count = len(tokens)
+
+        for i in range(count - 3):
+            if not (
+                tokens[i].is_ident("console")
+                and tokens[i + 1].is_punct(".")
+                and tokens[i + 2].is_ident("log")
+                and tokens[i + 3].is_punct("(")
+            ):
+                continue
+
+            # فقط عندما يكون الاستدعاء جملة مستقلة (وليس جزءاً من تعبير أو جسم if بدون أقواس)
+            prev = tokens[i - 1] if i > 0 else None
+            if prev is not None and not (
+                prev.is_punct(";") or prev.is_punct("{") or prev.is_punct("}")
+            ):
+                continue
+
+            close = matching_index(tokens, i + 3)
+            if close < 0:
+                continue
+            last = close
+            if close + 1 < count and tokens[close + 1].is_punct(";"):
+                last = close + 1
+            following = tokens[last + 1] if last + 1 < count else None
+            if (
+                following is not None
+                and last == close
+                and not following.nl_before
+                and not following.is_punct("}")
+            ):
+                continue
+
+            start, end = tokens[i].start, tokens[last].end
+            line_start = content.rfind("\n", 0, start) + 1
+            line_end = content.find("\n", end)
+            line_end = len(content) if line_end == -1 else line_end
+            trailing = content[end:line_end].strip()
+
+            if not content[line_start:start].strip() and (not trailing or trailing.startswith("//")):
+                # الجملة تشغل أسطراً كاملة: احذف الأسطر مع فاصل السطر
+                edits.append((line_start, min(line_end + 1, len(content)), ""))
+            else:
+                while end < len(content) and content[end] in " \t":
+                    end += 1
+                edits.append((start, end, ""))
+
+        return edits
 
     def fix_react_imports(self, file_path: Path, content: str) -> str:
         """إضافة استيراد React المفقود عند استعمال React."""
@@ -212,8 +338,23 @@ class UberFixRepair:
             )
             return content
 
-    def apply_fixes(self, file_path: Path, analysis: Dict) -> bool:
-        """تطبيق الإصلاحات على الملف"""
+    def fix_content(self, file_path: Path, content: str, issue_types: Set[str]) -> str:
+        """تطبيق كل الإصلاحات المطلوبة على محتوى ملف في الذاكرة"""
+        token_types = issue_types & {"ANY_TYPE", "CONSOLE_LOG"}
+        if token_types:
+            content = self.fix_token_issues(file_path, content, token_types)
+        if "MISSING_REACT_IMPORT" in issue_types:
+            content = self.fix_react_imports(file_path, content)
+        if "INVALID_JSON" in issue_types:
+            content = self.fix_json_file(file_path, content)
+        return content
+
+    def apply_fixes(self, file_path: Path, analysis: Dict, flush: bool = True) -> bool:
+        """تطبيق الإصلاحات على الملف
+
+        flush=False يؤجل الكتابة إلى دفعات (WRITE_BATCH_SIZE)؛ على المستدعي حينها
+        استدعاء flush_pending_writes() في النهاية وإلا ضاعت آخر دفعة.
+        """
         if analysis["issues_count"] == 0:
             return True
 
@@ -229,28 +370,17 @@ class UberFixRepair:
             if not fixable_issues:
                 return False
 
-            for issue in fixable_issues:
-                if issue["type"] == "ANY_TYPE":
-                    content = self.fix_any_types(file_path, content)
-                elif issue["type"] == "CONSOLE_LOG":
-                    content = self.fix_console_logs(file_path, content)
-                elif issue["type"] == "MISSING_REACT_IMPORT":
-                    content = self.fix_react_imports(file_path, content)
-                elif issue["type"] == "INVALID_JSON":
-                    content = self.fix_json_file(file_path, content)
+            content = self.fix_content(
+                file_path, content, {issue["type"] for issue in fixable_issues}
+            )
 
             if content != original_content:
-                backup_path = (
-                    f"{file_path}.backup."
-                    f"{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                )
-                with open(backup_path, "w", encoding="utf-8") as backup:
-                    backup.write(original_content)
-
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-
+                self.backup_store.stage(file_path, original_content)
+                self.pending_writes[file_path] = content
                 self.fixed_files.add(str(file_path))
+
+                if flush or len(self.pending_writes) >= self.WRITE_BATCH_SIZE:
+                    self.flush_pending_writes()
                 return True
 
             return False
@@ -261,6 +391,25 @@ class UberFixRepair:
             )
             return False
 
+    def flush_pending_writes(self):
+        """حفظ النسخ الاحتياطية للدفعة ثم كتابة الملفات المعدّلة"""
+        if not self.pending_writes:
+            return
+
+        # لا يُكتب أي ملف مصدر قبل أن تُحفظ نسخته الأصلية
+        self.backup_store.flush()
+
+        pending, self.pending_writes = self.pending_writes, {}
+        for file_path, content in pending.items():
+            try:
+                with open(file_path, "w", encoding="utf-8") as f:
+                    f.write(content)
+            except Exception as e:
+                self.fixed_files.discard(str(file_path))
+                self.log_action(
+                    "FIX_ERROR", str(file_path), f"خطأ في الكتابة: {e}"
+                )
+
     def has_test_script(self) -> bool:
         """فحص وجود سكربت test في package.json"""
         pkg = self.project_root / "package.json"
@@ -280,7 +429,40 @@ class UberFixRepair:
             )
             return False
 
-    def run_tests(self) -> bool:
+    def test_command(self) -> List[str]:
+        """أمر تشغيل كل الاختبارات حسب مدير الحزم"""
+        if self.package_manager == "pnpm":
+            return ["pnpm", "test"]
+        if self.package_manager == "yarn":
+            return ["yarn", "test"]
+        return ["npm", "test"]
+
+    def vitest_command(self) -> List[str]:
+        """تشغيل vitest مباشرة لتمرير ملفات اختبار محددة"""
+        if self.package_manager == "pnpm":
+            return ["pnpm", "exec", "vitest", "run"]
+        if self.package_manager == "yarn":
+            return ["yarn", "vitest", "run"]
+        return ["npx", "--no-install", "vitest", "run"]
+
+    def find_affected_tests(self) -> Optional[List[str]]:
+        """ملفات الاختبار التي تستورد (بشكل متعدٍ) الملفات المصلحة
+
+        يعيد None عندما يجب تشغيل كل الاختبارات (ملف إعدادات أو ملف خارج الرسم البياني).
+        """
+        graph = ImportGraph.build(self.project_root)
+        changed = []
+        for file_path in self.fixed_files:
+            rel = Path(file_path).resolve().relative_to(self.project_root.resolve()).as_posix()
+            if rel in self.FULL_SUITE_TRIGGERS or rel not in graph.edges:
+                self.log_action(
+                    "TESTS_FULL_SUITE", rel, "الملف يؤثر على كل الاختبارات"
+                )
+                return None
+            changed.append(rel)
+        return graph.affected_tests(changed)
+
+    def run_tests(self, affected_only: bool = False) -> bool:
         """تشغيل اختبارات المشروع (إذا كانت موجودة)"""
         self.log_action(
             "RUNNING_TESTS", "PROJECT", "بدء تشغيل الاختبارات..."
@@ -294,47 +476,129 @@ class UberFixRepair:
             )
             return True  # اعتبرها ناجحة حتى لا تفشل العملية كلها
 
-        # تجهيز الأمر حسب مدير الحزم
-        if self.package_manager == "pnpm":
-            cmd = ["pnpm", "test"]
-        elif self.package_manager == "yarn":
-            cmd = ["yarn", "test"]
+        if affected_only:
+            tests = self.find_affected_tests()
+            if tests is not None:
+                return self.run_affected_tests(tests)
+
+        started = time.perf_counter()
+        passed = self.run_streaming(self.test_command())
+        if passed:
+            self.save_suite_time(time.perf_counter() - started)
+        return passed
+
+    def run_affected_tests(self, tests: List[str]) -> bool:
+        """تشغيل الاختبارات المتأثرة فقط في عملية vitest واحدة (توزّع الملفات على أنويتها بنفسها)"""
+        if not tests:
+            self.log_action(
+                "TESTS_SKIPPED", "PROJECT", "لا توجد اختبارات تعتمد على الملفات المصلحة"
+            )
+            return True
+
+        self.log_action(
+            "AFFECTED_TESTS",
+            "PROJECT",
+            f"{len(tests)} ملف اختبار",
+        )
+
+        started = time.perf_counter()
+        passed = self.run_streaming(self.vitest_command() + tests)
+        elapsed = time.perf_counter() - started
+
+        full_suite = self.load_suite_time()
+        if full_suite:
+            self.log_action(
+                "TESTS_TIME_SAVED",
+                "PROJECT",
+                f"{elapsed:.1f}s مقابل {full_suite:.1f}s للمجموعة الكاملة "
+                f"(توفير {max(full_suite - elapsed, 0):.1f}s)",
+            )
         else:
-            cmd = ["npm", "test"]
+            self.log_action(
+                "TESTS_TIME",
+                "PROJECT",
+                f"{elapsed:.1f}s (لا يوجد زمن مسجل للمجموعة الكاملة للمقارنة)",
+            )
+        return passed
 
+    def run_streaming(self, cmd: List[str]) -> bool:
+        """تشغيل أمر الاختبار مع عرض المخرجات مباشرة والاحتفاظ بآخرها للسجل"""
+        tail: deque = deque(maxlen=20)
+        proc = None
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
                 cwd=self.project_root,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=300,
+                bufsize=1,
             )
 
-            if result.returncode == 0:
-                self.log_action(
-                    "TESTS_PASSED", "PROJECT", "جميع الاختبارات نجحت"
-                )
-                return True
-            else:
-                self.log_action(
-                    "TESTS_FAILED",
-                    "PROJECT",
-                    f"فشل في الاختبارات: {result.stderr}",
-                )
-                return False
+            def pump():
+                for line in proc.stdout:
+                    tail.append(line.rstrip())
+                    print(line, end="", flush=True)
+
+            reader = threading.Thread(target=pump, daemon=True)
+            reader.start()
+            proc.wait(timeout=self.TEST_TIMEOUT)
+            reader.join(timeout=5)
 
         except subprocess.TimeoutExpired:
+            proc.kill()
             self.log_action(
                 "TESTS_TIMEOUT", "PROJECT", "انتهت مهلة الاختبارات"
             )
             return False
         except Exception as e:
+            if proc is not None:
+                proc.kill()
             self.log_action(
                 "TESTS_ERROR", "PROJECT", f"خطأ في الاختبارات: {e}"
             )
             return False
 
+        if proc.returncode == 0:
+            self.log_action(
+                "TESTS_PASSED", "PROJECT", "جميع الاختبارات نجحت"
+            )
+            return True
+
+        output = "\n".join(tail)
+        self.log_action(
+            "TESTS_FAILED",
+            "PROJECT",
+            f"فشل في الاختبارات: {output}",
+        )
+        return False
+
+    def suite_time_path(self) -> Path:
+        return self.project_root / "reports" / "test_timings.json"
+
+    def save_suite_time(self, seconds: float):
+        """حفظ زمن المجموعة الكاملة للمقارنة مع وضع الاختبارات المتأثرة"""
+        path = self.suite_time_path()
+        try:
+            path.parent.mkdir(exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "full_suite_seconds": round(seconds, 3),
+                        "recorded_at": datetime.datetime.now().isoformat(timespec="seconds"),
+                    },
+                    f,
+                )
+        except OSError:
+            pass
+
+    def load_suite_time(self) -> Optional[float]:
+        try:
+            with open(self.suite_time_path(), "r", encoding="utf-8") as f:
+                return json.load(f).get("full_suite_seconds")
+        except (OSError, ValueError):
+            return None
+
     def validate_fixes(self) -> Dict:
         """التحقق من الإصلاحات"""
         self.log_action(
@@ -349,12 +613,42 @@ class UberFixRepair:
             validated_files.append(analysis)
             remaining_issues += analysis["issues_count"]
 
+        lint_errors = self.lint_fixed_files() if self.lint_worker else None
+
         return {
             "validated_files": validated_files,
             "remaining_issues": remaining_issues,
+            "lint_errors": lint_errors,
             "total_fixed": len(self.fixed_files),
         }
 
+    def lint_fixed_files(self) -> Optional[int]:
+        """فحص الملفات المصلحة بـ ESLint و TypeScript عبر العامل الدائم (None إن لم يكن متاحاً)"""
+        if not self.fixed_files:
+            return 0
+        client = LintWorkerClient(self.project_root)
+        if not client.available:
+            self.log_action("LINT_SKIPPED", "PROJECT", "node أو node_modules/eslint غير موجود")
+            return None
+
+        files = sorted(self.fixed_files)
+        started = time.perf_counter()
+        try:
+            with client:
+                results = client.check(files)
+        except LintWorkerError as e:
+            self.log_action("LINT_SKIPPED", "PROJECT", str(e))
+            return None
+        elapsed = (time.perf_counter() - started) * 1000
+
+        for line in format_results(results):
+            print(f"  {line}")
+        errors = count_errors(results)
+        self.log_action(
+            "LINT_VALIDATION", "PROJECT", f"{len(files)} ملف، {errors} خطأ ({elapsed:.0f} ms)"
+        )
+        return errors
+
     def generate_report(self) -> str:
         """توليد تقرير مفصل"""
         report = [
@@ -371,6 +665,15 @@ class UberFixRepair:
         for file_path in sorted(self.fixed_files):
             report.append(f"  ✅ {file_path}")
 
+        if self.backup_store.manifest:
+            report.extend(
+                [
+                    "",
+                    f"💾 النسخ الاحتياطية: {self.backup_store.store_dir} "
+                    f"(التشغيل {self.backup_store.run_id})",
+                ]
+            )
+
         report.extend(
             [
                 "",
@@ -381,44 +684,67 @@ class UberFixRepair:
         for log_entry in self.repair_log[-20:]:
             report.append(f"  {log_entry}")
 
+        timings = self.tracer.summary_lines()
+        if timings:
+            report.append("")
+            report.extend(timings)
+
         report.append("=" * 60)
 
         return "\n".join(report)
 
-    def run_complete_repair(self):
+    def run_complete_repair(self, trace_path: Optional[Path] = None, affected_tests: bool = False):
         """تشغيل عملية الإصلاح الكاملة"""
         print("🚀 بدء عملية إصلاح UberFix الشاملة...")
         print("=" * 50)
 
         # 1. جمع الملفات
-        source_files = self.get_all_source_files()
+        with self.tracer.span("discovery"):
+            source_files = self.get_all_source_files()
         print(f"📁 تم العثور على {len(source_files)} ملف مصدر")
 
         # 2. التحليل والإصلاح
         total_issues_before = 0
         files_with_issues = 0
 
-        for i, file_path in enumerate(source_files, 1):
-            print(
-                f"\r🔍 تحليل الملف {i}/{len(source_files)}: {file_path.name}",
-                end="",
-            )
+        with self.tracer.span("analyze_and_fix", files=len(source_files)):
+            for i, file_path in enumerate(source_files, 1):
+                print(
+                    f"\r🔍 تحليل الملف {i}/{len(source_files)}: {file_path.name}",
+                    end="",
+                )
+
+                with self.tracer.file_span(file_path):
+                    analysis = self.analyze_file(file_path)
 
-            analysis = self.analyze_file(file_path)
+                    if analysis["issues_count"] > 0:
+                        total_issues_before += analysis["issues_count"]
+                        files_with_issues += 1
 
-            if analysis["issues_count"] > 0:
-                total_issues_before += analysis["issues_count"]
-                files_with_issues += 1
+                        self.apply_fixes(file_path, analysis, flush=False)
 
-                self.apply_fixes(file_path, analysis)
+            self.flush_pending_writes()
 
         print(f"\n✅ الانتهاء من التحليل: {files_with_issues} ملف به مشاكل")
+        if self.backup_store.manifest:
+            stats = self.backup_store.stats
+            print(
+                f"💾 النسخ الاحتياطية: التشغيل {self.backup_store.run_id} - "
+                f"{stats['blobs_written']} جديد / {stats['blobs_reused']} مكرر، "
+                f"{stats['bytes_written']:,} bytes في {stats['write_seconds'] * 1000:.0f} ms"
+            )
+            print(
+                "   للاسترجاع: python3 scripts/backup_store.py "
+                f"--project-root {self.project_root} restore {self.backup_store.run_id}"
+            )
 
         # 3. التحقق من الإصلاحات
-        validation = self.validate_fixes()
+        with self.tracer.span("validate"):
+            validation = self.validate_fixes()
 
         # 4. تشغيل الاختبارات
-        tests_passed = self.run_tests()
+        with self.tracer.span("tests"):
+            tests_passed = self.run_tests(affected_only=affected_tests)
 
         # 5. عرض التقرير
         print("\n" + "=" * 50)
@@ -429,6 +755,8 @@ class UberFixRepair:
         print(f"🔧 المشاكل المكتشفة: {total_issues_before}")
         print(f"✅ الملفات المصلحة: {len(self.fixed_files)}")
         print(f"📋 المشاكل المتبقية: {validation['remaining_issues']}")
+        if validation["lint_errors"] is not None:
+            print(f"🧹 أخطاء ESLint/TypeScript: {validation['lint_errors']}")
         print(f"🧪 الاختبارات: {'✅ نجحت' if tests_passed else '❌ فشلت'}")
 
         # حفظ التقرير في مجلد reports/
@@ -441,10 +769,29 @@ class UberFixRepair:
 
         print(f"\n📄 التقر المفصل: {report_path}")
 
+        if trace_path:
+            self.tracer.export_chrome_trace(trace_path)
+            print(f"⏱️  ملف القياس (Chrome trace): {trace_path}")
+
 
 def main():
-    repair = UberFixRepair()
-    repair.run_complete_repair()
+    parser = argparse.ArgumentParser(description="UberFix Code Repair & Validator")
+    parser.add_argument("--project-root", type=Path, default=None)
+    parser.add_argument("--backup-dir", type=Path, default=None, help="مجلد مخزن النسخ الاحتياطية (الافتراضي: <root>/backups)")
+    parser.add_argument("--affected-tests", action="store_true", help="تشغيل الاختبارات المتأثرة بالملفات المصلحة فقط")
+    parser.add_argument("--lint-worker", action="store_true", help="التحقق من الملفات المصلحة عبر عامل ESLint/TypeScript الدائم")
+    parser.add_argument("--profile", action="store_true", help="قياس أزمنة المراحل والملفات وإضافتها للتقرير")
+    parser.add_argument("--trace", type=Path, help="تصدير القياس بصيغة Chrome trace (يفعّل --profile)")
+    args = parser.parse_args()
+
+    tracer = Tracer(enabled=args.profile or args.trace is not None)
+    repair = UberFixRepair(
+        project_root=args.project_root,
+        tracer=tracer,
+        backup_dir=args.backup_dir,
+        lint_worker=args.lint_worker,
+    )
+    repair.run_complete_repair(trace_path=args.trace, affected_tests=args.affected_tests)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+UberFix Branch Matching
+ربط الفروع بين abuauf_branches_input.csv و branch_locations.csv و stores_rows.csv
+بدون مقارنة كل صف بكل صف: فهرس MinHash LSH على ثلاثيات الحروف للاسم المطبّع
+وعلى "هيكل صوتي" يجمع الكتابة العربية والإنجليزية (أوسكار جراند ↔ Oscar Grand)
+ثم تقييم الأزواج المرشحة فقط.
+
+النتيجة تقرير مطابقات بدرجات (reports/branch_matches.csv)، ويمكن لـ gomap.py
+استخدام inherit_coordinates لتوريث الإحداثيات من الصفوف المطابقة.
+
+الاستخدام:
+    python3 src/data/branch_matching.py
+    python3 src/data/branch_matching.py --left stores --right branches --min-score 0.6
+"""
+
+import re
+import csv
+import math
+import time
+import zlib
+import random
+import argparse
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from gazetteer import DATA_DIR, GENERIC_WORDS, normalize
+
+
+REPORTS_DIR = DATA_DIR.parents[1] / "reports"
+NUM_PERM = 64
+BANDS = 32
+MIN_SCORE = 0.75
+# توريث الإحداثيات يكتب في ملف المخرجات فيحتاج ثقة أعلى من تقرير المطابقات
+INHERIT_MIN_SCORE = 0.85
+NAME_WEIGHT = 0.75
+# الكلمة الأندر في الاسم (اسم المكان عادة) يجب أن يقابلها ما يشبهها بهذه الدرجة على الأقل
+DISTINCTIVE_MIN = 0.7
+DISTINCTIVE_PENALTY = 0.8
+_MERSENNE = (1 << 61) - 1
+
+# حروف عربية ← أقرب حرف ساكن لاتيني (حروف العلة والعين والهمزة تُحذف)
+_ARABIC_CONSONANTS = str.maketrans({
+    "ب": "b", "ت": "t", "ث": "s", "ج": "g", "ح": "", "خ": "k", "د": "d", "ذ": "z", "ر": "r", "ز": "z",
+    "س": "s", "ش": "s", "ص": "s", "ض": "d", "ط": "t", "ظ": "z", "ع": "", "غ": "g", "ف": "f", "ق": "k",
+    "ك": "k", "ل": "l", "م": "m", "ن": "n", "ه": "", "ة": "", "ء": "", "ا": "", "و": "", "ي": "", "ى": "",
+})
+_LATIN_DIGRAPHS = (("kh", "k"), ("sh", "s"), ("th", "t"), ("ph", "f"), ("dh", "d"), ("gh", "g"), ("x", "ks"))
+_LATIN_CONSONANTS = str.maketrans({"c": "k", "q": "k", "j": "g", "v": "f", "p": "b", "h": None,
+                                   "a": None, "e": None, "i": None, "o": None, "u": None, "w": None, "y": None})
+_REPEAT_RE = re.compile(r"(.)\1+")
+
+
+class Dataset(NamedTuple):
+    filename: str
+    id_col: Optional[str]
+    name_col: str
+    address_col: Optional[str]
+
+
+DATASETS = {
+    "abuauf": Dataset("abuauf_branches_input.csv", None, "branch_name", "city"),
+    # نسخة _fixed هي نفس branch_locations.csv مع أعمدة الإحداثيات
+    "branches": Dataset("branch_locations_fixed.csv", "id", "branch", "address"),
+    "stores": Dataset("stores_rows.csv", "id", "name", "location"),
+}
+
+
+class Record(NamedTuple):
+    source: str
+    key: str
+    name: str
+    address: str
+    row: Dict
+
+
+class BranchMatch(NamedTuple):
+    left: Record
+    right: Record
+    score: float
+    name_score: float
+    address_score: Optional[float]
+
+
+def match_key(text: str) -> str:
+    """تطبيع للمطابقة: مثل normalize مع إبقاء الحروف المفردة (ممر F / ممر G)"""
+    return normalize(text, keep_short=True)
+
+
+def phonetic(text: str) -> str:
+    """هيكل الحروف الساكنة (نفس الناتج تقريباً للاسم العربي ونقله الحرفي الإنجليزي)"""
+    words = []
+    for word in match_key(text).split():
+        if word.isdigit():
+            words.append(word)
+            continue
+        word = word.translate(_ARABIC_CONSONANTS)
+        for digraph, replacement in _LATIN_DIGRAPHS:
+            word = word.replace(digraph, replacement)
+        word = _REPEAT_RE.sub(r"\1", word.translate(_LATIN_CONSONANTS))
+        if word:
+            words.append(word)
+    return " ".join(words)
+
+
+def shingles(text: str) -> Set[str]:
+    """ثلاثيات حروف الاسم المطبّع وثنائيات هيكله الصوتي (بوسم مختلف)"""
+    key = f" {match_key(text)} "
+    found = {key[i:i + 3] for i in range(len(key) - 2)} if key.strip() else set()
+    skeleton = f" {phonetic(text)} "
+    if skeleton.strip():
+        found.update("~" + skeleton[i:i + 2] for i in range(len(skeleton) - 1))
+    return found
+
+
+def dice(a: Set[str], b: Set[str]) -> float:
+    return 2 * len(a & b) / (len(a) + len(b)) if a and b else 0.0
+
+
+def similarity(a: str, b: str) -> float:
+    """الأعلى بين تشابه الحروف (نفس الكتابة) وتشابه الهيكل الصوتي (عبر الكتابتين)"""
+    na, nb = match_key(a), match_key(b)
+    if not na or not nb:
+        return 0.0
+    if na == nb:
+        return 1.0
+    ka, kb = f" {na} ", f" {nb} "
+    direct = dice({ka[i:i + 3] for i in range(len(ka) - 2)}, {kb[i:i + 3] for i in range(len(kb) - 2)})
+    pa, pb = f" {phonetic(a)} ", f" {phonetic(b)} "
+    sounds = dice({pa[i:i + 2] for i in range(len(pa) - 1)}, {pb[i:i + 2] for i in range(len(pb) - 1)})
+    return max(direct, sounds)
+
+
+def _bigrams(token: str) -> Set[str]:
+    padded = f" {token} "
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+def _place_tokens(text: str) -> List[str]:
+    """الهيكل الصوتي لكلمات الاسم بدون الكلمات العامة (مول، شارع، Market)"""
+    return [token for word in match_key(text).split() if word not in GENERIC_WORDS for token in phonetic(word).split()]
+
+
+def _edit_ratio(a: str, b: str) -> float:
+    """1 - مسافة Levenshtein / طول الأطول (الكلمات قصيرة بعد الهيكل الصوتي)"""
+    if a == b:
+        return 1.0
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y)))
+        previous = current
+    return 1 - previous[-1] / max(len(a), len(b))
+
+
+def load_records(source: str, path: Optional[Path] = None, dataset: Optional[Dataset] = None) -> List[Record]:
+    dataset = dataset or DATASETS[source]
+    path = path or DATA_DIR / dataset.filename
+    with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+        rows = list(csv.DictReader(f))
+    records = []
+    for number, row in enumerate(rows, 1):
+        key = row.get(dataset.id_col) if dataset.id_col else None
+        address = row.get(dataset.address_col) or "" if dataset.address_col else ""
+        records.append(Record(source, key or str(number), row.get(dataset.name_col) or "", address, row))
+    return records
+
+
+class MinHashLSH:
+    """فهرس MinHash بنطاقات (bands): الأزواج المرشحة تتشارك نطاقاً واحداً على الأقل"""
+
+    def __init__(self, num_perm: int = NUM_PERM, bands: int = BANDS, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        rng = random.Random(seed)
+        self.rows = num_perm // bands
+        self.bands = bands
+        self._perms = [(rng.randrange(1, _MERSENNE), rng.randrange(0, _MERSENNE)) for _ in range(num_perm)]
+        self._buckets: List[Dict[tuple, List[int]]] = [defaultdict(list) for _ in range(bands)]
+
+    def signature(self, items: Iterable[str]) -> List[int]:
+        hashes = [zlib.crc32(item.encode("utf-8")) for item in items]
+        if not hashes:
+            return []
+        return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in self._perms]
+
+    def _bands(self, signature: List[int]):
+        for band in range(self.bands):
+            yield band, tuple(signature[band * self.rows:(band + 1) * self.rows])
+
+    def insert(self, key: int, items: Iterable[str]):
+        signature = self.signature(items)
+        for band, chunk in self._bands(signature) if signature else ():
+            self._buckets[band][chunk].append(key)
+
+    def candidates(self, items: Iterable[str]) -> Set[int]:
+        signature = self.signature(items)
+        found: Set[int] = set()
+        for band, chunk in self._bands(signature) if signature else ():
+            found.update(self._buckets[band].get(chunk, ()))
+        return found
+
+
+class BranchIndex:
+    """فهرس الطرف الأيمن: بحث عن أفضل مطابقة لكل سجل بزمن شبه خطي"""
+
+    def __init__(self, records: List[Record], num_perm: int = NUM_PERM, bands: int = BANDS):
+        self.records = records
+        self.lsh = MinHashLSH(num_perm, bands)
+        self.compared = 0
+        frequency: Dict[str, int] = defaultdict(int)
+        for index, record in enumerate(records):
+            self.lsh.insert(index, shingles(record.name))
+            for token in set(phonetic(record.name).split()):
+                frequency[token] += 1
+        # الكلمات المتكررة (كارفور، ماركت، مول) أقل وزناً من اسم المكان نفسه
+        self._idf = {token: math.log(1 + len(records) / count) for token, count in frequency.items()}
+        self._max_idf = math.log(1 + len(records)) if records else 1.0
+
+    def token_score(self, a: str, b: str) -> float:
+        """محاذاة كلمات الهيكل الصوتي بوزن IDF في الاتجاهين"""
+        ta, tb = phonetic(a).split(), phonetic(b).split()
+        if not ta or not tb:
+            return 0.0
+
+        def covered(source: List[str], target: List[str]) -> float:
+            grams = [_bigrams(t) for t in target]
+            total = matched = 0.0
+            for token in source:
+                weight = self._idf.get(token, self._max_idf)
+                total += weight
+                matched += weight * max(dice(_bigrams(token), g) for g in grams)
+            return matched / total
+
+        return (covered(ta, tb) + covered(tb, ta)) / 2
+
+    def distinctive_agree(self, a: str, b: str) -> bool:
+        """هل يقابل كل كلمة نادرة في الاسمين كلمة مشابهة في الآخر (زيزينيا ≠ الزيتون رغم تشابه الحروف)"""
+        ta, tb = _place_tokens(a), _place_tokens(b)
+        if not ta or not tb:
+            return True
+
+        def agrees(source: List[str], target: List[str]) -> bool:
+            def similar(token: str, options: List[str]) -> bool:
+                return any(_edit_ratio(token, option) >= DISTINCTIVE_MIN for option in options)
+
+            # كلمتان متجاورتان قد تقابلان كلمة واحدة في الاسم الآخر (فتح الله ↔ Fathalla)
+            target_pairs = [x + y for x, y in zip(target, target[1:])]
+            matched, unmatched = [], []
+            for i, token in enumerate(source):
+                pairs = [source[j] + source[j + 1] for j in (i - 1, i) if 0 <= j < len(source) - 1]
+                found = similar(token, target + target_pairs) or any(similar(pair, target) for pair in pairs)
+                # كلمة غير موجودة في الفهرس أندر ما يمكن (مثل score)
+                (matched if found else unmatched).append(self._idf.get(token, self._max_idf))
+            # كلمة بلا مقابل بندرة أعلى ما تطابق (كارفور داندي ↔ كارفور حمد) تعني مكاناً آخر
+            return not unmatched or bool(matched) and max(unmatched) < max(matched)
+
+        return agrees(ta, tb) and agrees(tb, ta)
+
+    def score(self, left: Record, right: Record) -> BranchMatch:
+        name_score = (similarity(left.name, right.name) + self.token_score(left.name, right.name)) / 2
+        if not self.distinctive_agree(left.name, right.name):
+            name_score *= DISTINCTIVE_PENALTY
+        # عنوان يكرر الاسم (كما في stores_rows) لا يضيف معلومة
+        informative = all(r.address and match_key(r.address) != match_key(r.name) for r in (left, right))
+        address_score = similarity(left.address, right.address) if informative else None
+        score = name_score if address_score is None else NAME_WEIGHT * name_score + (1 - NAME_WEIGHT) * address_score
+        return BranchMatch(left, right, round(score, 3), round(name_score, 3),
+                           None if address_score is None else round(address_score, 3))
+
+    def best(self, record: Record, min_score: float = MIN_SCORE) -> Optional[BranchMatch]:
+        """أعلى درجة، والاسم المطابق حرفياً يفوز عند التساوي (لا ترتيب المرشحين)"""
+        key = match_key(record.name)
+        best = best_rank = None
+        for index in sorted(self.lsh.candidates(shingles(record.name))):
+            self.compared += 1
+            match = self.score(record, self.records[index])
+            if match.score < min_score:
+                continue
+            rank = (match.score, match_key(match.right.name) == key, match.name_score)
+            if best is None or rank > best_rank:
+                best, best_rank = match, rank
+        return best
+
+    def join(self, records: Iterable[Record], min_score: float = MIN_SCORE) -> List[BranchMatch]:
+        return [m for m in (self.best(r, min_score) for r in records) if m is not None]
+
+
+def _has_coordinates(row: Dict) -> bool:
+    try:
+        return all(str(float(row.get(c))) != "nan" for c in ("latitude", "longitude"))
+    except (TypeError, ValueError):
+        return False
+
+
+def inherit_coordinates(rows: List[Dict], reference_rows: List[Dict], name_col: str = "branch",
+                        address_col: str = "address", reference_name_col: str = "branch",
+                        reference_address_col: str = "address", min_score: float = INHERIT_MIN_SCORE) -> int:
+    """الصفوف بلا إحداثيات ترث إحداثيات أفضل صف مطابق (يحمل إحداثيات) من المرجع"""
+    dataset = Dataset("", None, reference_name_col, reference_address_col)
+    reference = [
+        Record("reference", str(number), row.get(dataset.name_col) or "", row.get(dataset.address_col) or "", row)
+        for number, row in enumerate(reference_rows, 1)
+        if _has_coordinates(row)
+    ]
+    if not reference:
+        return 0
+    index = BranchIndex(reference)
+    inherited = 0
+    for number, row in enumerate(rows, 1):
+        if _has_coordinates(row):
+            continue
+        record = Record("input", str(number), row.get(name_col) or "", row.get(address_col) or "", row)
+        match = index.best(record, min_score)
+        if match is None:
+            continue
+        row["latitude"] = match.right.row["latitude"]
+        row["longitude"] = match.right.row["longitude"]
+        row["coordinate_source"] = f"match:{match.right.name}"
+        # مطابقة لصف أُكمل هو نفسه تقريبياً تحمل ثقة الصف المرجعي أيضاً
+        try:
+            inherited_confidence = float(match.right.row.get("coordinate_confidence"))
+        except (TypeError, ValueError):
+            inherited_confidence = 1.0
+        if math.isnan(inherited_confidence):
+            inherited_confidence = 1.0
+        row["coordinate_confidence"] = round(match.score * inherited_confidence, 3)
+        inherited += 1
+    return inherited
+
+
+def write_report(matches: List[BranchMatch], path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["left_source", "left_id", "left_name", "right_source", "right_id", "right_name",
+                         "score", "name_score", "address_score"])
+        for m in sorted(matches, key=lambda m: -m.score):
+            writer.writerow([m.left.source, m.left.key, m.left.name, m.right.source, m.right.key, m.right.name,
+                             m.score, m.name_score, "" if m.address_score is None else m.address_score])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzzy join between branch datasets")
+    parser.add_argument("--left", action="append", choices=sorted(DATASETS),
+                        help="الافتراضي: abuauf و stores")
+    parser.add_argument("--right", choices=sorted(DATASETS), default="branches")
+    parser.add_argument("--min-score", type=float, default=MIN_SCORE)
+    parser.add_argument("--output", type=Path, default=REPORTS_DIR / "branch_matches.csv")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    right = load_records(args.right)
+    index = BranchIndex(right)
+    matches: List[BranchMatch] = []
+    total_left = 0
+    for source in args.left or ["abuauf", "stores"]:
+        left = load_records(source)
+        total_left += len(left)
+        found = index.join(left, args.min_score)
+        matches.extend(found)
+        print(f"🔗 {source} → {args.right}: {len(found)} من {len(left)} صف")
+        for m in sorted(found, key=lambda m: m.score)[:5]:
+            print(f"   ⚠️  {m.score:.2f}  {m.left.name} ↔ {m.right.name}")
+    write_report(matches, args.output)
+
+    print(f"⚡ {index.compared} مقارنة بدلاً من {total_left * len(right)} "
+          f"({time.perf_counter() - started:.2f}s)")
+    print(f"📄 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
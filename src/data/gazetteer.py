@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+UberFix Offline Gazetteer
+إكمال إحداثيات الفروع التي فشل استخراجها من الرابط بدون أي طلب شبكة، بمطابقة
+عمودي branch و address مع قاموس أماكن محلي عبر فهرس n-gram للحروف:
+
+- الفروع التي حُلّت إحداثياتها سابقاً (الاسم وأجزاء العنوان)
+- محطات المترو والأحياء والمعالم من gazetteer_places.csv
+- المولات من malls_rows.csv (كأسماء بديلة لإحداثيات الحي المذكور في موقعها)
+
+كل صف مكتمل يحمل coordinate_source و coordinate_confidence (0-1) حتى يمكن
+مراجعة المطابقات الضعيفة يدوياً.
+
+الاستخدام:
+    python3 src/data/gazetteer.py
+    python3 src/data/gazetteer.py --input public/data/branch_locations_fixed.csv --min-confidence 0.5
+"""
+
+import re
+import csv
+import math
+import argparse
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "public" / "data"
+PLACES_FILE = "gazetteer_places.csv"
+MALLS_FILE = "malls_rows.csv"
+
+# وزن كل نوع مصدر: إحداثيات فرع فعلي أدق من مركز حي
+KIND_WEIGHTS = {
+    "branch": 1.0,
+    "metro": 0.9,
+    "mall": 0.85,
+    "landmark": 0.85,
+    "branch_address": 0.7,
+    "district": 0.6,
+    "mall_alias": 0.5,
+}
+MIN_SIMILARITY = 0.8
+MIN_CONFIDENCE = 0.4
+MAX_PHRASE_WORDS = 5
+# مفتاح يشير إلى نقاط متباعدة أكثر من هذا يُعتبر غامضاً ويُستبعد
+MAX_SPREAD_KM = 2.0
+
+_DIACRITICS_RE = re.compile(r"[\u064B-\u0652\u0640]")
+_SEGMENT_RE = re.compile(r"[,،\-–|()/]+")
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+_ARABIC_FOLD = str.maketrans({"أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا", "ة": "ه", "ى": "ي", "ؤ": "و", "ئ": "ي"})
+STOP_WORDS = {
+    "el", "al", "the", "of", "and", "in", "to", "at", "on", "from", "next", "front", "behind", "beside",
+    "near", "inside", "opposite", "after", "governorate", "امام", "بجوار", "داخل",
+}
+# كلمات عامة لا تكفي وحدها لتحديد مكان ("Mall" أو "Metro Market")
+GENERIC_WORDS = {
+    "mall", "market", "hypermarket", "station", "street", "st", "road", "rd", "square", "sq", "city", "club",
+    "gate", "branch", "booth", "building", "floor", "ground", "first", "main", "new", "metro", "center",
+    "مول", "محطه", "شارع", "ميدان", "مدينه", "ش", "طريق", "ماركت", "هايبر", "هايبرماركت",
+}
+
+
+class Place(NamedTuple):
+    name: str
+    kind: str
+    latitude: float
+    longitude: float
+
+
+class Match(NamedTuple):
+    latitude: float
+    longitude: float
+    confidence: float
+    source: str
+    place: str
+    phrase: str
+
+
+def normalize(text: str, keep_short: bool = False) -> str:
+    """توحيد النص العربي والإنجليزي: الهمزات والتاء المربوطة والتشكيل وأداة التعريف
+
+    keep_short يُبقي الكلمات ذات الحرف الواحد (T3-G ≠ T3-F عند مطابقة الفروع).
+    """
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    text = _DIACRITICS_RE.sub("", text).translate(_ARABIC_FOLD)
+    words = []
+    for word in _NON_WORD_RE.sub(" ", text).split():
+        if word.startswith("ال") and len(word) > 4:
+            word = word[2:]
+        if word not in STOP_WORDS and (len(word) > 1 or word.isdigit() or keep_short):
+            words.append(word)
+    return " ".join(words)
+
+
+def is_specific(key: str) -> bool:
+    """هل يحوي المفتاح كلمة واحدة على الأقل غير عامة وغير رقمية"""
+    return any(word not in GENERIC_WORDS and not word.isdigit() for word in key.split())
+
+
+def segments(text: str) -> List[str]:
+    """أجزاء العنوان المفصولة بالفواصل والشرطات (العبارات لا تعبر هذه الحدود)"""
+    return [s for s in (normalize(part) for part in _SEGMENT_RE.split(text or "")) if s]
+
+
+def trigrams(key: str) -> Counter:
+    padded = f" {key} "
+    return Counter(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def distance_km(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    lat1, lng1, lat2, lng2 = map(math.radians, (a[0], a[1], b[0], b[1]))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 12742 * math.asin(math.sqrt(h))
+
+
+class Gazetteer:
+    """قاموس أسماء الأماكن مع فهرس n-gram (ثلاثيات الحروف) للمطابقة التقريبية"""
+
+    def __init__(self):
+        self._candidates: Dict[str, List[Place]] = defaultdict(list)
+        self.keys: List[str] = []
+        self.places: List[Place] = []
+        self._grams: List[Counter] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+    def add(self, name: str, place: Place):
+        key = normalize(name)
+        if is_specific(key):
+            self._candidates[key].append(place)
+
+    def add_places_file(self, path: Path):
+        """الأحياء والمعالم ومحطات المترو (name,aliases,kind,latitude,longitude)"""
+        with open(path, "r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                place = Place(row["name"], row["kind"], float(row["latitude"]), float(row["longitude"]))
+                for name in [row["name"], *row["aliases"].split("|")]:
+                    self.add(name, place)
+
+    def add_malls_file(self, path: Path):
+        """المولات بلا إحداثيات: اسم المول يرث إحداثيات الحي المذكور في موقعه"""
+        with open(path, "r", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            parts = [p.strip() for p in row["location"].split(",") if p.strip()]
+            for part in reversed(parts[:-1] or parts):
+                district = self._unique(normalize(part))
+                if district:
+                    self.add(row["name"], district._replace(name=row["name"], kind="mall_alias"))
+                    break
+
+    def add_resolved(self, rows: Iterable[Dict], branch_col: str = "branch", address_col: str = "address"):
+        """الفروع المحلولة سابقاً: الاسم بثقة كاملة، وأجزاء العنوان القصيرة بثقة أقل
+
+        تُستبعد الصفوف المُكملة تقريبياً (القاموس أو match:) حتى لا ترتفع ثقة التخمين مع كل تشغيل.
+        """
+        for row in rows:
+            latitude, longitude = _coordinate(row.get("latitude")), _coordinate(row.get("longitude"))
+            if latitude is None or longitude is None:
+                continue
+            if (row.get("coordinate_source") or "link") != "link":
+                continue
+            branch = row.get(branch_col) or ""
+            self.add(branch, Place(branch, "branch", latitude, longitude))
+            for part in segments(row.get(address_col) or ""):
+                if len(part.split()) <= 4 and not any(ch.isdigit() for ch in part):
+                    self.add(part, Place(branch, "branch_address", latitude, longitude))
+
+    def build_index(self) -> "Gazetteer":
+        """دمج النقاط المتقاربة لكل مفتاح واستبعاد الغامض ثم بناء فهرس الثلاثيات"""
+        self.keys, self.places, self._grams = [], [], []
+        self._postings = defaultdict(list)
+        for key, places in self._candidates.items():
+            place = self._merge(places)
+            if place is None:
+                continue
+            index = len(self.keys)
+            self.keys.append(key)
+            self.places.append(place)
+            grams = trigrams(key)
+            self._grams.append(grams)
+            for gram in grams:
+                self._postings[gram].append(index)
+        return self
+
+    @classmethod
+    def from_data_dir(cls, data_dir: Path = DATA_DIR, resolved: Iterable[Dict] = (), **columns) -> "Gazetteer":
+        gazetteer = cls()
+        places_path = Path(data_dir) / PLACES_FILE
+        if places_path.exists():
+            gazetteer.add_places_file(places_path)
+        malls_path = Path(data_dir) / MALLS_FILE
+        if malls_path.exists():
+            gazetteer.add_malls_file(malls_path)
+        gazetteer.add_resolved(resolved, **columns)
+        return gazetteer.build_index()
+
+    def similar(self, phrase: str, min_similarity: float = MIN_SIMILARITY) -> List[Tuple[float, int]]:
+        """(معامل Dice، رقم المفتاح) للمفاتيح المشابهة لعبارة واحدة"""
+        grams = trigrams(phrase)
+        size = sum(grams.values())
+        shared: Counter = Counter()
+        for gram, count in grams.items():
+            for index in self._postings.get(gram, ()):
+                shared[index] += min(count, self._grams[index][gram])
+        found = []
+        for index, common in shared.items():
+            dice = 2 * common / (size + sum(self._grams[index].values()))
+            if dice >= min_similarity:
+                found.append((dice, index))
+        return found
+
+    def lookup(self, *texts: str, min_confidence: float = MIN_CONFIDENCE) -> Optional[Match]:
+        """أفضل مطابقة لأي عبارة (حتى MAX_PHRASE_WORDS كلمات) داخل أجزاء النصوص"""
+        best, best_rank = None, None
+        for text in texts:
+            for segment in segments(text):
+                words = segment.split()
+                for size in range(1, min(MAX_PHRASE_WORDS, len(words)) + 1):
+                    for start in range(len(words) - size + 1):
+                        phrase = " ".join(words[start:start + size])
+                        if not is_specific(phrase):
+                            continue
+                        for dice, index in self.similar(phrase):
+                            place = self.places[index]
+                            confidence = dice * KIND_WEIGHTS.get(place.kind, 0.5)
+                            # عند التساوي: العبارة الأطول أكثر تحديداً
+                            rank = (confidence, size)
+                            if best_rank is None or rank > best_rank:
+                                best_rank = rank
+                                best = Match(place.latitude, place.longitude, round(confidence, 3),
+                                             place.kind, place.name, phrase)
+        if best is None or best.confidence < min_confidence:
+            return None
+        return best
+
+    def _unique(self, key: str) -> Optional[Place]:
+        places = self._candidates.get(key)
+        return self._merge(places) if places else None
+
+    @staticmethod
+    def _merge(places: List[Place]) -> Optional[Place]:
+        first = places[0]
+        points = {(p.latitude, p.longitude) for p in places}
+        if len(points) == 1:
+            return first
+        if any(distance_km(a, b) > MAX_SPREAD_KM for a in points for b in points):
+            return None
+        latitude = sum(p[0] for p in points) / len(points)
+        longitude = sum(p[1] for p in points) / len(points)
+        return first._replace(latitude=round(latitude, 7), longitude=round(longitude, 7))
+
+
+def _coordinate(value) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+
+def fill_missing(rows: List[Dict], gazetteer: Optional[Gazetteer] = None, branch_col: str = "branch",
+                 address_col: str = "address", min_confidence: float = MIN_CONFIDENCE,
+                 data_dir: Path = DATA_DIR) -> int:
+    """إكمال latitude/longitude الفارغة في الصفوف (تُعدّل في مكانها) وإرجاع عدد ما أُكمل"""
+    if gazetteer is None:
+        gazetteer = Gazetteer.from_data_dir(data_dir, rows, branch_col=branch_col, address_col=address_col)
+    filled = 0
+    for row in rows:
+        if _coordinate(row.get("latitude")) is not None and _coordinate(row.get("longitude")) is not None:
+            # عند إعادة التشغيل تأتي الثقة نصاً من CSV
+            confidence = _coordinate(row.get("coordinate_confidence"))
+            row["coordinate_source"] = row.get("coordinate_source") or "link"
+            row["coordinate_confidence"] = 1.0 if confidence is None else confidence
+            continue
+        match = gazetteer.lookup(row.get(branch_col) or "", row.get(address_col) or "",
+                                 min_confidence=min_confidence)
+        if match is None:
+            row["coordinate_source"] = ""
+            row["coordinate_confidence"] = 0.0
+            continue
+        row["latitude"], row["longitude"] = match.latitude, match.longitude
+        row["coordinate_source"] = f"{match.source}:{match.place}"
+        row["coordinate_confidence"] = match.confidence
+        filled += 1
+    return filled
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline gazetteer fallback for branch coordinates")
+    parser.add_argument("--input", type=Path, default=DATA_DIR / "branch_locations_fixed.csv")
+    parser.add_argument("--output", type=Path, help="الافتراضي: الكتابة فوق ملف الإدخال")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    parser.add_argument("--branch-col", default="branch")
+    parser.add_argument("--address-col", default="address")
+    parser.add_argument("--min-confidence", type=float, default=MIN_CONFIDENCE)
+    args = parser.parse_args()
+
+    with open(args.input, "r", encoding="utf-8", errors="replace", newline="") as f:
+        reader = csv.DictReader(f)
+        fieldnames = list(reader.fieldnames or [])
+        rows = list(reader)
+
+    missing = sum(1 for r in rows if _coordinate(r.get("latitude")) is None)
+    filled = fill_missing(rows, branch_col=args.branch_col, address_col=args.address_col,
+                          min_confidence=args.min_confidence, data_dir=args.data_dir)
+
+    for column in ("latitude", "longitude", "coordinate_source", "coordinate_confidence"):
+        if column not in fieldnames:
+            fieldnames.append(column)
+    output = args.output or args.input
+    with open(output, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    for row in rows:
+        source = row["coordinate_source"]
+        if source and source != "link":
+            print(f"  📍 {row['coordinate_confidence']:.2f}  {row[args.branch_col]} ← {source}")
+    print(f"✅ أُكمل {filled} من {missing} صف بدون إحداثيات (بدون أي طلب شبكة)")
+    print(f"📄 {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,93 @@
-import pandas as pd
-import requests
+#!/usr/bin/env python3
+"""
+UberFix Branch Coordinates (gomap)
+استخراج إحداثيات الفروع من روابط Google Maps في branch_locations.csv
+
+مكتبة وأداة سطر أوامر معاً: الاستيراد لا يشغّل شيئاً ولا يحمّل requests أو numpy
+إلا عند أول استخدام فعلي، فيمكن استخدام parse_coordinates / extract_coordinates
+من أي أداة أخرى بدون تكلفة تشغيل.
+
+- الروابط التي تحمل الإحداثيات (@lat,lng أو q=lat,lng) تُحل بدون أي طلب شبكة
+- الروابط المختصرة (goo.gl) تُتبع بالتوازي مع إعادة استخدام الاتصالات
+- ما يفشل يرث إحداثيات الفرع المطابق من المخرجات السابقة (branch_matching.py)
+  ثم القاموس المحلي (gazetteer.py)
+
+الاستخدام:
+    python3 src/data/gomap.py
+    python3 src/data/gomap.py --input public/data/branch_locations.csv --output /tmp/branches.csv --link-col link
+    python3 src/data/gomap.py --no-network
+
+    from gomap import extract_coordinates_batch
+    coords = extract_coordinates_batch(urls)  # numpy (n, 2)، NaN لما فشل
+"""
+
 import re
+import csv
+import argparse
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from branch_matching import inherit_coordinates
+from gazetteer import DATA_DIR, MIN_CONFIDENCE, fill_missing
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+INPUT_FILE = "branch_locations.csv"
+OUTPUT_FILE = "branch_locations_fixed.csv"
+REQUEST_TIMEOUT = 10
+DEFAULT_WORKERS = 8
+
+# النمط الأكثر شيوعًا: @latitude,longitude,zoom
+_AT_COORDS_RE = re.compile(r"@([-+]?\d+\.\d+),([-+]?\d+\.\d+)")
+# نمط آخر قد يظهر في روابط البحث أو الروابط الأقدم: q=latitude,longitude
+_Q_COORDS_RE = re.compile(r"q=([-+]?\d+\.\d+),([-+]?\d+\.\d+)")
+
+Coordinates = Tuple[Optional[float], Optional[float]]
+
+_local = threading.local()
+
+
+def parse_coordinates(final_url: str) -> Coordinates:
+    """الإحداثيات من نص الرابط نفسه، أو (None, None)"""
+    for pattern in (_AT_COORDS_RE, _Q_COORDS_RE):
+        match = pattern.search(final_url)
+        if match:
+            return float(match.group(1)), float(match.group(2))
+    return None, None
+
+
+def _session():
+    """جلسة requests لكل thread (إعادة استخدام اتصالات goo.gl / google.com)"""
+    session = getattr(_local, "session", None)
+    if session is None:
+        import requests
+
+        session = _local.session = requests.Session()
+    return session
+
+
+def extract_coordinates(url: str, timeout: float = REQUEST_TIMEOUT) -> Coordinates:
+    """متابعة إعادة التوجيه ثم البحث عن الإحداثيات في الرابط النهائي"""
+    latitude, longitude = parse_coordinates(url)
+    if latitude is not None:
+        return latitude, longitude
+
+    import requests
 
-def extract_coordinates(url):
     try:
-        # 1. متابعة إعادة التوجيه للحصول على الرابط النهائي
         # Setting a timeout is good practice to prevent the script from hanging
-        response = requests.get(url, allow_redirects=True, timeout=10)
+        response = _session().get(url, allow_redirects=True, timeout=timeout)
         final_url = response.url
 
-        # 2. البحث عن الإحداثيات في الرابط النهائي
-        # النمط الأكثر شيوعًا: @latitude,longitude,zoom
-        match_at_coords = re.search(r"@([-+]?\d+\.\d+),([-+]?\d+\.\d+)", final_url)
-        if match_at_coords:
-            latitude = float(match_at_coords.group(1))
-            longitude = float(match_at_coords.group(2))
-            return latitude, longitude
-
-        # نمط آخر قد يظهر في روابط البحث أو الروابط الأقدم: q=latitude,longitude
-        match_q_coords = re.search(r"q=([-+]?\d+\.\d+),([-+]?\d+\.\d+)", final_url)
-        if match_q_coords:
-            latitude = float(match_q_coords.group(1))
-            longitude = float(match_q_coords.group(2))
-            return latitude, longitude
-
-        # إذا لم يتم العثور على أي نمط
-        print(f"Could not extract coordinates from final URL: {final_url}")
-        return None, None
+        latitude, longitude = parse_coordinates(final_url)
+        if latitude is None:
+            print(f"Could not extract coordinates from final URL: {final_url}")
+        return latitude, longitude
     except requests.exceptions.RequestException as e:
         print(f"Error accessing URL {url}: {e}")
         return None, None
@@ -34,29 +95,142 @@ def extract_coordinates(url):
         print(f"An unexpected error occurred for URL {url}: {e}")
         return None, None
 
-# تحميل ملف CSV
-# تأكد أن اسم الملف والمسار صحيحان
-df = pd.read_csv(r"E:\dev\UberFix.shop\public\data\branch_locations.csv", encoding="ISO-8859-1")
 
-latitudes = []
-longitudes = []
+def extract_coordinates_batch(urls: Sequence[str], workers: int = DEFAULT_WORKERS,
+                              timeout: float = REQUEST_TIMEOUT, network: bool = True) -> "np.ndarray":
+    """مصفوفة float64 بشكل (n, 2) من latitude/longitude، و NaN لما لم يُحل
+
+    كل رابط مكرر يُطلب مرة واحدة، والروابط التي تحمل الإحداثيات لا تُطلب أصلاً.
+    """
+    import numpy as np
+
+    coords = np.full((len(urls), 2), np.nan)
+    pending: Dict[str, List[int]] = {}
+    for i, url in enumerate(urls):
+        if not url or not isinstance(url, str):
+            continue
+        latitude, longitude = parse_coordinates(url)
+        if latitude is not None:
+            coords[i] = latitude, longitude
+        elif network:
+            pending.setdefault(url.strip(), []).append(i)
+
+    if pending:
+        # خطأ واحد واضح بدلاً من ImportError داخل كل thread
+        if importlib.util.find_spec("requests") is None:
+            raise ImportError("requests is required to follow short links (pip install requests, or use --no-network)")
+        unique = list(pending)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            resolved = pool.map(lambda url: extract_coordinates(url, timeout), unique)
+            for url, (latitude, longitude) in zip(unique, resolved):
+                if latitude is not None:
+                    coords[pending[url]] = latitude, longitude
+    return coords
+
+
+def read_rows(path: Path, encoding: str = "utf-8") -> Tuple[List[str], List[Dict]]:
+    with open(path, "r", encoding=encoding, errors="replace", newline="") as f:
+        reader = csv.DictReader(f)
+        return list(reader.fieldnames or []), list(reader)
+
+
+def write_rows(path: Path, fieldnames: List[str], rows: List[Dict]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
 
-# التكرار عبر الصفوف وتطبيق الدالة
-for index, row in df.iterrows():
-    # تأكد من أن اسم العمود الذي يحتوي على الروابط هو "link"
-    # وإلا قم بتعديله إلى الاسم الصحيح، مثلاً row["Google Maps Link"]
-    url = row["link"]
-    print(f"Processing URL: {url}")
-    lat, lng = extract_coordinates(url)
-    latitudes.append(lat)
-    longitudes.append(lng)
 
-# إضافة الأعمدة الجديدة إلى DataFrame
-df["latitude"] = latitudes
-df["longitude"] = longitudes
+def locate_branches(
+    input_path: Path,
+    output_path: Path,
+    link_col: str = "link",
+    branch_col: str = "branch",
+    address_col: str = "address",
+    encoding: str = "utf-8",
+    workers: int = DEFAULT_WORKERS,
+    timeout: float = REQUEST_TIMEOUT,
+    network: bool = True,
+    inherit: bool = True,
+    offline_fallback: bool = True,
+    min_confidence: float = MIN_CONFIDENCE,
+) -> Dict[str, int]:
+    """خط المعالجة الكامل من ملف الروابط إلى ملف الإحداثيات، ويعيد إحصاءات كل مرحلة"""
+    fieldnames, rows = read_rows(input_path, encoding)
+    if link_col not in fieldnames:
+        raise KeyError(f"column '{link_col}' not found in {input_path} ({', '.join(fieldnames)})")
+
+    coords = extract_coordinates_batch([row.get(link_col) or "" for row in rows], workers, timeout, network)
+    for row, (latitude, longitude) in zip(rows, coords.tolist()):
+        resolved = latitude == latitude  # NaN != NaN
+        row["latitude"] = latitude if resolved else None
+        row["longitude"] = longitude if resolved else None
+    stats = {"rows": len(rows), "from_links": int((coords[:, 0] == coords[:, 0]).sum()), "inherited": 0, "filled": 0}
+
+    # الروابط التي فشلت ترث إحداثيات الفرع المطابق من المخرجات السابقة (branch_matching.py)
+    if inherit and output_path.exists():
+        _, previous = read_rows(output_path)
+        stats["inherited"] = inherit_coordinates(rows, previous, name_col=branch_col, address_col=address_col)
+
+    # ثم القاموس المحلي (gazetteer.py) بدون طلبات شبكة إضافية
+    if offline_fallback:
+        stats["filled"] = fill_missing(rows, branch_col=branch_col, address_col=address_col,
+                                       min_confidence=min_confidence, data_dir=input_path.parent)
+
+    extra = ["latitude", "longitude"]
+    if inherit or offline_fallback:
+        extra += ["coordinate_source", "coordinate_confidence"]
+    write_rows(output_path, fieldnames + [c for c in extra if c not in fieldnames], rows)
+    return stats
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Extract branch coordinates from Google Maps links")
+    parser.add_argument("--input", type=Path, default=DATA_DIR / INPUT_FILE)
+    parser.add_argument("--output", type=Path, default=DATA_DIR / OUTPUT_FILE)
+    parser.add_argument("--link-col", default="link")
+    parser.add_argument("--branch-col", default="branch")
+    parser.add_argument("--address-col", default="address")
+    parser.add_argument("--encoding", default="utf-8", help="ترميز ملف الإدخال")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="طلبات متوازية لمتابعة الروابط المختصرة")
+    parser.add_argument("--timeout", type=float, default=REQUEST_TIMEOUT)
+    parser.add_argument("--no-network", action="store_true", help="الروابط التي تحمل الإحداثيات فقط + البدائل المحلية")
+    parser.add_argument("--no-inherit", action="store_true", help="عدم التوريث من المخرجات السابقة")
+    parser.add_argument("--no-gazetteer", action="store_true", help="عدم استخدام القاموس المحلي")
+    parser.add_argument("--min-confidence", type=float, default=MIN_CONFIDENCE)
+    args = parser.parse_args(argv)
+
+    if not args.input.exists():
+        parser.error(f"input file not found: {args.input}")
+    try:
+        stats = locate_branches(
+            args.input,
+            args.output,
+            link_col=args.link_col,
+            branch_col=args.branch_col,
+            address_col=args.address_col,
+            encoding=args.encoding,
+            workers=args.workers,
+            timeout=args.timeout,
+            network=not args.no_network,
+            inherit=not args.no_inherit,
+            offline_fallback=not args.no_gazetteer,
+            min_confidence=args.min_confidence,
+        )
+    except KeyError as e:
+        parser.error(str(e.args[0]))
+    except ImportError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+
+    print(f"Resolved {stats['from_links']} of {stats['rows']} rows from links")
+    if not args.no_inherit:
+        print(f"Inherited coordinates for {stats['inherited']} rows from matched branches")
+    if not args.no_gazetteer:
+        print(f"Offline gazetteer filled {stats['filled']} rows (see coordinate_confidence)")
+    print(f"Processing complete. Results saved to: {args.output}")
 
-# حفظ DataFrame المعدل إلى ملف CSV جديد
-output_filepath = r"E:\dev\UberFix.shop\public\data\branch_locations_fixed.csv"
-df.to_csv(output_filepath, index=False, encoding="utf-8")
-print(f"Processing complete. Results saved to: {output_filepath}")
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# الوحدات في src/data تستورد بعضها كملفات متجاورة (كما عند تشغيلها مباشرة)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
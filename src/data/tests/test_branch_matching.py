@@ -0,0 +1,50 @@
+import pytest
+
+from branch_matching import MIN_SCORE, BranchIndex, Record, inherit_coordinates, load_records, match_key
+
+
+@pytest.fixture(scope="module")
+def branches():
+    return BranchIndex(load_records("branches"))
+
+
+def _score(index, left, right):
+    return index.score(Record("left", "1", left, "", {}), Record("right", "1", right, "", {})).score
+
+
+def test_match_key_keeps_single_letters():
+    assert match_key("AirPort T3-G") != match_key("AirPort T3-F")
+    assert match_key("New Airport 3 - corridor G") == "new airport 3 corridor g"
+
+
+def test_inherit_prefers_exact_name():
+    reference = [
+        {"branch": "AirPort T3-F", "address": "New Airport 3 - corridor F", "latitude": "30.1103817", "longitude": "31.4008868"},
+        {"branch": "AirPort T3-G", "address": "New Airport 3 - corridor G", "latitude": "30.1098611", "longitude": "31.3899722"},
+    ]
+    rows = [{"branch": "AirPort T3-G", "address": "New Airport 3 - corridor G", "latitude": None, "longitude": None}]
+    assert inherit_coordinates(rows, reference) == 1
+    assert (rows[0]["latitude"], rows[0]["longitude"]) == ("30.1098611", "31.3899722")
+    assert rows[0]["coordinate_source"] == "match:AirPort T3-G"
+
+
+@pytest.mark.parametrize("left, right", [
+    ("كارفور-زيزينيا", "Carrefour - Al Zaytoun"),
+    ("مترو ماركت-الهرم", "Metro Market-Al Rehab"),
+    ("كارفور- داندي مول", "Carrefour-Al Hamad Mall"),
+])
+def test_different_places_rejected(branches, left, right):
+    assert _score(branches, left, right) < MIN_SCORE
+    match = branches.best(Record("stores", "1", left, "", {}))
+    assert match is None or match.right.name != right
+
+
+@pytest.mark.parametrize("left, right", [
+    ("أوسكار جراند ستورز -المعادي", "Oscar Grand Stores - Maadi"),
+    ("فتح الله ماركت - الرحاب", "Fathalla Market-Al Rehab"),
+    ("نجمة هليوبوليس - شيراتون", "Negmet Heliopolis - Shiraton"),
+    ("المعادي شارع اللاسلكي", "Maadi Laselki St."),
+])
+def test_same_place_across_scripts_kept(branches, left, right):
+    assert _score(branches, left, right) >= MIN_SCORE
+    assert branches.best(Record("stores", "1", left, "", {})).right.name == right
@@ -0,0 +1,101 @@
+import csv
+import sys
+
+import pytest
+
+import gazetteer
+from gazetteer import Gazetteer, fill_missing, normalize
+
+PLACES = [
+    "name,aliases,kind,latitude,longitude",
+    "Sadat Metro Station,Tahrir Square|ميدان التحرير,metro,30.0444,31.2357",
+    "Nasr City,مدينة نصر,district,30.0566,31.3301",
+    # نفس الاسم لمكانين يبعدان أكثر من MAX_SPREAD_KM
+    "Sheraton Heliopolis,Sheraton,district,30.1040,31.3720",
+    "Sheraton Maadi,Sheraton,landmark,29.9600,31.2500",
+]
+MALLS = [
+    "id,name,location,type",
+    '1001,حورس مول,"ش الثورة, مدينة نصر, القاهرة.",مول',
+]
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / gazetteer.PLACES_FILE).write_text("\n".join(PLACES) + "\n", encoding="utf-8")
+    (tmp_path / gazetteer.MALLS_FILE).write_text("\n".join(MALLS) + "\n", encoding="utf-8")
+    return tmp_path
+
+
+def _row(branch, address="", latitude="", longitude="", **extra):
+    return {"branch": branch, "address": address, "latitude": latitude, "longitude": longitude, **extra}
+
+
+def test_metro_and_mall_aliases_resolve(data_dir):
+    index = Gazetteer.from_data_dir(data_dir)
+    metro = index.lookup("Tahrir Square Kiosk")
+    assert (metro.source, metro.place) == ("metro", "Sadat Metro Station")
+    assert (metro.latitude, metro.longitude) == (30.0444, 31.2357)
+
+    mall = index.lookup("كشك - حورس مول")
+    assert (mall.source, mall.place) == ("mall_alias", "حورس مول")
+    assert (mall.latitude, mall.longitude) == (30.0566, 31.3301)
+
+
+def test_ambiguous_key_dropped(data_dir):
+    index = Gazetteer.from_data_dir(data_dir)
+    assert normalize("Sheraton") not in index.keys
+    assert index.lookup("Sheraton") is None
+    assert index.lookup("Sheraton Heliopolis").place == "Sheraton Heliopolis"
+
+
+def test_rows_below_min_confidence_left_empty(data_dir):
+    rows = [_row("حورس مول")]
+    assert fill_missing(rows, min_confidence=0.6, data_dir=data_dir) == 0
+    assert rows[0]["latitude"] == ""
+    assert (rows[0]["coordinate_source"], rows[0]["coordinate_confidence"]) == ("", 0.0)
+
+
+def test_approximated_rows_not_indexed_as_branches(data_dir):
+    rows = [
+        _row("Abbas Akkad", "Nasr City", "30.0566", "31.3301",
+             coordinate_source="district:Nasr City", coordinate_confidence="0.6"),
+        _row("Makram Ebeid", "Makram Ebeid", "30.0566", "31.3301",
+             coordinate_source="match:Abbas Akkad", coordinate_confidence="0.55"),
+        _row("Abbas Akkad 2"),
+        _row("Makram Ebeid Kiosk"),
+    ]
+    fill_missing(rows, data_dir=data_dir)
+    assert rows[0]["coordinate_confidence"] == 0.6
+    assert not rows[2]["coordinate_source"].startswith("branch")
+    assert rows[3]["coordinate_source"] == ""
+
+
+def _run(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["gazetteer.py", *argv])
+    gazetteer.main()
+
+
+def test_rerun_is_idempotent(data_dir, tmp_path, monkeypatch):
+    source = tmp_path / "branches.csv"
+    with open(source, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["branch", "address", "latitude", "longitude"])
+        writer.writeheader()
+        writer.writerows([
+            _row("Downtown", "Talaat Harb", "30.0480", "31.2400"),
+            _row("Tahrir Kiosk", "Tahrir Square"),
+            _row("Abbas Akkad", "Nasr City"),
+            _row("Abbas Akkad 2"),
+            _row("Unknown Booth"),
+        ])
+    first, second = tmp_path / "first.csv", tmp_path / "second.csv"
+    _run(monkeypatch, "--input", str(source), "--output", str(first), "--data-dir", str(data_dir))
+    _run(monkeypatch, "--input", str(first), "--output", str(second), "--data-dir", str(data_dir))
+    assert first.read_text(encoding="utf-8") == second.read_text(encoding="utf-8")
+
+    with open(second, encoding="utf-8") as f:
+        rows = {row["branch"]: row for row in csv.DictReader(f)}
+    assert rows["Tahrir Kiosk"]["coordinate_source"] == "metro:Sadat Metro Station"
+    assert rows["Abbas Akkad"]["coordinate_source"] == "district:Nasr City"
+    assert not rows["Abbas Akkad 2"]["coordinate_source"].startswith("branch")
+    assert rows["Unknown Booth"]["coordinate_source"] == ""